@@ -1,6 +1,8 @@
 # pylint: disable=missing-module-docstring
 
 from .core.client import EntityType, Pyneo4jClient
+from .core.codec import JSONCodecBackend
+from .core.hooks import non_blocking
 from .core.node import NodeModel
 from .core.relationship import RelationshipModel
 from .fields.property_options import WithOptions
@@ -9,4 +11,4 @@ from .fields.relationship_property import (
     RelationshipPropertyCardinality,
     RelationshipPropertyDirection,
 )
-from .queries.types import QueryOptionsOrder
+from .queries.types import AggregationFunction, QueryOptionsOrder
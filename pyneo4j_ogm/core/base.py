@@ -3,14 +3,13 @@ Base Node/Relationship class module.
 """
 
 import asyncio
-import json
 from asyncio import iscoroutinefunction
-from copy import deepcopy
 from functools import wraps
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Any,
+    AsyncGenerator,
     Callable,
     ClassVar,
     Dict,
@@ -20,6 +19,7 @@ from typing import (
     Optional,
     ParamSpec,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -29,12 +29,26 @@ from typing import (
 from neo4j.graph import Node, Relationship
 from pydantic import BaseModel, PrivateAttr
 
-from pyneo4j_ogm.exceptions import ListItemNotEncodable, UnregisteredModel
-from pyneo4j_ogm.fields.relationship_property import (
-    RelationshipProperty,
-    RelationshipPropertyCardinality,
-    RelationshipPropertyDirection,
+from pyneo4j_ogm.core.codec import DEFAULT_CODEC, JSONCodec
+from pyneo4j_ogm.core.hooks import (
+    CompiledHooks,
+    get_compiled_hooks,
+    run_background_hooks,
+    run_hooks,
 )
+from pyneo4j_ogm.core.serialization import (
+    PropertyEncoding,
+    build_hydration_validators,
+    build_property_encodings,
+)
+from pyneo4j_ogm.exceptions import (
+    ListItemNotEncodable,
+    UnindexedProperty,
+    UnknownProperty,
+    UnregisteredModel,
+    VersionConflict,
+)
+from pyneo4j_ogm.fields.relationship_property import RelationshipProperty
 from pyneo4j_ogm.fields.settings import (
     BaseModelSettings,
     NodeModelSettings,
@@ -43,12 +57,19 @@ from pyneo4j_ogm.fields.settings import (
 from pyneo4j_ogm.logger import logger
 from pyneo4j_ogm.pydantic_utils import (
     IS_PYDANTIC_V2,
+    construct_model,
     get_field_type,
     get_model_dump,
+    get_model_dump_jsonable,
     get_model_fields,
     parse_model,
 )
 from pyneo4j_ogm.queries.query_builder import QueryBuilder
+from pyneo4j_ogm.queries.types import (
+    AggregationFunction,
+    AggregationMetrics,
+    QueryOptionsOrder,
+)
 
 if TYPE_CHECKING:
     from pyneo4j_ogm.core.client import Pyneo4jClient
@@ -94,40 +115,22 @@ def hooks(func):
 
         @wraps(func)
         async def async_wrapper(self, *args, **kwargs):
-            settings: BaseModelSettings = getattr(self, "_settings")
+            compiled_hooks = get_compiled_hooks(self, func.__name__)
 
-            if func.__name__ in settings.pre_hooks:
-                logger.info(
-                    "Found %s pre-hook functions for method %s", len(settings.pre_hooks[func.__name__]), func.__name__
-                )
+            if compiled_hooks is None:
+                return await func(self, *args, **kwargs)
 
-                # Run each pre-hook function with the same arguments as the decorated method
-                for hook_function in settings.pre_hooks[func.__name__]:
-                    logger.debug("Running pre-hook function %s", hook_function.__name__)
+            concurrent = cast(BaseModelSettings, getattr(self, "_settings")).concurrent_hooks
 
-                    # Check if the hook function is asynchronous, if so await it to prevent unawaited coroutine warnings
-                    if iscoroutinefunction(hook_function):
-                        await hook_function(self, *args, **kwargs)
-                    else:
-                        hook_function(self, *args, **kwargs)
+            # Run each pre-hook function with the same arguments as the decorated method
+            await run_hooks(compiled_hooks.pre, concurrent, self, *args, **kwargs)
 
             result = await func(self, *args, **kwargs)
 
-            if func.__name__ in settings.post_hooks:
-                logger.info(
-                    "Found %s post-hook functions for method %s", len(settings.post_hooks[func.__name__]), func.__name__
-                )
-
-                # Run any post-hook functions with the same arguments as the decorated method and the result
-                # as the second argument
-                for hook_function in settings.post_hooks[func.__name__]:
-                    logger.debug("Running post-hook function %s", hook_function.__name__)
-
-                    # Check again if the hook function is asynchronous and await it if necessary
-                    if iscoroutinefunction(hook_function):
-                        await hook_function(self, result, *args, **kwargs)
-                    else:
-                        hook_function(self, result, *args, **kwargs)
+            # Run any post-hook functions with the same arguments as the decorated method and the result
+            # as the second argument, non-blocking post-hooks are run in the background
+            await run_hooks(compiled_hooks.post, concurrent, self, result, *args, **kwargs)
+            run_background_hooks(compiled_hooks.background, self, result, *args, **kwargs)
 
             return result
 
@@ -137,37 +140,27 @@ def hooks(func):
 
         @wraps(func)
         def sync_wrapper(self, *args, **kwargs):
-            settings: BaseModelSettings = getattr(self, "_settings")
+            compiled_hooks = get_compiled_hooks(self, func.__name__)
 
-            if func.__name__ in settings.pre_hooks:
-                # Run each pre-hook function with the same arguments as the decorated method
-                logger.debug(
-                    "Found %s pre-hook functions for method %s", len(settings.pre_hooks[func.__name__]), func.__name__
-                )
+            if compiled_hooks is None:
+                return func(self, *args, **kwargs)
 
-                # Check if the hook function is asynchronous, if so create a new task to run it
-                for hook_function in settings.pre_hooks[func.__name__]:
-                    logger.debug("Running pre-hook function %s", hook_function.__name__)
-                    if iscoroutinefunction(hook_function):
-                        asyncio.create_task(hook_function(self, *args, **kwargs))
-                    else:
-                        hook_function(self, *args, **kwargs)
+            # Asynchronous hook functions can not be awaited here, so they are run in the background
+            for hook_function, is_async in compiled_hooks.pre:
+                if is_async:
+                    run_background_hooks((hook_function,), self, *args, **kwargs)
+                else:
+                    hook_function(self, *args, **kwargs)
 
             result = func(self, *args, **kwargs)
 
-            if func.__name__ in settings.post_hooks:
-                # Run any post-hook functions with the same arguments as the decorated method and the result
-                logger.debug(
-                    "Found %s post-hook functions for method %s", len(settings.post_hooks[func.__name__]), func.__name__
-                )
+            for hook_function, is_async in compiled_hooks.post:
+                if is_async:
+                    run_background_hooks((hook_function,), self, result, *args, **kwargs)
+                else:
+                    hook_function(self, result, *args, **kwargs)
 
-                # Check again if the hook function is asynchronous and create a new task to run it if necessary
-                for hook_function in settings.post_hooks[func.__name__]:
-                    logger.debug("Running post-hook function %s", hook_function.__name__)
-                    if iscoroutinefunction(hook_function):
-                        asyncio.create_task(hook_function(self, result, *args, **kwargs))
-                    else:
-                        hook_function(self, result, *args, **kwargs)
+            run_background_hooks(compiled_hooks.background, self, result, *args, **kwargs)
 
             return result
 
@@ -185,18 +178,25 @@ if IS_PYDANTIC_V2:
         def generate(self, *args, **kwargs):
             model_cls: Optional[Type[BaseModel]] = None
 
+            def get_model_cls(schema: Any) -> Optional[Type[BaseModel]]:
+                # Model validators wrap the schema of the model in function schemas
+                while "cls" not in schema and str(schema.get("type", "")).startswith("function-"):
+                    schema = schema["schema"]
+
+                return cast(Type[BaseModel], schema["cls"]) if "cls" in schema else None
+
             if "definitions" in args[0]:
                 # If a `definitions` key is present, the JSON schema contains multiple schemas for multiple models
                 # We need to get the schema ref for the model we want to add the additional information to
                 schema_ref = args[0]["schema"]["schema_ref"]
 
                 for definition in args[0]["definitions"]:
-                    if definition["ref"] == schema_ref and "cls" in definition:
-                        model_cls = cast(Type[BaseModel], definition["cls"])
+                    if definition["ref"] == schema_ref and get_model_cls(definition) is not None:
+                        model_cls = get_model_cls(definition)
                         break
-            elif "cls" in args[0]:
-                # If a `cls` key is present, the JSON schema only contains our current model
-                model_cls = cast(Type[BaseModel], args[0]["cls"])
+            else:
+                # Otherwise the JSON schema only contains our current model
+                model_cls = get_model_cls(args[0])
 
             if model_cls is None:
                 raise PydanticSchemaGenerationError("Could not find model class in definitions")
@@ -243,7 +243,17 @@ class ModelBase(BaseModel, Generic[V]):
     _settings: Union[NodeModelSettings, RelationshipModelSettings] = PrivateAttr()
     _client: Pyneo4jClient = PrivateAttr()
     _query_builder: QueryBuilder = PrivateAttr()
-    _db_properties: Dict[str, Any] = PrivateAttr(default={})
+    _property_encodings: Dict[str, PropertyEncoding] = PrivateAttr()
+    _hydration_validators: Optional[Dict[str, Optional[Callable[[Any], Any]]]] = PrivateAttr()
+    _compiled_hooks: Dict[str, CompiledHooks] = PrivateAttr()
+    _modified_properties: Set[str] = PrivateAttr(default_factory=set)
+    _lazy_fields: Set[str] = PrivateAttr()
+    _lazy_properties: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    if not IS_PYDANTIC_V2:
+        # Relationship-properties only hold a weak reference to their source node, which Pydantic V1 models do
+        # not support by default
+        __slots__: ClassVar[Tuple[str, ...]] = ("__weakref__",)
+
     _destroyed: bool = PrivateAttr(default=False)
     _element_id: Optional[str] = PrivateAttr(default=None)
     _id: Optional[int] = PrivateAttr(default=None)
@@ -260,6 +270,7 @@ class ModelBase(BaseModel, Generic[V]):
             if isinstance(self, RelationshipProperty):
                 return self.nodes
 
+            self._load_lazy_properties()
             serialized = serializer(self)
 
             # If the field is not excluded and not `None`, add it to the serialized dictionary
@@ -305,6 +316,15 @@ class ModelBase(BaseModel, Generic[V]):
                     # the serialized dictionary as well
                     if field_name in serialized:
                         serialized[field_name] = cast(RelationshipProperty, getattr(self, field_name)).nodes
+                    elif (
+                        field_name not in self.__dict__
+                        and not (info.include is not None and field_name not in info.include)
+                        and not (info.exclude is not None and field_name in info.exclude)
+                        and not info.exclude_unset
+                        and not info.exclude_defaults
+                    ):
+                        # Relationship properties which have not been accessed yet have no fetched nodes
+                        serialized[field_name] = []
 
             return serialized
 
@@ -313,51 +333,19 @@ class ModelBase(BaseModel, Generic[V]):
             """
             Custom validation for validating the fetched nodes from a relationship property.
             """
-            relationship_properties = getattr(cls, "_relationship_properties", set())
-
-            for field_name, field in get_model_fields(cls).items():
-                # Go over each relationship property field and try to build the relationship property for that
-                # field.
-                if (
-                    field_name in relationship_properties
-                    and field_name in values
-                    and isinstance(values[field_name], list)
-                ):
-                    field_default = cast(RelationshipProperty, field.default)
-                    instance_copy = RelationshipProperty(
-                        target_model=getattr(field_default, "_target_model_name"),
-                        relationship_model=getattr(field_default, "_relationship_model_name"),
-                        direction=cast(RelationshipPropertyDirection, getattr(field_default, "_direction")),
-                        cardinality=cast(RelationshipPropertyCardinality, getattr(field_default, "_cardinality")),
-                        allow_multiple=cast(bool, getattr(field_default, "_allow_multiple")),
-                    )
-
-                    instance_copy._build_property(cls, field_name)
-                    target_model = getattr(instance_copy, "_target_model", None)
-
-                    if target_model is not None:
-                        nodes: List[NodeModel] = []
+            return cls._parse_relationship_property_values(values)
 
-                        # Check if the nodes are of the correct model type and if they are alive
-                        # If so add them to the parsed instance
-                        for node in values[field_name]:
-                            if isinstance(node, target_model):
-                                nodes.append(node)
-                                continue
-
-                            instance = target_model(**node)
-                            if "element_id" in node:
-                                setattr(instance, "_element_id", node["element_id"])
-                            if "id" in node:
-                                setattr(instance, "_id", node["id"])
-
-                            nodes.append(instance)
-
-                        setattr(instance_copy, "_nodes", nodes)
+        @model_validator(mode="wrap")  # type: ignore
+        def _lazy_properties_validator(cls, values: Any, handler: Callable[[Any], Any]) -> Any:
+            """
+            Decodes all lazy properties of instances before they are revalidated. Instances are revalidated from their
+            fields, so lazy properties which have not been accessed yet would be replaced by their default values.
+            Before-validators only receive the fields of the instance, which is why a wrap-validator is used.
+            """
+            if isinstance(values, ModelBase):
+                values._load_lazy_properties()
 
-                    values[field_name] = instance_copy
-
-            return values
+            return handler(values)
 
         @classmethod
         def model_json_schema(cls, *args, **kwargs) -> Dict[str, Any]:
@@ -368,51 +356,7 @@ class ModelBase(BaseModel, Generic[V]):
 
         @root_validator(pre=True)
         def _parse_dict_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-            relationship_properties = getattr(cls, "_relationship_properties", set())
-
-            for field_name, field in get_model_fields(cls).items():
-                # Go over each relationship property field and try to build the relationship property for that
-                # field.
-                if (
-                    field_name in relationship_properties
-                    and field_name in values
-                    and isinstance(values[field_name], list)
-                ):
-                    field_default = cast(RelationshipProperty, field.default)
-                    instance_copy = RelationshipProperty(
-                        target_model=getattr(field_default, "_target_model_name"),
-                        relationship_model=getattr(field_default, "_relationship_model_name"),
-                        direction=cast(RelationshipPropertyDirection, getattr(field_default, "_direction")),
-                        cardinality=cast(RelationshipPropertyCardinality, getattr(field_default, "_cardinality")),
-                        allow_multiple=cast(bool, getattr(field_default, "_allow_multiple")),
-                    )
-
-                    instance_copy._build_property(cls, field_name)
-                    target_model = getattr(instance_copy, "_target_model", None)
-
-                    if target_model is not None:
-                        nodes: List[NodeModel] = []
-
-                        # Check if the nodes are of the correct model type and if they are alive
-                        # If so add them to the parsed instance
-                        for node in values[field_name]:
-                            if isinstance(node, target_model):
-                                nodes.append(node)
-                                continue
-
-                            instance = target_model(**node)
-                            if "element_id" in node:
-                                setattr(instance, "_element_id", node["element_id"])
-                            if "id" in node:
-                                setattr(instance, "_id", node["id"])
-
-                            nodes.append(instance)
-
-                        setattr(instance_copy, "_nodes", nodes)
-
-                    values[field_name] = instance_copy
-
-            return values
+            return cls._parse_relationship_property_values(values)
 
         def dict(  # type: ignore
             self,
@@ -425,6 +369,34 @@ class ModelBase(BaseModel, Generic[V]):
             exclude_defaults: bool = False,
             exclude_none: bool = False,
         ) -> DictStrAny:
+            return self._serialize(
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                skip_defaults=skip_defaults,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+
+        def _serialize(
+            self,
+            *,
+            include: Optional[Union[AbstractSetIntStr, MappingIntStrAny]] = None,
+            exclude: Optional[Union[AbstractSetIntStr, MappingIntStrAny]] = None,
+            by_alias: bool = False,
+            skip_defaults: Optional[bool] = None,
+            exclude_unset: bool = False,
+            exclude_defaults: bool = False,
+            exclude_none: bool = False,
+            models_as_dict: bool = True,
+        ) -> DictStrAny:
+            """
+            Serializes the model to a dictionary, including the relationship properties and the ID fields. If
+            `models_as_dict` is `False`, nested models are not converted to dictionaries, which leaves them to the
+            JSON encoder of the model.
+            """
+            self._load_lazy_properties()
             excluded_fields = set()
             excluded_fields.update(exclude or set())
 
@@ -433,16 +405,29 @@ class ModelBase(BaseModel, Generic[V]):
             if hasattr(self, "_relationship_properties"):
                 excluded_fields.update(cast(Set[str], getattr(self, "_relationship_properties")))
 
-            # pylint: disable=unexpected-keyword-arg
-            base_dict = super().dict(
-                include=include,
-                exclude=excluded_fields,
-                by_alias=by_alias,
-                skip_defaults=skip_defaults,  # type: ignore
-                exclude_unset=exclude_unset,
-                exclude_defaults=exclude_defaults,
-                exclude_none=exclude_none,
-            )
+            if models_as_dict:
+                # pylint: disable=unexpected-keyword-arg
+                base_dict = super().dict(
+                    include=include,
+                    exclude=excluded_fields,
+                    by_alias=by_alias,
+                    skip_defaults=skip_defaults,  # type: ignore
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                )
+            else:
+                base_dict = dict(
+                    self._iter(
+                        to_dict=False,
+                        by_alias=by_alias,
+                        include=include,  # type: ignore
+                        exclude=excluded_fields,  # type: ignore
+                        exclude_unset=exclude_unset if skip_defaults is None else skip_defaults,
+                        exclude_defaults=exclude_defaults,
+                        exclude_none=exclude_none,
+                    )
+                )
 
             # Add all `element_id` and `id` fields it they have not specifically been excluded
             if not (self._id is None and exclude_none) and not (exclude is not None and "id" in exclude):
@@ -484,12 +469,18 @@ class ModelBase(BaseModel, Generic[V]):
                 for field_name in getattr(self, "_relationship_properties"):
                     # Each relationship property gets the fetched nodes when serializing it rather than it's indexes
                     # or constraints
-                    field = cast(Union[RelationshipProperty, List], getattr(self, field_name))
+                    # Relationship properties which have not been accessed yet have no fetched nodes
+                    field = cast(Union[RelationshipProperty, List], self.__dict__.get(field_name, []))
+
+                    if exclude is not None and field_name in exclude:
+                        continue
 
-                    if not isinstance(field, list) and not (exclude is not None and field_name in exclude):
+                    if isinstance(field, RelationshipProperty):
                         base_dict[field_name] = [
                             cast(Union[RelationshipModel, NodeModel], node).dict() for node in field.nodes
                         ]
+                    elif field_name not in self.__dict__:
+                        base_dict[field_name] = []
 
             return base_dict
 
@@ -507,78 +498,22 @@ class ModelBase(BaseModel, Generic[V]):
             models_as_dict: bool = True,
             **dumps_kwargs: Any,
         ) -> str:
-            excluded_fields = set()
-            excluded_fields.update(exclude or set())
-
-            if hasattr(self, "_relationship_properties"):
-                excluded_fields.update(cast(Set[str], getattr(self, "_relationship_properties")))
-
-            base_json = super().json(
-                include=include,  # type: ignore
-                exclude=excluded_fields,  # type: ignore
+            # The serialized dictionary already contains the relationship properties and the ID fields of the model
+            # and all fetched nodes, so the whole model is encoded in a single pass
+            serialized = self._serialize(
+                include=include,
+                exclude=exclude,
                 by_alias=by_alias,
                 skip_defaults=skip_defaults,
                 exclude_unset=exclude_unset,
                 exclude_defaults=exclude_defaults,
                 exclude_none=exclude_none,
-                encoder=encoder,
                 models_as_dict=models_as_dict,
-                **dumps_kwargs,
             )
 
-            modified_json = json.loads(base_json)
-
-            # Add all relationship properties to the list of excluded fields since we will handle them
-            # later on ourself
-            if not (self._id is None and exclude_none) and not (exclude is not None and "id" in exclude):
-                modified_json["id"] = self._id
-
-            if not (self._element_id is None and exclude_none) and not (
-                exclude is not None and "element_id" in exclude
-            ):
-                modified_json["element_id"] = self._element_id
-            if (
-                hasattr(self, "_start_node_element_id")
-                and not (cast(RelationshipModel, self).start_node_element_id is None and exclude_none)
-                and not (exclude is not None and "start_node_element_id" in exclude)
-            ):
-                modified_json["start_node_element_id"] = cast(RelationshipModel, self)._start_node_element_id
-
-            if (
-                hasattr(self, "_start_node_id")
-                and not (cast(RelationshipModel, self).start_node_id is None and exclude_none)
-                and not (exclude is not None and "start_node_id" in exclude)
-            ):
-                modified_json["start_node_id"] = cast(RelationshipModel, self)._start_node_id
-
-            if (
-                hasattr(self, "_end_node_element_id")
-                and not (cast(RelationshipModel, self).end_node_element_id is None and exclude_none)
-                and not (exclude is not None and "end_node_element_id" in exclude)
-            ):
-                modified_json["end_node_element_id"] = cast(RelationshipModel, self)._end_node_element_id
-
-            if (
-                hasattr(self, "_end_node_id")
-                and not (cast(RelationshipModel, self).end_node_id is None and exclude_none)
-                and not (exclude is not None and "end_node_id" in exclude)
-            ):
-                modified_json["end_node_id"] = cast(RelationshipModel, self)._end_node_id
-
-            if hasattr(self, "_relationship_properties"):
-                for field_name in getattr(self, "_relationship_properties"):
-                    # Each relationship property gets the fetched nodes when serializing it rather than it's indexes
-                    # or constraints
-                    field = cast(Union[RelationshipProperty, List], getattr(self, field_name))
-
-                    if not isinstance(field, list) and not (exclude is not None and field_name in exclude):
-                        # Serialize and then deserialize each model to prevent double serialization when doing the whole
-                        # model at the end
-                        modified_json[field_name] = [
-                            json.loads(cast(Union[RelationshipModel, NodeModel], node).json()) for node in field.nodes
-                        ]
-
-            return json.dumps(modified_json)
+            return self._get_codec().dumps(
+                serialized, default=encoder or getattr(self, "__json_encoder__"), **dumps_kwargs
+            )
 
     def __init__(self, *args, **kwargs) -> None:
         # Check if the models has been registered with a client
@@ -589,6 +524,8 @@ class ModelBase(BaseModel, Generic[V]):
 
     def __init_subclass__(cls, *args, **kwargs) -> None:
         setattr(cls, "_query_builder", QueryBuilder())
+        setattr(cls, "_hydration_validators", None)
+        setattr(cls, "_compiled_hooks", {})
 
         logger.debug("Merging settings for model %s", cls.__name__)
         if hasattr(cls, "Settings") and hasattr(cls, "_settings") and issubclass(cls._settings.__class__, BaseModel):
@@ -622,6 +559,46 @@ class ModelBase(BaseModel, Generic[V]):
 
         super().__init_subclass__(*args, **kwargs)
 
+        if not IS_PYDANTIC_V2:
+            setattr(cls, "_property_encodings", build_property_encodings(cls))
+            setattr(cls, "_lazy_fields", cls._build_lazy_fields())
+            cls._check_version_field()
+
+    if IS_PYDANTIC_V2:
+        # The fields of the model are not available in `__init_subclass__` in Pydantic 2.x.x, so the property
+        # encodings are built once the model has been fully initialized
+        @classmethod
+        def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+            super().__pydantic_init_subclass__(**kwargs)
+
+            setattr(cls, "_property_encodings", build_property_encodings(cls))
+            setattr(cls, "_lazy_fields", cls._build_lazy_fields())
+            cls._check_version_field()
+
+    def __getattr__(self, name: str) -> Any:
+        # Lazy properties are only decoded and validated once they are accessed for the first time
+        if not name.startswith("_"):
+            lazy_properties = self._lazy_properties
+
+            if lazy_properties is not None and name in lazy_properties:
+                return self._load_lazy_property(name)
+
+        if IS_PYDANTIC_V2:
+            return super().__getattr__(name)  # type: ignore
+
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        # Assigning a value to a property marks it as modified, regardless of whether the value has changed
+        if (
+            not name.startswith("_")
+            and name in getattr(self, "_property_encodings", {})
+            and name not in getattr(self, "_relationship_properties", set())
+        ):
+            self._modified_properties.add(name)
+
     def __eq__(self, other: Any) -> bool:
         instance_type = type(self)
         if not isinstance(other, instance_type):
@@ -639,6 +616,8 @@ class ModelBase(BaseModel, Generic[V]):
         return self.__repr__()
 
     def __iter__(self):
+        self._load_lazy_properties()
+
         for attr_name, attr_value in super().__iter__():
             yield attr_name, attr_value
 
@@ -676,6 +655,8 @@ class ModelBase(BaseModel, Generic[V]):
         if hook_name not in cls._settings.pre_hooks:
             cls._settings.pre_hooks[hook_name] = []
 
+        cls._compiled_hooks.pop(hook_name, None)
+
         if overwrite:
             # If `overwrite` is set to `True`, we overwrite all existing hook functions for the given hook
             logger.debug("Overwriting %s existing pre-hook functions", len(cls._settings.pre_hooks[hook_name]))
@@ -716,6 +697,8 @@ class ModelBase(BaseModel, Generic[V]):
         if hook_name not in cls._settings.post_hooks:
             cls._settings.post_hooks[hook_name] = []
 
+        cls._compiled_hooks.pop(hook_name, None)
+
         if overwrite:
             # If `overwrite` is set to `True`, we overwrite all existing hook functions for the given hook
             logger.debug("Overwriting %s existing post-hook functions", len(cls._settings.post_hooks[hook_name]))
@@ -777,6 +760,287 @@ class ModelBase(BaseModel, Generic[V]):
 
         return current_settings
 
+    @classmethod
+    async def _iter_keyset_pages(
+        cls: Type[T],
+        match_query: str,
+        where_query: str,
+        parameters: Dict[str, Any],
+        batch_size: int,
+        order_by: str,
+        order: QueryOptionsOrder,
+        ref: str,
+    ) -> AsyncGenerator[T, None]:
+        """
+        Iterates over all matched graph entities using keyset pagination. Each page continues after the sort key of
+        the last entity of the previous page instead of using a growing `SKIP` value, which keeps the cost of each
+        page constant. The sort key has to be backed by a range index or uniqueness constraint, so each page can be
+        found with a range seek on the index. Ties on the sort key are broken by the element ID of the entity, which
+        is only checked as a residual filter. Because of this, the sort key should be unique or near-unique.
+
+        While the caller processes the current page, the next page is already fetched in a separate session. If a
+        batch transaction is in progress, pages are fetched inside the batch transaction one after another instead.
+
+        Args:
+            match_query (str): The `MATCH` pattern for the entities.
+            where_query (str): The `WHERE` conditions built from the filters. Can be an empty string.
+            parameters (Dict[str, Any]): The parameters used in `where_query`.
+            batch_size (int): The number of entities fetched per page.
+            order_by (str): The property to sort by.
+            order (QueryOptionsOrder): The sort direction.
+            ref (str): The reference to the entity in `match_query`.
+
+        Raises:
+            ValueError: If `batch_size` is not a positive integer.
+            UnknownProperty: If the model does not define the `order_by` property.
+            UnindexedProperty: If the `order_by` property is not backed by a range index or uniqueness constraint.
+
+        Yields:
+            T: The inflated model instances.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        field = get_model_fields(cls).get(order_by, None)
+        if field is None:
+            raise UnknownProperty(model=cls.__name__, property_name=order_by)
+        if not any(getattr(get_field_type(field), option, False) for option in ["_range_index", "_unique"]):
+            raise UnindexedProperty(model=cls.__name__, property_name=order_by)
+
+        # The query builder is shared between all queries of the model, so we keep a copy of the parameters
+        # since other queries might run while the caller processes the current page
+        parameters = {**parameters}
+        comparison = ">=" if order == QueryOptionsOrder.ASCENDING else "<="
+        tie_comparison = "<=" if order == QueryOptionsOrder.ASCENDING else ">="
+        element_id_query = f"elementId({ref})"
+        sort_key_query = cls._build_property_query(property_name=order_by, ref=ref)
+
+        # The range predicate on the sort key can be answered by the index, entities with the same sort key as the
+        # last entity of the previous page which have already been returned are removed afterwards
+        keyset_query = (
+            f"{sort_key_query} {comparison} $_keyset_last_key AND NOT ({sort_key_query} = $_keyset_last_key AND "
+            f"{element_id_query} {tie_comparison} $_keyset_last_element_id)"
+        )
+        order_query = f"ORDER BY {sort_key_query} {order.value}, {element_id_query} {order.value}"
+
+        # Entities without the sort key can not be placed in the keyset and are therefore skipped
+        where_queries = [where_query] if where_query != "" else []
+        where_queries.append(f"{sort_key_query} IS NOT NULL")
+
+        def build_query(is_first_page: bool) -> str:
+            page_where_queries = where_queries if is_first_page else [*where_queries, keyset_query]
+
+            return f"""
+                MATCH {match_query}
+                {f"WHERE {' AND '.join(page_where_queries)}" if len(page_where_queries) != 0 else ""}
+                WITH DISTINCT {ref}
+                RETURN {ref}, {sort_key_query}
+                {order_query}
+                LIMIT $_keyset_limit
+            """
+
+        first_page_query = build_query(is_first_page=True)
+        next_page_query = build_query(is_first_page=False)
+        prefetch = not getattr(cls._client, "_batch_enabled", False)
+
+        async def fetch_page(last_row: Optional[List[Any]]) -> List[List[Any]]:
+            page_parameters = {**parameters, "_keyset_limit": batch_size}
+
+            if last_row is not None:
+                page_parameters["_keyset_last_key"] = last_row[1]
+                page_parameters["_keyset_last_element_id"] = getattr(last_row[0], "element_id")
+
+            logger.debug("Fetching next page of %s entities for model %s", batch_size, cls.__name__)
+            if prefetch:
+                results, _ = await cls._client._cypher_in_session(
+                    query=first_page_query if last_row is None else next_page_query, parameters=page_parameters
+                )
+            else:
+                results, _ = await cls._client.cypher(
+                    query=first_page_query if last_row is None else next_page_query, parameters=page_parameters
+                )
+
+            return [result_list for result_list in results if len(result_list) != 0 and result_list[0] is not None]
+
+        next_page: Optional[asyncio.Future] = None
+
+        try:
+            results = await fetch_page(None)
+
+            while True:
+                has_next_page = len(results) == batch_size
+
+                if has_next_page and prefetch:
+                    next_page = asyncio.ensure_future(fetch_page(results[-1]))
+
+                for result_list in results:
+                    if isinstance(result_list[0], (Node, Relationship)):
+                        yield cast(T, cls._inflate(graph_entity=result_list[0]))
+                    else:
+                        yield result_list[0]
+
+                if not has_next_page:
+                    break
+
+                if next_page is not None:
+                    results = await next_page
+                    next_page = None
+                else:
+                    results = await fetch_page(results[-1])
+        finally:
+            # If the caller stops iterating early, there is no need for the prefetched page anymore
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    @classmethod
+    async def _find_by_element_ids(
+        cls: Type[T], element_ids: List[str], match_query: str, ref: str
+    ) -> List[Optional[T]]:
+        """
+        Gets the entities with the given element IDs using a single `UNWIND` query. Entities which are available in
+        the entity cache of the client are not queried again.
+
+        Args:
+            element_ids (List[str]): The element IDs of the entities.
+            match_query (str): The `MATCH` pattern for the entities.
+            ref (str): The reference to the entity in `match_query`.
+
+        Returns:
+            List[Optional[T]]: The inflated model instances in the order of `element_ids`. Element IDs which do not
+                match a entity of the model are returned as `None`.
+        """
+        found: Dict[str, T] = {}
+        missing: List[str] = []
+
+        for element_id in dict.fromkeys(element_ids):
+            # Lookups by element id can be served from the entity cache, if it is enabled
+            cached_instance = cls._client._get_cached_entity(element_id)
+
+            if isinstance(cached_instance, cls):
+                found[element_id] = cached_instance
+            else:
+                missing.append(element_id)
+
+        if len(missing) != 0:
+            logger.debug("Querying %s entities of model %s by element id", len(missing), cls.__name__)
+            results, _ = await cls._client.cypher(
+                query=f"""
+                    UNWIND $_element_ids AS element_id
+                    MATCH {match_query}
+                    WHERE elementId({ref}) = element_id
+                    RETURN element_id, {ref}
+                """,
+                parameters={"_element_ids": missing},
+                resolve_models=False,
+            )
+
+            for result_list in results:
+                if len(result_list) < 2 or not isinstance(result_list[1], (Node, Relationship)):
+                    continue
+
+                cls._client._cache_entity(result_list[1])
+                found[result_list[0]] = cast(T, cls._inflate(graph_entity=result_list[1]))
+
+        return [found.get(element_id, None) for element_id in element_ids]
+
+    @staticmethod
+    def _escape_identifier(name: str) -> str:
+        """
+        Escapes a name so it can be safely used as a identifier in a query.
+
+        Args:
+            name (str): The name to escape.
+
+        Returns:
+            str: The escaped identifier.
+        """
+        return f"`{name.replace('`', '``')}`"
+
+    @classmethod
+    def _build_property_query(cls, property_name: str, ref: str) -> str:
+        """
+        Builds a reference to a property of the model which can be used in a query.
+
+        Args:
+            property_name (str): The name of the property.
+            ref (str): The reference to the entity in the query.
+
+        Raises:
+            ValueError: If the property is not defined on the model.
+
+        Returns:
+            str: The property reference.
+        """
+        model_properties = set(get_model_fields(cls).keys()) - set(getattr(cls, "_relationship_properties", set()))
+
+        if property_name not in model_properties:
+            raise ValueError(f"Model {cls.__name__} has no property named {property_name}")
+
+        return f"{ref}.{cls._escape_identifier(property_name)}"
+
+    @classmethod
+    def _build_aggregation_query(
+        cls, group_by: Optional[List[str]], metrics: Optional[AggregationMetrics], ref: str
+    ) -> Tuple[str, List[str]]:
+        """
+        Builds the `RETURN` clause for a aggregation query. Entities are implicitly grouped by the properties in
+        `group_by`, as is the default for Cypher aggregations.
+
+        Args:
+            group_by (Optional[List[str]]): The model properties to group the entities by.
+            metrics (Optional[AggregationMetrics]): The metrics to compute for each group. The key defines the name
+                of the metric and the value is a tuple of the aggregation function and the property to aggregate.
+                The property can only be `None` for the `count` function, in which case the entities are counted.
+            ref (str): The reference to the entity in the query.
+
+        Raises:
+            ValueError: If no property to group by and no metric is provided, if a property is not defined on the
+                model or if a metric uses a unknown aggregation function.
+
+        Returns:
+            Tuple[str, List[str]]: The `RETURN` clause and the keys of the returned rows.
+        """
+        group_by = group_by or []
+        metrics = metrics or {}
+
+        if len(group_by) == 0 and len(metrics) == 0:
+            raise ValueError("At least one property to group by or one metric must be provided")
+
+        return_queries: List[str] = []
+        keys: List[str] = []
+
+        for property_name in group_by:
+            return_queries.append(
+                f"{cls._build_property_query(property_name, ref)} AS {cls._escape_identifier(property_name)}"
+            )
+            keys.append(property_name)
+
+        for metric_name, (function, property_name) in metrics.items():
+            try:
+                function = AggregationFunction(function)
+            except ValueError as exc:
+                raise ValueError(f"Unknown aggregation function {function} for metric {metric_name}") from exc
+
+            if property_name is None and function != AggregationFunction.COUNT:
+                raise ValueError(f"Aggregation function {function.value} for metric {metric_name} needs a property")
+
+            argument_query = ref if property_name is None else cls._build_property_query(property_name, ref)
+            return_queries.append(f"{function.value}({argument_query}) AS {cls._escape_identifier(metric_name)}")
+            keys.append(metric_name)
+
+        return f"RETURN {', '.join(return_queries)}", keys
+
+    @classmethod
+    def _get_codec(cls) -> JSONCodec:
+        """
+        Returns the JSON codec of the client the model is registered with. Falls back to the `json` module of the
+        standard library if the model has not been registered yet.
+
+        Returns:
+            JSONCodec: The JSON codec.
+        """
+        return getattr(getattr(cls, "_client", None), "codec", DEFAULT_CODEC)
+
     def _deflate(self, deflated: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deflates the current model instance into a python dictionary which can be stored in Neo4j.
@@ -788,23 +1052,260 @@ class ModelBase(BaseModel, Generic[V]):
             Dict[str, Any]: The model model.
         """
         logger.debug("Deflating model %s to storable dictionary", self)
+        property_encodings = getattr(self, "_property_encodings", {})
+        codec = self._get_codec()
+
+        for field_name, field in deflated.items():
+            # Properties which are known to only hold primitive values can be stored as they are
+            if property_encodings.get(field_name, PropertyEncoding.DYNAMIC) in (
+                PropertyEncoding.PRIMITIVE,
+                PropertyEncoding.PRIMITIVE_LIST,
+            ):
+                continue
 
-        for field_name, field in deepcopy(deflated).items():
             if isinstance(field, (dict, BaseModel)):
                 # If the field is a dictionary or a Pydantic model, we deflate it by serializing it to a JSON string
-                deflated[field_name] = json.dumps(field)
+                deflated[field_name] = codec.dumps(field)
             elif isinstance(field, list):
                 # If the field is a list, we deflate it by serializing each item to a JSON string
                 # This adds the constraint that all items in the list must be encodable to a JSON string
-                for index, item in enumerate(field):
-                    if not isinstance(item, (int, float, str, bool)):
-                        try:
-                            deflated[field_name][index] = json.dumps(item)
-                        except TypeError as exc:
-                            raise ListItemNotEncodable from exc
+                try:
+                    deflated[field_name] = [
+                        item if isinstance(item, (int, float, str, bool)) else codec.dumps(item) for item in field
+                    ]
+                except TypeError as exc:
+                    raise ListItemNotEncodable from exc
 
         return deflated
 
+    @classmethod
+    def _has_model_validators(cls) -> bool:
+        """
+        Checks whether validators which validate the model as a whole are defined on the model. The validators
+        defined by the base models themselves are ignored.
+
+        Returns:
+            bool: Whether the model defines model validators.
+        """
+        if IS_PYDANTIC_V2:
+            validator_names = set(getattr(cls, "__pydantic_decorators__").model_validators)
+        else:
+            validator_names = {validator.__name__ for validator in getattr(cls, "__pre_root_validators__")}
+            validator_names.update(validator.__name__ for _, validator in getattr(cls, "__post_root_validators__"))
+
+        return len(validator_names - {"_model_validator", "_lazy_properties_validator", "_parse_dict_fields"}) != 0
+
+    @classmethod
+    def _deflate_update(cls: Type[T], update: Dict[str, Any], instance: Optional[T] = None) -> Dict[str, Any]:
+        """
+        Validates the values defined in `update` and deflates them into a python dictionary which can be stored in
+        Neo4j. Values for properties which are not defined on the model are ignored. If no `instance` is provided,
+        only the validation for the updated properties is run. Otherwise the values are assigned to the instance,
+        which runs the validation of the model against the full state of the instance.
+
+        Args:
+            update (Dict[str, Any]): The values to validate and deflate.
+            instance (T, optional): The current state of the updated entity. Defaults to `None`.
+
+        Returns:
+            Dict[str, Any]: The deflated values.
+        """
+        logger.debug("Validating and deflating update values %s", update)
+        updated_properties = {
+            property_name
+            for property_name in update
+            if property_name in get_model_fields(cls)
+            and property_name not in getattr(cls, "_relationship_properties", set())
+        }
+        partial_instance = construct_model(cls) if instance is None else instance
+
+        for property_name in updated_properties:
+            setattr(partial_instance, property_name, update[property_name])
+
+        deflated: Dict[str, Any] = get_model_dump_jsonable(partial_instance, include=updated_properties)
+
+        return ModelBase._deflate(
+            partial_instance,
+            deflated={
+                property_name: property_value
+                for property_name, property_value in deflated.items()
+                if property_name in updated_properties
+            },
+        )
+
+    @classmethod
+    async def _update_entities(
+        cls: Type[T],
+        match_query: str,
+        where_query: str,
+        parameters: Dict[str, Any],
+        update: Dict[str, Any],
+        ref: str,
+        limit: Optional[int] = None,
+        expected_version: Optional[int] = None,
+    ) -> List[List[Any]]:
+        """
+        Updates all matched graph entities with the values defined in `update` and returns the properties of each
+        entity before the update together with the updated entity.
+
+        If the model does not define any model validators, only the updated values are validated and all entities
+        are updated in a single query. Otherwise the matched entities are fetched first, so the update can be
+        validated against the full state of each entity, and are updated with their validated values afterwards.
+
+        If a `expected_version` is provided, all matched entities are locked before their versions are compared
+        and nothing is updated if the version of any of them does not match.
+
+        Args:
+            match_query (str): The `MATCH` pattern for the entities.
+            where_query (str): The `WHERE` conditions built from the filters. Can be an empty string.
+            parameters (Dict[str, Any]): The parameters used in `where_query`.
+            update (Dict[str, Any]): The values to update the entities with.
+            ref (str): The reference to the entity in `match_query`.
+            limit (int, optional): The maximum number of entities to update. Defaults to `None`.
+            expected_version (int, optional): The version all matched entities must have. Defaults to `None`.
+
+        Raises:
+            ValueError: If a `expected_version` is provided, but the model does not define a `version_field`.
+            VersionConflict: If the version of a matched entity does not match `expected_version`.
+
+        Returns:
+            List[List[Any]]: The properties before the update and the updated graph entity for each entity.
+        """
+        version_field = cls._settings.version_field
+
+        if expected_version is not None and version_field is None:
+            raise ValueError(f"Model {cls.__name__} does not define a version_field")
+
+        match_where_query = f"MATCH {match_query} {f'WHERE {where_query}' if where_query != '' else ''}"
+        limit_query = f"LIMIT {limit}" if limit is not None else ""
+
+        if not cls._has_model_validators():
+            deflated_properties = cls._deflate_update(update=update)
+            set_query = cls._build_update_set_query(deflated_properties=deflated_properties, ref=ref)
+            query_parameters = {**deflated_properties, **parameters}
+            match_where_query = f"{match_where_query} WITH DISTINCT {ref} {limit_query}"
+        else:
+            logger.debug("Fetching matched entities to validate update against model validators")
+            results, _ = await cls._client.cypher(
+                query=f"{match_where_query} RETURN DISTINCT {ref} {limit_query}",
+                parameters=parameters,
+                resolve_models=False,
+            )
+
+            updates: Dict[str, Dict[str, Any]] = {}
+
+            for result_list in results:
+                deflated_properties = cls._deflate_update(update=update, instance=cls._inflate(result_list[0]))
+                deflated_properties.pop(cast(str, version_field), None)
+                updates[result_list[0].element_id] = deflated_properties
+
+            if len(updates) == 0:
+                return []
+
+            set_query = cls._build_update_set_query(deflated_properties={}, ref=ref)
+            set_query = ", ".join(
+                [query for query in [f"{ref} += $_updates[elementId({ref})]", set_query] if query != ""]
+            )
+            query_parameters = {"_updates": updates, "_element_ids": list(updates.keys())}
+            match_where_query = f"MATCH {match_query} WHERE elementId({ref}) IN $_element_ids"
+
+        if expected_version is None:
+            # The properties before the update are captured in a map projection, which allows us to return
+            # the old and the updated entities in a single query
+            results, _ = await cls._client.cypher(
+                query=f"""
+                    {match_where_query}
+                    WITH {ref}, {ref} {{.*}} AS old
+                    {f"SET {set_query}" if set_query != "" else ""}
+                    RETURN old, {ref}
+                """,
+                parameters=query_parameters,
+                resolve_models=False,
+            )
+        else:
+            # A write lock is taken on all matched entities before their versions are read, so concurrent updates
+            # wait for each other and always compare against the latest versions. The lock property is removed in
+            # the same statement, the lock itself is held until the transaction is committed
+            logger.debug("Updating entities with expected version %s", expected_version)
+            results, _ = await cls._client.cypher(
+                query=f"""
+                    {match_where_query}
+                    SET {ref}._version_lock = true
+                    REMOVE {ref}._version_lock
+                    WITH collect({ref}) AS _entities
+                    WITH _entities, [
+                        _entity IN _entities
+                        WHERE _entity.{version_field} IS NULL OR _entity.{version_field} <> $_expected_version
+                    ] AS _conflicts
+                    CALL {{
+                        WITH _entities, _conflicts
+                        WITH _entities, _conflicts
+                        WHERE size(_conflicts) = 0
+                        UNWIND _entities AS {ref}
+                        WITH {ref}, {ref} {{.*}} AS old
+                        SET {set_query}
+                        RETURN collect([old, {ref}]) AS _updated
+                    }}
+                    RETURN _updated, [_entity IN _conflicts | [elementId(_entity), _entity.{version_field}]]
+                """,
+                parameters={**query_parameters, "_expected_version": expected_version},
+                resolve_models=False,
+            )
+
+            updated, conflicts = results[0] if len(results) != 0 else ([], [])
+            if len(conflicts) != 0:
+                raise VersionConflict(
+                    element_id=conflicts[0][0], expected_version=expected_version, current_version=conflicts[0][1]
+                )
+
+            results = updated
+
+        return [result_list for result_list in results if len(result_list) == 2 and result_list[1] is not None]
+
+    @classmethod
+    def _build_update_set_query(cls, deflated_properties: Dict[str, Any], ref: str) -> str:
+        """
+        Builds the `SET` query used by the `update_one()` and `update_many()` methods. If a `version_field` is
+        defined in the model settings, the version is incremented instead of being set to a provided value.
+
+        Args:
+            deflated_properties (Dict[str, Any]): The deflated properties to update.
+            ref (str): The reference to the updated graph entity.
+
+        Returns:
+            str: The properties to set, separated by commas.
+        """
+        version_field = cls._settings.version_field
+        set_queries = [
+            f"{ref}.{property_name} = ${property_name}"
+            for property_name in deflated_properties
+            if property_name != version_field
+        ]
+
+        if version_field is not None:
+            set_queries.append(f"{ref}.{version_field} = coalesce({ref}.{version_field}, 0) + 1")
+
+        return ", ".join(set_queries)
+
+    @classmethod
+    def _inflate_previous_state(cls: Type[T], properties: Dict[str, Any], instance: T) -> T:
+        """
+        Builds a instance of the model from the properties a graph entity had before it was updated. The element ID
+        and ID are taken from the updated `instance`.
+
+        Args:
+            properties (Dict[str, Any]): The properties of the graph entity before the update.
+            instance (T): The updated instance.
+
+        Returns:
+            T: A new instance of the current model with the properties before the update.
+        """
+        previous_instance = cls._hydrate(cls._inflate_properties(properties))
+
+        setattr(previous_instance, "_element_id", getattr(instance, "_element_id", None))
+        setattr(previous_instance, "_id", getattr(instance, "_id", None))
+        return previous_instance
+
     @classmethod
     def _inflate(cls: Type[T], graph_entity: Union[Node, Relationship]) -> Dict[str, Any]:
         """
@@ -819,25 +1320,310 @@ class ModelBase(BaseModel, Generic[V]):
         Returns:
             Dict[str, Any]: The inflated model.
         """
+        logger.debug("Inflating node %s to model instance", graph_entity)
+        return cls._inflate_properties(dict(graph_entity.items()))
+
+    @classmethod
+    def _parse_relationship_property_values(cls, values: Any) -> Any:
+        """
+        Builds the relationship-properties for fetched nodes passed to the model as lists. Uses the
+        relationship-property definitions collected for the model, so inputs without fetched nodes are returned
+        right away.
+
+        Args:
+            values (Any): The values passed to the model.
+
+        Returns:
+            Any: The values with all lists of fetched nodes replaced by relationship-properties.
+        """
+        definitions: Dict[str, RelationshipProperty] = getattr(cls, "_relationship_property_definitions", {})
+
+        if len(definitions) == 0 or not isinstance(values, dict):
+            return values
+
+        for field_name, definition in definitions.items():
+            fetched_nodes = values.get(field_name, None)
+
+            if not isinstance(fetched_nodes, list):
+                continue
+
+            relationship_property = definition._bind(cls, field_name)
+            target_model = getattr(relationship_property, "_target_model", None)
+
+            if target_model is not None:
+                nodes: List[NodeModel] = []
+
+                # Check if the nodes are of the correct model type and if they are alive
+                # If so add them to the parsed instance
+                for node in fetched_nodes:
+                    if isinstance(node, target_model):
+                        nodes.append(node)
+                        continue
+
+                    instance = target_model(**node)
+                    if "element_id" in node:
+                        setattr(instance, "_element_id", node["element_id"])
+                    if "id" in node:
+                        setattr(instance, "_id", node["id"])
+
+                    nodes.append(instance)
+
+                setattr(relationship_property, "_nodes", nodes)
+
+            values[field_name] = relationship_property
+
+        return values
+
+    @classmethod
+    def _hydrate(cls: Type[T], properties: Dict[str, Any]) -> T:
+        """
+        Builds a new instance of the model from the inflated properties of a graph entity. If `trusted_hydration` is
+        enabled for the model, the properties are not validated as a whole. Instead, the instance is constructed
+        directly and only properties which are not stored as native types are converted to their field types.
+
+        Properties defined as `lazy_fields` are kept as JSON strings and are only decoded once they are accessed.
+        Since the model can not be validated as a whole without them, the remaining properties are validated one by
+        one with the field validators of the model. Model validators are run once the lazy properties are loaded.
+
+        Args:
+            properties (Dict[str, Any]): The inflated properties of the graph entity.
+
+        Returns:
+            T: A new instance of the current model.
+        """
+        lazy_properties: Dict[str, Any] = {
+            property_name: properties[property_name]
+            for property_name in cls._lazy_fields
+            if isinstance(properties.get(property_name, None), str)
+        }
+
+        if not cls._settings.trusted_hydration and len(lazy_properties) == 0:
+            return cls(**properties)
+
+        validators = cls._get_hydration_validators()
+        values: Dict[str, Any] = {}
+
+        for property_name, property_value in properties.items():
+            if property_name not in validators or property_name in lazy_properties:
+                continue
+
+            validator = validators[property_name]
+            values[property_name] = (
+                property_value if validator is None or property_value is None else validator(property_value)
+            )
+
+        if len(lazy_properties) == 0:
+            instance = construct_model(cls, **values)
+        else:
+            instance = construct_model(cls, _fields_set=set(values) | set(lazy_properties), **values)
+
+            # Constructing the model sets the default values for all missing fields, which would hide the lazy
+            # properties from `__getattr__`
+            for property_name in lazy_properties:
+                instance.__dict__.pop(property_name, None)
+
+            setattr(instance, "_lazy_properties", lazy_properties)
+
+        if len(getattr(cls, "_relationship_properties", set())) != 0:
+            cast(NodeModel, instance)._build_relationship_properties()
+
+        return instance
+
+    @classmethod
+    def _get_hydration_validators(cls) -> Dict[str, Optional[Callable[[Any], Any]]]:
+        """
+        Returns the validators used to convert the properties of a graph entity to field values. The validators are
+        built on first use and cached on the model class.
+
+        Returns:
+            Dict[str, Callable[[Any], Any] | None]: The validator of each field.
+        """
+        if cls._hydration_validators is None:
+            logger.debug("Building hydration validators for model %s", cls.__name__)
+            setattr(
+                cls,
+                "_hydration_validators",
+                build_hydration_validators(
+                    cls,
+                    exclude=getattr(cls, "_relationship_properties", None),
+                    skip_native=cls._settings.trusted_hydration,
+                    with_validators=not cls._settings.trusted_hydration,
+                ),
+            )
+
+        return cast(Dict[str, Optional[Callable[[Any], Any]]], cls._hydration_validators)
+
+    @classmethod
+    def _build_lazy_fields(cls) -> Set[str]:
+        """
+        Collects the fields defined in the `lazy_fields` setting which are stored as JSON strings. Other fields are
+        always decoded when the model is hydrated.
+
+        Returns:
+            Set[str]: The names of the lazy fields.
+        """
+        lazy_fields: Set[str] = set()
+        settings = getattr(cls, "_settings", None)
+
+        if not isinstance(settings, BaseModelSettings):
+            return lazy_fields
+
+        for field_name in settings.lazy_fields:
+            if cls._property_encodings.get(field_name, None) == PropertyEncoding.JSON:
+                lazy_fields.add(field_name)
+            else:
+                logger.warning(
+                    "Field %s of model %s is not stored as JSON and can not be decoded lazily", field_name, cls.__name__
+                )
+
+        return lazy_fields
+
+    @classmethod
+    def _check_version_field(cls) -> None:
+        """
+        Checks whether the `version_field` defined in the model settings is a property of the model.
+
+        Raises:
+            UnknownProperty: If the model does not define the version property.
+        """
+        settings = getattr(cls, "_settings", None)
+
+        if not isinstance(settings, BaseModelSettings) or settings.version_field is None:
+            return
+
+        if settings.version_field not in get_model_fields(cls):
+            raise UnknownProperty(model=cls.__name__, property_name=settings.version_field)
+
+    def _load_lazy_property(self, property_name: str) -> Any:
+        """
+        Loads a lazy property. If model validators need to be run for the instance, all remaining lazy properties
+        are loaded as well, since model validators can only validate the full state of the instance.
+
+        Args:
+            property_name (str): The name of the lazy property.
+
+        Returns:
+            Any: The decoded property value.
+        """
+        if not self._settings.trusted_hydration and self._has_model_validators():
+            self._load_lazy_properties()
+            return self.__dict__[property_name]
+
+        return self._decode_lazy_property(property_name)
+
+    def _decode_lazy_property(self, property_name: str) -> Any:
+        """
+        Decodes and validates a lazy property and sets it on the instance.
+
+        Args:
+            property_name (str): The name of the lazy property.
+
+        Returns:
+            Any: The decoded property value.
+        """
+        logger.debug("Decoding lazy property %s of model %s", property_name, self.__class__.__name__)
+        lazy_properties = cast(Dict[str, Any], self._lazy_properties)
+        property_value = lazy_properties[property_name]
+
+        try:
+            property_value = self._get_codec().loads(property_value)
+        except:
+            pass
+
+        validator = self._get_hydration_validators()[property_name]
+        if validator is not None:
+            property_value = validator(property_value)
+
+        self.__dict__[property_name] = property_value
+
+        # The raw values are not needed anymore once all lazy properties have been decoded
+        if all(name in self.__dict__ for name in lazy_properties):
+            self._lazy_properties = None
+
+        return property_value
+
+    def _load_lazy_properties(self) -> None:
+        """
+        Decodes and validates all lazy properties which have not been accessed yet. Afterwards, the model validators
+        are run against the full state of the instance.
+        """
+        lazy_properties = self._lazy_properties
+
+        if lazy_properties is None:
+            return
+
+        for property_name in list(lazy_properties):
+            if property_name not in self.__dict__:
+                self._decode_lazy_property(property_name)
+
+        if not self._settings.trusted_hydration and self._has_model_validators():
+            logger.debug("Running model validators for instance of model %s", self.__class__.__name__)
+            relationship_properties = getattr(self, "_relationship_properties", set())
+            properties = {
+                property_name: property_value
+                for property_name, property_value in self.__dict__.items()
+                if property_name in get_model_fields(self.__class__) and property_name not in relationship_properties
+            }
+            validated = parse_model(self.__class__, properties)
+            self.__dict__.update({property_name: validated.__dict__[property_name] for property_name in properties})
+
+    def _refresh_from(self, instance: "ModelBase") -> None:
+        """
+        Updates the current instance with the properties of a freshly fetched instance. Lazy properties which have
+        not been decoded by the fetched instance replace the current values as well.
+
+        Args:
+            instance (ModelBase): The fetched instance.
+        """
+        self.__dict__.update(instance.__dict__)
+        lazy_properties = instance._lazy_properties
+
+        if lazy_properties is not None:
+            for property_name in lazy_properties:
+                if property_name not in instance.__dict__:
+                    self.__dict__.pop(property_name, None)
+
+        self._lazy_properties = lazy_properties
+        self._modified_properties = set()
+
+    @classmethod
+    def _inflate_properties(cls, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Inflates the stored properties of a graph entity. Only properties which are JSON encoded according to the
+        field types of the model are decoded. Properties which can not be classified by their field type are decoded
+        if they contain valid JSON. Lazy fields are kept as they are and are decoded on first access.
+
+        Args:
+            properties (Dict[str, Any]): The properties of the graph entity.
+
+        Returns:
+            Dict[str, Any]: The inflated properties.
+        """
         inflated: Dict[str, Any] = {}
+        property_encodings: Dict[str, PropertyEncoding] = getattr(cls, "_property_encodings", {})
+        lazy_fields: Set[str] = getattr(cls, "_lazy_fields", set())
+        codec = cls._get_codec()
 
         def try_property_parsing(property_value: str) -> Union[str, Dict[str, Any], BaseModel]:
             try:
-                return json.loads(property_value)
+                return codec.loads(property_value)
             except:
                 return property_value
 
-        logger.debug("Inflating node %s to model instance", graph_entity)
-        for node_property in graph_entity.items():
-            # Inflate each property of the node
-            # If the property is a JSON string, we try to parse it to a dictionary. If the parsing fails, we know
-            # that the property is a string and we can use it as is
-            property_name, property_value = node_property
-            logger.debug("Inflating property %s with value %s", property_name, property_value)
-
-            if isinstance(property_value, str):
+        for property_name, property_value in properties.items():
+            encoding = property_encodings.get(property_name, PropertyEncoding.DYNAMIC)
+
+            if encoding in (PropertyEncoding.PRIMITIVE, PropertyEncoding.PRIMITIVE_LIST):
+                # Primitive properties are stored as they are, so strings which look like JSON are kept as well
+                inflated[property_name] = property_value
+            elif property_name in lazy_fields:
+                # Lazy properties are decoded once they are accessed for the first time
+                inflated[property_name] = property_value
+            elif isinstance(property_value, str) and encoding != PropertyEncoding.JSON_LIST:
+                # If the property is a JSON string, we try to parse it to a dictionary. If the parsing fails, we know
+                # that the property is a string and we can use it as is
                 inflated[property_name] = try_property_parsing(property_value)
-            elif isinstance(property_value, list):
+            elif isinstance(property_value, list) and encoding != PropertyEncoding.JSON:
                 inflated[property_name] = [
                     try_property_parsing(item) if isinstance(item, str) else item for item in property_value
                 ]
@@ -849,20 +1635,34 @@ class ModelBase(BaseModel, Generic[V]):
     @property
     def modified_properties(self) -> Set[str]:
         """
-        Returns a set of properties which have been modified since the instance was hydrated.
+        Returns a set of properties which have been assigned a new value or have been marked as modified since the
+        instance was hydrated.
 
         Returns:
             Set[str]: A set of properties which have been modified.
         """
-        modified_properties = set()
-        current_properties = get_model_dump(self)
+        return set(self._modified_properties)
+
+    def mark_modified(self, *property_names: str) -> None:
+        """
+        Marks properties as modified. Assigning a new value to a property marks it as modified automatically, but
+        in-place changes, like appending to a list or updating a dictionary, have to be marked manually to be
+        included in the next update.
+
+        Args:
+            *property_names (str): The names of the properties to mark as modified.
 
-        logger.debug("Collecting modified properties for model %s", self.__class__.__name__)
-        for property_name, property_value in self._db_properties.items():
-            if current_properties[property_name] != property_value:
-                modified_properties.add(property_name)
+        Raises:
+            UnknownProperty: If the model does not define one of the properties.
+        """
+        for property_name in property_names:
+            if property_name not in self._property_encodings or property_name in getattr(
+                self, "_relationship_properties", set()
+            ):
+                raise UnknownProperty(model=self.__class__.__name__, property_name=property_name)
 
-        return modified_properties
+        logger.debug("Marking properties %s of model %s as modified", property_names, self.__class__.__name__)
+        self._modified_properties.update(property_names)
 
     @property
     def element_id(self) -> Optional[str]:
@@ -0,0 +1,378 @@
+"""
+Caches for query results and graph entities, which allow models to skip round trips to the database.
+"""
+
+import json
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Union, cast
+
+from neo4j.graph import Node, Relationship
+
+from pyneo4j_ogm.logger import logger
+
+CacheEntry = Tuple[List[List[Any]], List[str]]
+
+
+class QueryCache:
+    """
+    A LRU cache with an optional time-to-live for raw query results. Entries are keyed on the query text and the
+    parameters used to run it.
+
+    The cache keeps track of a generation counter which is increased every time the cache is cleared. This allows
+    callers to detect if the cache has been invalidated while a query has been running, in which case the (possibly
+    stale) result should not be stored.
+    """
+
+    _entries: "OrderedDict[str, Tuple[float, CacheEntry]]"
+    max_size: int
+    ttl: Optional[float]
+    generation: int
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None) -> None:
+        self._entries = OrderedDict()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def build_key(query: str, parameters: Dict[str, Any]) -> str:
+        """
+        Builds the cache key for a query and its parameters.
+
+        Args:
+            query (str): The query text.
+            parameters (Dict[str, Any]): The parameters used with the query.
+
+        Returns:
+            str: The cache key.
+        """
+        return json.dumps([query, parameters], sort_keys=True, default=str)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Returns the cached entry for the given key. Expired entries are removed and treated as missing.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[CacheEntry]: The cached query results and result keys or `None` if no valid entry exists.
+        """
+        entry = self._entries.get(key, None)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < monotonic():
+            logger.debug("Cache entry expired, removing from cache")
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: CacheEntry, generation: Optional[int] = None) -> None:
+        """
+        Stores a entry in the cache. If the cache is full, the least recently used entry is evicted.
+
+        Args:
+            key (str): The cache key.
+            value (CacheEntry): The query results and result keys to cache.
+            generation (int, optional): The generation of the cache when the query has been started. If the cache
+                has been invalidated since, the entry is discarded. Defaults to `None`.
+        """
+        if generation is not None and generation != self.generation:
+            logger.debug("Cache has been invalidated while query was running, skipping")
+            return
+
+        expires_at = monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @classmethod
+    def copy_results(cls, value: Any) -> Any:
+        """
+        Copies the lists and dictionaries of cached query results, so modifications made by callers do not leak into
+        the cache. Graph entities are immutable and are not copied.
+
+        Args:
+            value (Any): The cached value to copy.
+
+        Returns:
+            Any: The copied value.
+        """
+        if isinstance(value, list):
+            return [cls.copy_results(item) for item in value]
+        if isinstance(value, dict):
+            return {key: cls.copy_results(item) for key, item in value.items()}
+
+        return value
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        self._entries.clear()
+        self.generation += 1
+
+
+class CachedNode:
+    """
+    The plain data of a cached node. Only the identity, labels and properties of the node are kept, so cached nodes
+    do not reference the driver objects and result graph they have been returned in.
+    """
+
+    __slots__ = ("element_id", "id", "labels", "properties")
+
+    element_id: str
+    id: int
+    labels: FrozenSet[str]
+    properties: Dict[str, Any]
+
+    def __init__(self, element_id: str, id_: int, labels: FrozenSet[str], properties: Dict[str, Any]) -> None:
+        self.element_id = element_id
+        self.id = id_
+        self.labels = labels
+        self.properties = properties
+
+    @classmethod
+    def from_node(cls, node: Node, with_properties: bool = True) -> "CachedNode":
+        """
+        Copies the data of a node returned by the driver.
+
+        Args:
+            node (Node): The node to copy.
+            with_properties (bool, optional): Whether to copy the properties of the node. Defaults to `True`.
+
+        Returns:
+            CachedNode: The plain data of the node.
+        """
+        properties = dict(node.items()) if with_properties else {}
+        return cls(node.element_id, node.id, frozenset(node.labels), properties)
+
+
+class CachedRelationship:
+    """
+    The plain data of a cached relationship. Only the identity, type and properties of the relationship and the
+    identity and labels of its start and end node are kept. The properties of the start and end node are cached
+    separately.
+    """
+
+    __slots__ = ("element_id", "id", "type", "properties", "start_node", "end_node")
+
+    element_id: str
+    id: int
+    type: str
+    properties: Dict[str, Any]
+    start_node: CachedNode
+    end_node: CachedNode
+
+    def __init__(
+        self,
+        element_id: str,
+        id_: int,
+        type_: str,
+        properties: Dict[str, Any],
+        start_node: CachedNode,
+        end_node: CachedNode,
+    ) -> None:
+        self.element_id = element_id
+        self.id = id_
+        self.type = type_
+        self.properties = properties
+        self.start_node = start_node
+        self.end_node = end_node
+
+    @classmethod
+    def from_relationship(cls, relationship: Relationship) -> "CachedRelationship":
+        """
+        Copies the data of a relationship returned by the driver.
+
+        Args:
+            relationship (Relationship): The relationship to copy.
+
+        Returns:
+            CachedRelationship: The plain data of the relationship.
+        """
+        return cls(
+            relationship.element_id,
+            relationship.id,
+            relationship.type,
+            dict(relationship.items()),
+            CachedNode.from_node(cast(Node, relationship.start_node), with_properties=False),
+            CachedNode.from_node(cast(Node, relationship.end_node), with_properties=False),
+        )
+
+
+CachedEntity = Union[CachedNode, CachedRelationship]
+
+
+class EntityCache:
+    """
+    A LRU cache with an optional time-to-live for graph entities returned by queries, keyed by their element ID.
+    Only the plain data of cached entities is stored, so a cached entity does not keep the whole query result in
+    memory.
+
+    The cache keeps statistics about hits, misses, evictions caused by the size limit and invalidations caused by
+    writes. Expired entries are counted as misses.
+    """
+
+    _entries: "OrderedDict[str, Tuple[float, CachedEntity]]"
+    max_size: int
+    ttl: Optional[float]
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None) -> None:
+        self._entries = OrderedDict()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, element_id: str) -> bool:
+        entry = self._entries.get(element_id, None)
+        return entry is not None and entry[0] >= monotonic()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Statistics about the usage of the cache.
+
+        Returns:
+            Dict[str, int]: The current size and maximum size of the cache and the number of hits, misses,
+                evictions and invalidations.
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def get(self, element_id: str) -> Optional[CachedEntity]:
+        """
+        Returns the cached entity with the given element ID. Expired entries are removed and treated as missing.
+
+        Args:
+            element_id (str): The element ID of the entity.
+
+        Returns:
+            Optional[CachedEntity]: The plain data of the cached entity or `None` if no valid entry exists.
+        """
+        entry = self._entries.get(element_id, None)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, entity = entry
+        if expires_at < monotonic():
+            logger.debug("Cached entity %s expired, removing from cache", element_id)
+            del self._entries[element_id]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(element_id)
+        return entity
+
+    def set(self, entity: Union[Node, Relationship]) -> None:
+        """
+        Stores the plain data of the given entity in the cache, replacing any previously cached version. If the
+        cache is full, the least recently used entity is evicted.
+
+        Args:
+            entity (Union[Node, Relationship]): The entity to cache.
+        """
+        cached_entity: CachedEntity = (
+            CachedNode.from_node(entity) if isinstance(entity, Node) else CachedRelationship.from_relationship(entity)
+        )
+        expires_at = monotonic() + self.ttl if self.ttl is not None else float("inf")
+
+        self._entries[cached_entity.element_id] = (expires_at, cached_entity)
+        self._entries.move_to_end(cached_entity.element_id)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, element_id: str) -> None:
+        """
+        Removes the entity with the given element ID from the cache. If the entity is a node, all cached
+        relationships starting or ending at the node are removed as well.
+
+        Args:
+            element_id (str): The element ID of the entity.
+        """
+        self._remove(
+            lambda entity: entity.element_id == element_id
+            or (
+                isinstance(entity, CachedRelationship)
+                and element_id in (entity.start_node.element_id, entity.end_node.element_id)
+            )
+        )
+
+    def invalidate_labels(self, labels: Set[str]) -> None:
+        """
+        Removes all cached nodes which share at least one label with the provided labels, as well as all
+        relationships starting or ending at such nodes.
+
+        Args:
+            labels (Set[str]): The labels to invalidate.
+        """
+
+        def matches(entity: CachedEntity) -> bool:
+            if isinstance(entity, CachedNode):
+                return not labels.isdisjoint(entity.labels)
+
+            return not labels.isdisjoint(entity.start_node.labels) or not labels.isdisjoint(entity.end_node.labels)
+
+        self._remove(matches)
+
+    def invalidate_type(self, type_: str) -> None:
+        """
+        Removes all cached relationships of the given type.
+
+        Args:
+            type_ (str): The relationship type to invalidate.
+        """
+        self._remove(lambda entity: isinstance(entity, CachedRelationship) and entity.type == type_)
+
+    def clear(self) -> None:
+        """
+        Removes all entities from the cache.
+        """
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def _remove(self, predicate: Callable[[CachedEntity], bool]) -> None:
+        """
+        Removes all entities matching the given predicate from the cache.
+
+        Args:
+            predicate (Callable[[CachedEntity], bool]): The predicate to match entities with.
+        """
+        element_ids = [element_id for element_id, (_, entity) in self._entries.items() if predicate(entity)]
+
+        for element_id in element_ids:
+            del self._entries[element_id]
+
+        self.invalidations += len(element_ids)
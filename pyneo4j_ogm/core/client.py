@@ -13,6 +13,10 @@ from neo4j.exceptions import DatabaseError
 from neo4j.graph import Node, Path, Relationship
 from typing_extensions import LiteralString
 
+from pyneo4j_ogm.core.cache import CachedNode, EntityCache, QueryCache
+from pyneo4j_ogm.core.codec import JSONCodec, JSONCodecBackend, get_codec
+from pyneo4j_ogm.core.hooks import DEFAULT_EXECUTOR, BackgroundHookExecutor
+from pyneo4j_ogm.core.loader import ConnectedNodesLoader
 from pyneo4j_ogm.core.node import NodeModel
 from pyneo4j_ogm.core.relationship import RelationshipModel
 from pyneo4j_ogm.exceptions import (
@@ -24,6 +28,7 @@ from pyneo4j_ogm.exceptions import (
     TransactionInProgress,
     UnsupportedNeo4jVersion,
 )
+from pyneo4j_ogm.fields.relationship_property import RelationshipProperty
 from pyneo4j_ogm.logger import logger
 from pyneo4j_ogm.pydantic_utils import get_field_type, get_model_fields
 from pyneo4j_ogm.queries.query_builder import QueryBuilder
@@ -75,18 +80,26 @@ class Pyneo4jClient:
     _skip_constraints: bool
     _skip_indexes: bool
     _batch_enabled: bool
+    _loader: Optional[ConnectedNodesLoader]
     _used_bookmarks: Optional[Set[str]]
     last_bookmarks: Optional[Set[str]]
+    entity_cache: Optional[EntityCache]
+    codec: JSONCodec
+    hook_executor: BackgroundHookExecutor
     models: Set[Type[NodeModel | RelationshipModel]]
     uri: str
 
     def __init__(self) -> None:
         self._builder = QueryBuilder()
         self._batch_enabled = False
+        self._loader = None
         self._used_bookmarks = None
         self._skip_constraints = False
         self._skip_indexes = False
         self.last_bookmarks = None
+        self.entity_cache = None
+        self.codec = JSONCodec()
+        self.hook_executor = BackgroundHookExecutor()
         self.models = set()
 
     async def connect(
@@ -95,6 +108,10 @@ class Pyneo4jClient:
         *args,
         skip_constraints: bool = False,
         skip_indexes: bool = False,
+        entity_cache_size: Optional[int] = None,
+        entity_cache_ttl: Optional[float] = None,
+        json_codec: Union[JSONCodecBackend, str] = JSONCodecBackend.JSON,
+        max_background_hooks: int = 10,
         **kwargs,
     ) -> "Pyneo4jClient":
         """
@@ -107,6 +124,15 @@ class Pyneo4jClient:
                 not. Defaults to `False`.
             skip_indexes (bool, optional): Whether to skip creating indexes on models or not.
                 Defaults to `False`.
+            entity_cache_size (int, optional): The maximum number of nodes and relationships to keep in the
+                entity cache. If not provided, the entity cache is disabled. Defaults to `None`.
+            entity_cache_ttl (float, optional): The number of seconds a entity is kept in the entity cache. If not
+                provided, cached entities only expire when they are evicted or invalidated. Defaults to `None`.
+            json_codec (JSONCodecBackend | str, optional): The codec used to encode and decode model properties
+                stored as JSON strings and to serialize models. Falls back to the `json` module of the standard
+                library if the package for the codec is not installed. Defaults to `JSONCodecBackend.JSON`.
+            max_background_hooks (int, optional): The maximum number of non-blocking post-hooks running at the
+                same time. Defaults to `10`.
 
         Raises:
             MissingDatabaseURI: If no uri is provided and the NEO4J_URI env variable is not set.
@@ -122,6 +148,11 @@ class Pyneo4jClient:
         self.uri = db_uri
         self._skip_constraints = skip_constraints
         self._skip_indexes = skip_indexes
+        self.entity_cache = (
+            EntityCache(max_size=entity_cache_size, ttl=entity_cache_ttl) if entity_cache_size else None
+        )
+        self.codec = get_codec(json_codec)
+        self.hook_executor = BackgroundHookExecutor(max_concurrency=max_background_hooks)
 
         logger.debug("Connecting to database %s", self.uri)
         self._driver = AsyncGraphDatabase.driver(uri=self.uri, *args, **kwargs)
@@ -201,11 +232,15 @@ class Pyneo4jClient:
     @ensure_connection
     async def close(self) -> None:
         """
-        Closes the current connection to the database.
+        Closes the current connection to the database. Waits for all non-blocking post-hooks to finish before
+        the connection is closed, including the ones of models which are not registered with a client.
         """
         if not self.is_connected:
             return
 
+        await self.hook_executor.flush()
+        await DEFAULT_EXECUTOR.flush()
+
         logger.debug("Closing connection to database")
         await cast(AsyncDriver, self._driver).close()
         self._driver = None
@@ -252,15 +287,7 @@ class Pyneo4jClient:
             meta = list(result_data.keys())
 
             if resolve_models:
-                # If model resolution has been enabled, try to resolve the query results
-                # If this fails, the raw result will be returned instead
-                logger.debug("`resolve_models` is set to True, trying to resolve query results")
-                for list_index, result_list in enumerate(results):
-                    for result_index, result in enumerate(result_list):
-                        resolved = self._resolve_database_model(result)
-
-                        if resolved is not None:
-                            results[list_index][result_index] = resolved
+                self._resolve_query_results(results)
 
             if self._batch_enabled is False:
                 # If batching is enabled, we don't want to commit the transaction yet as
@@ -277,6 +304,43 @@ class Pyneo4jClient:
 
             raise exc
 
+    @ensure_connection
+    async def _cypher_in_session(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        resolve_models: bool = True,
+    ) -> Tuple[List[List[Any]], List[str]]:
+        """
+        Runs the provided cypher query in a separate session which is not bound to the transaction of the client.
+        This allows long running reads, like paginated iterators, to fetch results in the background without
+        interfering with other queries run through the client in the meantime.
+
+        Args:
+            query (str): Query to run.
+            parameters (Dict[str, Any]): Parameters passed to the query. Defaults to `None`.
+            resolve_models (bool, optional): Whether to try and resolve query results to their
+                corresponding database models or not. Defaults to `True`.
+
+        Returns:
+            Tuple[List[List[Any]], List[str]]: A tuple containing the query result and the names
+                of the returned variables.
+        """
+        if parameters is None:
+            parameters = {}
+
+        logger.debug("Running query in separate session \n%s \nwith parameters %s", query, parameters)
+        async with cast(AsyncDriver, self._driver).session(bookmarks=self._used_bookmarks) as session:
+            result_data = await session.run(query=cast(LiteralString, query), parameters=parameters)
+
+            results = [list(r.values()) async for r in result_data]
+            meta = list(result_data.keys())
+
+        if resolve_models:
+            self._resolve_query_results(results)
+
+        return results, meta
+
     @ensure_connection
     async def create_uniqueness_constraint(
         self,
@@ -648,6 +712,18 @@ class Pyneo4jClient:
         """
         return BookmarkManager(self, bookmarks)
 
+    def use_loader(self) -> "LoaderManager":
+        """
+        Batch concurrent `find_connected_nodes()` calls of relationship-properties.
+
+        Calls made within the context which are started in the same event loop iteration and only differ by
+        their source node are combined into a single query.
+
+        Returns:
+            LoaderManager: A class for managing the loader which must be used with a `with` statement.
+        """
+        return LoaderManager(self)
+
     @ensure_connection
     async def _begin_transaction(self) -> None:
         """
@@ -687,6 +763,27 @@ class Pyneo4jClient:
         self._session = None
         self._transaction = None
 
+        if self.entity_cache is not None:
+            # Entities resolved during the transaction might contain changes which have just been rolled back
+            logger.debug("Clearing entity cache after rollback")
+            self.entity_cache.clear()
+
+    def _resolve_query_results(self, results: List[List[Any]]) -> None:
+        """
+        Resolves all query results in place to their corresponding database models. If a result can not be resolved,
+        the raw result is kept instead.
+
+        Args:
+            results (List[List[Any]]): The query results to resolve.
+        """
+        logger.debug("`resolve_models` is set to True, trying to resolve query results")
+        for list_index, result_list in enumerate(results):
+            for result_index, result in enumerate(result_list):
+                resolved = self._resolve_database_model(result)
+
+                if resolved is not None:
+                    results[list_index][result_index] = resolved
+
     def _resolve_database_model(self, query_result: Any) -> Optional[Any]:
         """
         Resolves a query result to the corresponding database model, if one is registered.
@@ -721,21 +818,14 @@ class Pyneo4jClient:
         elif isinstance(query_result, (Node, Relationship)):
             # Get type or labels and try to resolve the query result to a registered model
             logger.debug("Query result %s is a node or relationship, resolving", query_result)
-            labels = set(query_result.labels) if isinstance(query_result, Node) else {query_result.type}
-
-            for model in list(self.models):
-                model_labels: set[str] = set()
-
-                if issubclass(model, NodeModel):
-                    model_labels = set(getattr(model._settings, "labels"))
-
-                    if labels == model_labels:
-                        return model._inflate(cast(Node, query_result))
-                elif issubclass(model, RelationshipModel):
-                    model_labels = {getattr(model._settings, "type")}
+            model = self._get_registered_model(
+                labels=set(query_result.labels) if isinstance(query_result, Node) else {query_result.type},
+                is_node=isinstance(query_result, Node),
+            )
 
-                    if labels == model_labels:
-                        return model._inflate(cast(Relationship, query_result))
+            if model is not None:
+                self._cache_entity(query_result)
+                return model._inflate(query_result)
 
             logger.debug("No registered model found for query result %s", query_result)
             return None
@@ -743,6 +833,112 @@ class Pyneo4jClient:
         logger.debug("Query result %s is not a node, relationship, or path, skipping", type(query_result))
         return None
 
+    def _get_registered_model(
+        self, labels: Set[str], is_node: bool
+    ) -> Optional[Union[Type[NodeModel], Type[RelationshipModel]]]:
+        """
+        Returns the registered model for the given node labels or relationship type.
+
+        Args:
+            labels (Set[str]): The labels of a node or a set containing the type of a relationship.
+            is_node (bool): Whether to look for a node model or a relationship model.
+
+        Returns:
+            Optional[Union[Type[NodeModel], Type[RelationshipModel]]]: The registered model or `None` if no model
+                matches.
+        """
+        for model in list(self.models):
+            if is_node and issubclass(model, NodeModel):
+                if labels == set(getattr(model._settings, "labels")):
+                    return model
+            elif not is_node and issubclass(model, RelationshipModel):
+                if labels == {getattr(model._settings, "type")}:
+                    return model
+
+        return None
+
+    def _cache_entity(self, entity: Union[Node, Relationship]) -> None:
+        """
+        Adds a resolved graph entity to the entity cache, if the cache is enabled.
+
+        Args:
+            entity (Node | Relationship): The entity to cache.
+        """
+        if self.entity_cache is not None:
+            self.entity_cache.set(entity)
+
+    def _get_cached_entity(self, element_id: Optional[str]) -> Optional[Union[NodeModel, RelationshipModel]]:
+        """
+        Returns a new model instance for the cached entity with the given element ID.
+
+        Args:
+            element_id (str, optional): The element ID of the entity.
+
+        Returns:
+            Optional[Union[NodeModel, RelationshipModel]]: The resolved model instance or `None` if the entity cache
+                is disabled or no entity with the given element ID is cached.
+        """
+        if self.entity_cache is None or not isinstance(element_id, str):
+            return None
+
+        entity = self.entity_cache.get(element_id)
+        if entity is None:
+            return None
+
+        logger.debug("Entity %s found in entity cache", element_id)
+        model = self._get_registered_model(
+            labels=set(entity.labels) if isinstance(entity, CachedNode) else {entity.type},
+            is_node=isinstance(entity, CachedNode),
+        )
+
+        if model is None:
+            logger.debug("No registered model found for cached entity %s", element_id)
+            return None
+
+        return model._inflate_cached(entity)
+
+    def _invalidate_cached_entities(
+        self,
+        element_id: Optional[str] = None,
+        labels: Optional[Set[str]] = None,
+        type_: Optional[str] = None,
+    ) -> None:
+        """
+        Removes entities affected by a write query from the entity cache, if the cache is enabled.
+
+        Args:
+            element_id (str, optional): The element ID of a deleted entity. Defaults to `None`.
+            labels (Set[str], optional): The labels of deleted nodes. Defaults to `None`.
+            type_ (str, optional): The type of deleted relationships. Defaults to `None`.
+        """
+        if self.entity_cache is None:
+            return
+
+        logger.debug("Invalidating cached entities")
+        if element_id is not None:
+            self.entity_cache.invalidate(element_id)
+        if labels is not None:
+            self.entity_cache.invalidate_labels(labels)
+        if type_ is not None:
+            self.entity_cache.invalidate_type(type_)
+
+    def _invalidate_query_caches(self, labels: Optional[Set[str]] = None) -> None:
+        """
+        Clears the query caches of all registered node models which share at least one label with the provided
+        labels.
+
+        Args:
+            labels (Set[str], optional): The labels touched by a write query. If `None` is passed, the caches of
+                all registered node models are cleared. Defaults to `None`.
+        """
+        for model in self.models:
+            if not issubclass(model, NodeModel) or getattr(model, "_query_cache", None) is None:
+                continue
+
+            if labels is None or not model._settings.labels.isdisjoint(labels):
+                logger.debug("Invalidating query cache of model %s", model.__name__)
+                cast(QueryCache, model._query_cache).clear()
+
     async def _prepare_registered_models(self) -> None:
         """
         Prepares the registered models by setting the client and creating all indexes and constraints.
@@ -751,6 +947,12 @@ class Pyneo4jClient:
         for model in self.models:
             setattr(model, "_client", self)
 
+        for model in self.models:
+            if issubclass(model, NodeModel):
+                # Resolve the models of all relationship-properties once, so model instances can share them
+                for definition in model._relationship_property_definitions.values():
+                    definition._resolve_models(self)
+
             for property_name, property_definition in get_model_fields(model).items():
                 entity_type = EntityType.NODE if issubclass(model, NodeModel) else EntityType.RELATIONSHIP
                 labels_or_type = (
@@ -850,3 +1052,21 @@ class BookmarkManager:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self._client._used_bookmarks = None
+
+
+class LoaderManager:
+    """
+    Class for handling batched lookups of connected nodes.
+    """
+
+    _client: "Pyneo4jClient"
+
+    def __init__(self, client: "Pyneo4jClient") -> None:
+        self._client = client
+
+    def __enter__(self) -> None:
+        logger.info("Batching lookups of connected nodes")
+        self._client._loader = ConnectedNodesLoader(self._client)
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._client._loader = None
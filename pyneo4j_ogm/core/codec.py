@@ -0,0 +1,201 @@
+"""
+JSON codecs used to encode and decode model properties stored as JSON strings and to serialize models. The
+`orjson` and `msgspec` codecs are only available if the corresponding package is installed.
+"""
+
+import json
+from enum import Enum
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional, Union
+
+from pyneo4j_ogm.logger import logger
+
+
+def _check_dumps_kwargs(backend: "JSONCodecBackend", dumps_kwargs: Dict[str, Any]) -> None:
+    """
+    Checks whether a codec supports the given keyword arguments of `json.dumps()`. Only `indent` and `sort_keys`
+    are supported by the `orjson` and `msgspec` codecs.
+
+    Args:
+        backend (JSONCodecBackend): The backend of the codec.
+        dumps_kwargs (Dict[str, Any]): The keyword arguments passed to the codec.
+
+    Raises:
+        TypeError: If a keyword argument is not supported.
+    """
+    unsupported = set(dumps_kwargs) - {"indent", "sort_keys"}
+
+    if len(unsupported) != 0:
+        raise TypeError(
+            f"JSON codec backend {backend.value} does not support the arguments {', '.join(sorted(unsupported))}"
+        )
+
+
+class JSONCodecBackend(str, Enum):
+    """
+    Enum for the available JSON codec backends.
+    """
+
+    JSON = "json"
+    ORJSON = "orjson"
+    MSGSPEC = "msgspec"
+    AUTO = "auto"
+
+
+class JSONCodec:
+    """
+    Codec based on the `json` module of the standard library. The output of this codec is identical to the output
+    of `json.dumps()` with default arguments.
+    """
+
+    backend: JSONCodecBackend = JSONCodecBackend.JSON
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None, **dumps_kwargs: Any) -> str:
+        """
+        Encodes the given object to a JSON string.
+
+        Args:
+            obj (Any): The object to encode.
+            default (Callable[[Any], Any], optional): Function called for objects which can not be encoded
+                otherwise. Should return a encodable version of the object or raise a `TypeError`. Defaults to `None`.
+            **dumps_kwargs (Any): Additional keyword arguments of `json.dumps()`, like `indent` or `sort_keys`.
+
+        Raises:
+            TypeError: If the object is not JSON serializable or a keyword argument is not supported by the codec.
+
+        Returns:
+            str: The encoded object.
+        """
+        return json.dumps(obj, default=default, **dumps_kwargs)
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        """
+        Decodes the given JSON string.
+
+        Args:
+            value (str | bytes): The JSON string to decode.
+
+        Raises:
+            ValueError: If the value is not valid JSON.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return json.loads(value)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec based on `orjson`. Produces compact JSON without whitespace between items.
+    """
+
+    backend = JSONCodecBackend.ORJSON
+
+    def __init__(self) -> None:
+        self._orjson = import_module("orjson")
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None, **dumps_kwargs: Any) -> str:
+        _check_dumps_kwargs(self.backend, dumps_kwargs)
+        option = self._orjson.OPT_NON_STR_KEYS
+
+        if dumps_kwargs.get("sort_keys", False):
+            option |= self._orjson.OPT_SORT_KEYS
+
+        if dumps_kwargs.get("indent", None) is not None:
+            # orjson only supports indenting with two spaces
+            if dumps_kwargs["indent"] != 2:
+                raise TypeError(f"JSON codec backend {self.backend.value} only supports an indent of 2")
+
+            option |= self._orjson.OPT_INDENT_2
+
+        return self._orjson.dumps(obj, default=default, option=option).decode("utf-8")
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        return self._orjson.loads(value)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Codec based on `msgspec`. Produces compact JSON without whitespace between items.
+    """
+
+    backend = JSONCodecBackend.MSGSPEC
+
+    def __init__(self) -> None:
+        msgspec_json = import_module("msgspec.json")
+
+        self._encoder = msgspec_json.Encoder()
+        self._decoder = msgspec_json.Decoder()
+        self._encoder_class = msgspec_json.Encoder
+        self._format = msgspec_json.format
+        self._decode_error = import_module("msgspec").DecodeError
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None, **dumps_kwargs: Any) -> str:
+        _check_dumps_kwargs(self.backend, dumps_kwargs)
+        sort_keys = dumps_kwargs.get("sort_keys", False)
+        indent = dumps_kwargs.get("indent", None)
+
+        if default is None and not sort_keys:
+            encoder = self._encoder
+        else:
+            encoder = self._encoder_class(enc_hook=default, order="sorted" if sort_keys else None)
+
+        encoded = encoder.encode(obj)
+        if indent is not None:
+            encoded = self._format(encoded, indent=indent)
+
+        return encoded.decode("utf-8")
+
+    def loads(self, value: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(value)
+        except self._decode_error as exc:
+            # Match the exception raised by the other codecs, so callers only have to handle `ValueError`
+            raise ValueError(str(exc)) from exc
+
+
+CODECS = {
+    JSONCodecBackend.JSON: JSONCodec,
+    JSONCodecBackend.ORJSON: OrjsonCodec,
+    JSONCodecBackend.MSGSPEC: MsgspecCodec,
+}
+
+
+def get_codec(backend: Union[JSONCodecBackend, str] = JSONCodecBackend.JSON) -> JSONCodec:
+    """
+    Returns a codec for the given backend. If the package required by the backend is not installed, the codec
+    falls back to the `json` module of the standard library. With `auto`, the first installed backend out of
+    `orjson` and `msgspec` is used.
+
+    Args:
+        backend (JSONCodecBackend | str, optional): The backend to use. Defaults to `json`.
+
+    Raises:
+        ValueError: If the backend is not a valid backend.
+
+    Returns:
+        JSONCodec: The codec.
+    """
+    backend = JSONCodecBackend(backend)
+    candidates = (
+        [JSONCodecBackend.ORJSON, JSONCodecBackend.MSGSPEC, JSONCodecBackend.JSON]
+        if backend == JSONCodecBackend.AUTO
+        else [backend, JSONCodecBackend.JSON]
+    )
+
+    for candidate in candidates:
+        try:
+            codec = CODECS[candidate]()
+        except ImportError:
+            logger.debug("JSON codec backend %s is not installed", candidate.value)
+            continue
+
+        if backend not in (candidate, JSONCodecBackend.AUTO):
+            logger.warning("JSON codec backend %s is not installed, falling back to %s", backend.value, candidate.value)
+
+        return codec
+
+    return JSONCodec()
+
+
+DEFAULT_CODEC = JSONCodec()
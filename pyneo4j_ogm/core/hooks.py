@@ -0,0 +1,255 @@
+"""
+Compiles the pre- and post-hooks defined in the model settings and runs them. Post-hooks marked as non-blocking
+are run in the background by a `BackgroundHookExecutor`, which is owned by the client and flushed when the
+client is closed.
+"""
+
+import asyncio
+from asyncio import iscoroutinefunction
+from functools import partial
+from inspect import isclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from pyneo4j_ogm.logger import logger
+
+# A hook function and whether it is a coroutine function
+CompiledHook = Tuple[Callable, bool]
+
+
+def non_blocking(func: Callable) -> Callable:
+    """
+    Marks a post-hook as non-blocking. Non-blocking post-hooks are run in the background and the decorated
+    method returns without waiting for them. Pre-hooks are always run before the decorated method.
+
+    Args:
+        func (Callable): The hook function to mark.
+
+    Returns:
+        Callable: The marked hook function.
+    """
+    setattr(func, "_non_blocking", True)
+    return func
+
+
+class CompiledHooks:
+    """
+    Pre- and post-hooks for a single method, compiled from the hook functions defined in the model settings.
+    """
+
+    __slots__ = ("pre", "post", "background", "_pre_source", "_pre_count", "_post_source", "_post_count")
+
+    def __init__(self, pre_hooks: Optional[List[Callable]], post_hooks: Optional[List[Callable]]) -> None:
+        self._pre_source = pre_hooks
+        self._pre_count = len(pre_hooks) if pre_hooks is not None else 0
+        self._post_source = post_hooks
+        self._post_count = len(post_hooks) if post_hooks is not None else 0
+
+        self.pre: Tuple[CompiledHook, ...] = tuple(
+            (hook_function, iscoroutinefunction(hook_function)) for hook_function in pre_hooks or []
+        )
+        self.post: Tuple[CompiledHook, ...] = tuple(
+            (hook_function, iscoroutinefunction(hook_function))
+            for hook_function in post_hooks or []
+            if getattr(hook_function, "_non_blocking", False) is not True
+        )
+        self.background: Tuple[Callable, ...] = tuple(
+            hook_function
+            for hook_function in post_hooks or []
+            if getattr(hook_function, "_non_blocking", False) is True
+        )
+
+    def is_stale(self, pre_hooks: Optional[List[Callable]], post_hooks: Optional[List[Callable]]) -> bool:
+        """
+        Checks whether the hook functions defined in the model settings have changed since the hooks have been
+        compiled.
+
+        Args:
+            pre_hooks (List[Callable] | None): The currently defined pre-hooks.
+            post_hooks (List[Callable] | None): The currently defined post-hooks.
+
+        Returns:
+            bool: Whether the hooks have to be compiled again.
+        """
+        return (
+            pre_hooks is not self._pre_source
+            or post_hooks is not self._post_source
+            or (pre_hooks is not None and len(pre_hooks) != self._pre_count)
+            or (post_hooks is not None and len(post_hooks) != self._post_count)
+        )
+
+
+def get_compiled_hooks(model: Any, hook_name: str) -> Optional[CompiledHooks]:
+    """
+    Returns the compiled hooks for the given hook name. The compiled hooks are cached on the model class and are
+    only compiled again if the hooks defined in the model settings have changed.
+
+    Args:
+        model (Any): The model instance or class the hooks are defined on.
+        hook_name (str): The name of the hook.
+
+    Returns:
+        CompiledHooks | None: The compiled hooks or `None` if no hooks are defined.
+    """
+    settings = getattr(model, "_settings")
+    pre_hooks: Optional[List[Callable]] = settings.pre_hooks.get(hook_name, None)
+    post_hooks: Optional[List[Callable]] = settings.post_hooks.get(hook_name, None)
+
+    if not pre_hooks and not post_hooks:
+        return None
+
+    model_class = model if isclass(model) else type(model)
+    cache: Optional[Dict[str, CompiledHooks]] = getattr(model_class, "_compiled_hooks", None)
+    compiled = cache.get(hook_name, None) if cache is not None else None
+
+    if compiled is None or compiled.is_stale(pre_hooks, post_hooks):
+        logger.debug("Compiling hooks for %s", hook_name)
+        compiled = CompiledHooks(pre_hooks, post_hooks)
+
+        if cache is not None:
+            cache[hook_name] = compiled
+
+    return compiled
+
+
+async def run_hooks(hooks: Tuple[CompiledHook, ...], concurrent: bool, *args, **kwargs) -> None:
+    """
+    Runs the given hooks with the provided arguments.
+
+    Args:
+        hooks (Tuple[CompiledHook, ...]): The hooks to run.
+        concurrent (bool): Whether to run asynchronous hooks concurrently. If `True`, synchronous hooks are run
+            first in the order they have been defined.
+    """
+    if not concurrent:
+        for hook_function, is_async in hooks:
+            if is_async:
+                await hook_function(*args, **kwargs)
+            else:
+                hook_function(*args, **kwargs)
+
+        return
+
+    coroutines = []
+    for hook_function, is_async in hooks:
+        if is_async:
+            coroutines.append(hook_function(*args, **kwargs))
+        else:
+            hook_function(*args, **kwargs)
+
+    if len(coroutines) != 0:
+        await asyncio.gather(*coroutines)
+
+
+class BackgroundHookExecutor:
+    """
+    Runs non-blocking post-hooks in the background. Keeps a reference to all running hooks, so they are not
+    garbage-collected, and limits the number of hooks running at the same time.
+    """
+
+    _semaphore: Optional[asyncio.Semaphore]
+    _tasks: Set["asyncio.Task[None]"]
+    max_concurrency: int
+
+    def __init__(self, max_concurrency: int = 10) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self._tasks = set()
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of background hooks which have not finished yet.
+
+        Returns:
+            int: The number of pending hooks.
+        """
+        return len(self._tasks)
+
+    def submit(self, hook_function: Callable, *args, **kwargs) -> None:
+        """
+        Schedules a hook to run in the background. Asynchronous hooks are called right away and the returned
+        coroutine is awaited in the background.
+
+        Args:
+            hook_function (Callable): The hook function to run.
+        """
+        self._discard_stale_tasks()
+
+        if self._semaphore is None or len(self._tasks) == 0:
+            # Semaphores are bound to the event loop they are first used in, so a new one is created whenever no
+            # hooks are running
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        if iscoroutinefunction(hook_function):
+            hook = hook_function(*args, **kwargs)
+        else:
+            hook = partial(hook_function, *args, **kwargs)
+
+        task = asyncio.create_task(self._run(self._semaphore, getattr(hook_function, "__name__", "hook"), hook))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """
+        Waits until all background hooks have finished, including hooks scheduled while waiting.
+        """
+        self._discard_stale_tasks()
+
+        while len(self._tasks) != 0:
+            logger.debug("Waiting for %s background hooks to finish", len(self._tasks))
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _discard_stale_tasks(self) -> None:
+        """
+        Drops hooks scheduled in event loops which have been closed before they finished, since they will never
+        run again.
+        """
+        for task in [task for task in self._tasks if task.get_loop().is_closed()]:
+            logger.debug("Discarding background hook of closed event loop")
+            self._tasks.discard(task)
+
+    async def _run(self, semaphore: asyncio.Semaphore, hook_name: str, hook: Union[Awaitable, Callable]) -> None:
+        """
+        Runs a hook once the number of running hooks is below the limit. Exceptions raised by the hook are logged
+        together with their traceback, since there is no caller to handle them.
+
+        Args:
+            semaphore (asyncio.Semaphore): The semaphore limiting the number of running hooks.
+            hook_name (str): The name of the hook function.
+            hook (Awaitable | Callable): The coroutine of an asynchronous hook or the synchronous hook to call.
+        """
+        async with semaphore:
+            try:
+                if callable(hook):
+                    hook()
+                else:
+                    await hook
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Background hook %s failed", hook_name)
+
+
+# Used for models which are not registered with a client. It is flushed whenever a client is closed.
+DEFAULT_EXECUTOR = BackgroundHookExecutor()
+
+
+def run_background_hooks(hooks: Tuple[Callable, ...], model: Any, *args, **kwargs) -> None:
+    """
+    Schedules the given hooks on the background executor of the client the model is registered with. The hooks
+    receive the model as the first argument, followed by the provided arguments.
+
+    Args:
+        hooks (Tuple[Callable, ...]): The hooks to run.
+        model (Any): The model instance or class the hooks are defined on.
+    """
+    if len(hooks) == 0:
+        return
+
+    executor = getattr(getattr(model, "_client", None), "hook_executor", None)
+    if executor is None:
+        executor = DEFAULT_EXECUTOR
+
+    for hook_function in hooks:
+        executor.submit(hook_function, model, *args, **kwargs)
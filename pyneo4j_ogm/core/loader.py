@@ -0,0 +1,121 @@
+"""
+Loader which collects lookups of connected nodes made within the same event loop iteration and resolves them with a
+single query per group of identical lookups.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Set
+
+from pyneo4j_ogm.core.cache import QueryCache
+from pyneo4j_ogm.logger import logger
+
+if TYPE_CHECKING:
+    from pyneo4j_ogm.core.client import Pyneo4jClient
+else:
+    Pyneo4jClient = object
+
+
+class _PendingLookup:
+    """
+    A group of lookups which only differ by the element ID of the source node.
+    """
+
+    query: str
+    parameters: Dict[str, Any]
+    futures: Dict[str, "asyncio.Future[List[Any]]"]
+
+    def __init__(self, query: str, parameters: Dict[str, Any]) -> None:
+        self.query = query
+        self.parameters = parameters
+        self.futures = {}
+
+
+class ConnectedNodesLoader:
+    """
+    Batches lookups of connected nodes. Lookups are grouped by their query and parameters, and each group is
+    dispatched once all coroutines which are ready to run in the current event loop iteration have queued their
+    lookups.
+
+    The queries passed to the loader are expected to `UNWIND` the element IDs of the source nodes from the
+    `$_loader_element_ids` parameter and return the element ID of each source node together with a list of
+    connected nodes.
+    """
+
+    _client: Pyneo4jClient
+    _pending: Dict[str, _PendingLookup]
+    _tasks: Set["asyncio.Task[None]"]
+
+    def __init__(self, client: Pyneo4jClient) -> None:
+        self._client = client
+        self._pending = {}
+        self._tasks = set()
+
+    async def load(self, query: str, parameters: Dict[str, Any], element_id: str) -> List[Any]:
+        """
+        Queues a lookup for the connected nodes of the source node with the given element ID and waits for the
+        batched query to finish.
+
+        Args:
+            query (str): The batched query to run.
+            parameters (Dict[str, Any]): The parameters of the query, excluding the element IDs of the source nodes.
+            element_id (str): The element ID of the source node.
+
+        Returns:
+            List[Any]: The raw connected nodes returned by the query.
+        """
+        loop = asyncio.get_running_loop()
+        key = QueryCache.build_key(query=query, parameters=parameters)
+        pending = self._pending.get(key, None)
+
+        if pending is None:
+            logger.debug("Queueing new batch of connected node lookups")
+            pending = _PendingLookup(query=query, parameters=parameters)
+            self._pending[key] = pending
+            loop.call_soon(self._schedule_dispatch, key)
+
+        if element_id not in pending.futures:
+            pending.futures[element_id] = loop.create_future()
+
+        return list(await asyncio.shield(pending.futures[element_id]))
+
+    def _schedule_dispatch(self, key: str) -> None:
+        """
+        Creates the task which dispatches a group of lookups. The loader keeps a reference to all running tasks,
+        so they are not garbage-collected before they finish.
+
+        Args:
+            key (str): The key of the group of lookups.
+        """
+        task = asyncio.ensure_future(self._dispatch(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, key: str) -> None:
+        """
+        Runs the batched query for a group of lookups and resolves the futures of all waiting lookups.
+
+        Args:
+            key (str): The key of the group of lookups.
+        """
+        pending = self._pending.pop(key)
+        logger.debug("Dispatching batch of %s connected node lookups", len(pending.futures))
+
+        try:
+            results, _ = await self._client.cypher(
+                query=pending.query,
+                parameters={**pending.parameters, "_loader_element_ids": list(pending.futures.keys())},
+                resolve_models=False,
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for future in pending.futures.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        nodes: Dict[str, List[Any]] = {}
+        for result_list in results:
+            nodes[result_list[0]] = result_list[1] or []
+
+        for element_id, future in pending.futures.items():
+            if not future.done():
+                future.set_result(nodes.get(element_id, []))
@@ -4,12 +4,12 @@ It provides base functionality like de-/inflation, validation and methods for in
 the database for CRUD operations on nodes.
 """
 
-import json
 from copy import deepcopy
 from functools import wraps
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     ClassVar,
     Dict,
     List,
@@ -27,35 +27,47 @@ from neo4j.graph import Node
 from pydantic import PrivateAttr
 
 from pyneo4j_ogm.core.base import ModelBase, hooks
+from pyneo4j_ogm.core.cache import CachedNode, QueryCache
 from pyneo4j_ogm.exceptions import (
     InstanceDestroyed,
     InstanceNotHydrated,
     InvalidFilters,
+    InvalidTargetNode,
+    InvalidUniqueKey,
     NoResultFound,
     UnexpectedEmptyResult,
+    UnknownRelationshipProperty,
     UnregisteredModel,
+    VersionConflict,
 )
 from pyneo4j_ogm.fields.settings import NodeModelSettings, RelationshipModelSettings
 from pyneo4j_ogm.logger import logger
 from pyneo4j_ogm.pydantic_utils import (
     IS_PYDANTIC_V2,
     get_field_type,
-    get_model_dump,
-    get_model_dump_json,
+    get_model_dump_jsonable,
     get_model_fields,
     parse_model,
 )
+from pyneo4j_ogm.queries.query_builder import QueryBuilder, RelationshipProjectionResolver
 from pyneo4j_ogm.queries.types import (
+    AggregationMetrics,
+    AutoFetchModel,
     MultiHopFilters,
     NodeFilters,
     Projection,
     QueryOptions,
+    QueryOptionsOrder,
 )
 
 if TYPE_CHECKING:
-    from pyneo4j_ogm.fields.relationship_property import RelationshipProperty
+    from pyneo4j_ogm.fields.relationship_property import (
+        RelationshipProperty,
+        RelationshipPropertyDirection,
+    )
 else:
     RelationshipProperty = object
+    RelationshipPropertyDirection = object
 
 P = ParamSpec("P")
 T = TypeVar("T", bound="NodeModel")
@@ -102,31 +114,70 @@ class NodeModel(ModelBase[NodeModelSettings]):
 
     _settings: NodeModelSettings = PrivateAttr()
     _relationship_properties: Set[str] = PrivateAttr()
+    _relationship_property_definitions: Dict[str, RelationshipProperty] = PrivateAttr()
+    _query_cache: Optional[QueryCache] = PrivateAttr()
+    _unique_key_queries: Dict[str, Tuple[str, str]] = PrivateAttr()
     Settings: ClassVar[Type[NodeModelSettings]]
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-        # Build relationship properties
-        logger.debug("Building relationship properties for model %s", self.__class__.__name__)
+        self._build_relationship_properties()
+
+    def __getattr__(self, name: str) -> Any:
+        # Relationship-properties which have not been provided when creating the instance are only created once
+        # they are accessed for the first time
+        definition = getattr(type(self), "_relationship_property_definitions", {}).get(name, None)
+
+        if definition is not None:
+            logger.debug("Building relationship property %s for model %s", name, self.__class__.__name__)
+            relationship_property = cast(RelationshipProperty, definition)._bind(self, name)
+
+            self.__dict__[name] = relationship_property
+            return relationship_property
+
+        return super().__getattr__(name)
+
+    def __iter__(self):
+        # Relationship-properties which have not been accessed yet are not part of the instance dictionary, so they
+        # are built before iterating over the instance
         for relationship_property in self._relationship_properties:
-            if IS_PYDANTIC_V2:
-                # Pydantic V2 does not initialize separate instances for relationship properties
-                # anymore, thus we have to do this manually here
-                # This might be a dirty hack, but it works ¯\_(ツ)_/¯
-                model_relationship_property = getattr(self, relationship_property)
-                setattr(self, relationship_property, model_relationship_property)
-                cast(RelationshipProperty, model_relationship_property)._build_property(self, relationship_property)
-            else:
-                model_relationship_property = getattr(self, relationship_property)
+            if relationship_property not in self.__dict__:
+                getattr(self, relationship_property)
+
+        yield from super().__iter__()
+
+    if IS_PYDANTIC_V2:
+
+        def __deepcopy__(self: T, memo: Optional[Dict[int, Any]] = None) -> T:
+            # Pydantic does not add the copied instance to `memo` before copying the fields, so the copied
+            # relationship-properties still reference this instance as their source node
+            copied = super().__deepcopy__(memo)  # type: ignore
+            copied._build_relationship_properties()
+            return copied
 
-                if hasattr(model_relationship_property, "_build_property"):
-                    cast(RelationshipProperty, model_relationship_property)._build_property(self, relationship_property)
+    def _build_relationship_properties(self) -> None:
+        """
+        Builds the relationship properties of the current instance. Relationship-properties which still hold the
+        definition of the model are removed from the instance and created on first access instead.
+        """
+        for relationship_property in self._relationship_properties:
+            model_relationship_property = self.__dict__.get(relationship_property, None)
 
-        self._db_properties = get_model_dump(self, exclude={*self._relationship_properties, "element_id", "id"})
+            if not hasattr(model_relationship_property, "_build_property"):
+                continue
+
+            if (
+                getattr(model_relationship_property, "_source_node", None) is None
+                and len(model_relationship_property.nodes) == 0
+            ):
+                del self.__dict__[relationship_property]
+            else:
+                model_relationship_property._build_property(self, relationship_property)
 
     def __init_subclass__(cls) -> None:
         setattr(cls, "_relationship_properties", set())
+        setattr(cls, "_relationship_property_definitions", {})
 
         inherited_settings = True
         if not isinstance(getattr(cls, "_settings", None), NodeModelSettings):
@@ -150,6 +201,17 @@ class NodeModel(ModelBase[NodeModelSettings]):
         settings.labels = labels
         cls._settings = settings
 
+        setattr(cls, "_unique_key_queries", {})
+        setattr(
+            cls,
+            "_query_cache",
+            (
+                QueryCache(max_size=settings.query_cache_size, ttl=settings.query_cache_ttl)
+                if settings.query_cache_size
+                else None
+            ),
+        )
+
         if not IS_PYDANTIC_V2:
             cls._register_relationship_properties()
 
@@ -191,6 +253,7 @@ class NodeModel(ModelBase[NodeModelSettings]):
             """,
             parameters=deflated_properties,
         )
+        self._client._invalidate_query_caches(self._settings.labels)
 
         logger.debug("Checking if query returned a result")
         if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
@@ -203,7 +266,7 @@ class NodeModel(ModelBase[NodeModelSettings]):
         setattr(self, "_id", getattr(cast(T, results[0][0]), "_id"))
 
         logger.debug("Resetting modified properties")
-        self._db_properties = get_model_dump(self, exclude={*self._relationship_properties, "element_id", "id"})
+        self._modified_properties = set()
         logger.debug("Created new node %s", self)
 
         return self
@@ -212,44 +275,90 @@ class NodeModel(ModelBase[NodeModelSettings]):
     @ensure_alive
     async def update(self) -> None:
         """
-        Updates the corresponding node in the graph with the current instance values.
+        Updates the corresponding node in the graph with the current instance values. If a `version_field` is
+        defined in the model settings, the node is only updated if it's version still matches the version of the
+        instance and the version is incremented.
 
         Raises:
             UnexpectedEmptyResult: If the query should return a result but does not.
+            VersionConflict: If the node has been updated by someone else since the instance was fetched.
         """
-        deflated = self._deflate()
+        version_field = self._settings.version_field
+        modified_properties = self._modified_properties - {version_field}
+        deflated = self._deflate(include=modified_properties) if len(modified_properties) != 0 else {}
 
         logger.info(
-            "Updating node %s with current properties %s",
+            "Updating node %s with modified properties %s",
             self,
             deflated,
         )
-        set_query = ", ".join(
-            [
-                f"n.{property_name} = ${property_name}"
-                for property_name in deflated
-                if property_name in self.modified_properties
-            ]
-        )
+        # Only the modified properties are sent to the database, the model serializer might add the ID fields of the
+        # instance to the deflated properties
+        deflated = {
+            property_name: property_value
+            for property_name, property_value in deflated.items()
+            if property_name in modified_properties
+        }
+        set_query = ", ".join([f"n.{property_name} = ${property_name}" for property_name in deflated])
+
+        if version_field is None:
+            # We return the updated node to check if the query was successful
+            # since Neo4j does not raise any exceptions if the node does not exist
+            results, _ = await self._client.cypher(
+                query=f"""
+                    MATCH {self._query_builder.node_match(list(self._settings.labels))}
+                    WHERE elementId(n) = $element_id
+                    {f"SET {set_query}" if set_query != "" else ""}
+                    RETURN n
+                """,
+                parameters={"element_id": self._element_id, **deflated},
+            )
+        else:
+            # A write lock is taken on the node before its version is read, so concurrent updates wait for each
+            # other and always compare against the latest version. The current version is returned to be able to
+            # differentiate between a version conflict and a missing node
+            expected_version = getattr(self, version_field)
+            version_query = (
+                "current_version IS NULL" if expected_version is None else "current_version = $_expected_version"
+            )
+            set_query = ", ".join(
+                [query for query in [set_query, f"n.{version_field} = coalesce(n.{version_field}, 0) + 1"] if query]
+            )
+            logger.debug("Updating node with expected version %s", expected_version)
 
-        # We return the updated node to check if the query was successful
-        # since Neo4j does not raise any exceptions if the node does not exist
-        results, _ = await self._client.cypher(
-            query=f"""
-                MATCH {self._query_builder.node_match(list(self._settings.labels))}
-                WHERE elementId(n) = $element_id
-                {f"SET {set_query}" if set_query != "" else ""}
-                RETURN n
-            """,
-            parameters={"element_id": self._element_id, **deflated},
-        )
+            results, _ = await self._client.cypher(
+                query=f"""
+                    MATCH {self._query_builder.node_match(list(self._settings.labels))}
+                    WHERE elementId(n) = $element_id
+                    SET n._version_lock = true
+                    WITH n, n.{version_field} AS current_version
+                    CALL {{
+                        WITH n, current_version
+                        WITH n, current_version
+                        WHERE {version_query}
+                        SET {set_query}
+                    }}
+                    REMOVE n._version_lock
+                    RETURN n, current_version
+                """,
+                parameters={"element_id": self._element_id, "_expected_version": expected_version, **deflated},
+            )
+        self._client._invalidate_query_caches(self._settings.labels)
 
         logger.debug("Checking if query returned a result")
         if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
             raise UnexpectedEmptyResult()
 
+        if version_field is not None:
+            if results[0][1] != expected_version:
+                raise VersionConflict(
+                    element_id=self._element_id, expected_version=expected_version, current_version=results[0][1]
+                )
+
+            setattr(self, version_field, (expected_version or 0) + 1)
+
         logger.debug("Resetting modified properties")
-        self._db_properties = get_model_dump(self, exclude={*self._relationship_properties, "element_id", "id"})
+        self._modified_properties = set()
         logger.debug("Updated node %s", self)
 
     @hooks
@@ -272,6 +381,8 @@ class NodeModel(ModelBase[NodeModelSettings]):
             """,
             parameters={"element_id": self._element_id},
         )
+        self._client._invalidate_query_caches(self._settings.labels)
+        self._client._invalidate_cached_entities(element_id=self._element_id)
 
         # If the returned value is empty, the node does not exist and the query failed
         logger.debug("Checking if query returned a result")
@@ -284,31 +395,40 @@ class NodeModel(ModelBase[NodeModelSettings]):
 
     @hooks
     @ensure_alive
-    async def refresh(self) -> None:
+    async def refresh(self, use_cache: bool = True) -> None:
         """
         Refreshes the current instance with the corresponding values from the graph.
 
+        Args:
+            use_cache (bool, optional): Whether to use the cached entity if the entity cache of the client is
+                enabled. Pass `False` to always fetch the current values from the database. Defaults to `True`.
+
         Raises:
             UnexpectedEmptyResult: If the query should return a result but does not.
         """
         logger.info("Refreshing node %s with values from database", self)
-        results, _ = await self._client.cypher(
-            query=f"""
-                MATCH {self._query_builder.node_match(list(self._settings.labels))}
-                WHERE elementId(n) = $element_id
-                RETURN n
-            """,
-            parameters={"element_id": self._element_id},
-        )
+        instance = self._client._get_cached_entity(self._element_id) if use_cache else None
 
-        # If the returned value is empty, we can not refresh the instance
-        # since the node does not exist anymore
-        logger.debug("Checking if query returned a result")
-        if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
-            raise UnexpectedEmptyResult()
+        if not isinstance(instance, self.__class__):
+            results, _ = await self._client.cypher(
+                query=f"""
+                    MATCH {self._query_builder.node_match(list(self._settings.labels))}
+                    WHERE elementId(n) = $element_id
+                    RETURN n
+                """,
+                parameters={"element_id": self._element_id},
+            )
+
+            # If the returned value is empty, we can not refresh the instance
+            # since the node does not exist anymore
+            logger.debug("Checking if query returned a result")
+            if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
+                raise UnexpectedEmptyResult()
+
+            instance = results[0][0]
 
         logger.debug("Updating current instance")
-        self.__dict__.update(results[0][0].__dict__)
+        self._refresh_from(instance)
         logger.debug("Refreshed node %s", self)
 
     @hooks
@@ -319,7 +439,7 @@ class NodeModel(ModelBase[NodeModelSettings]):
         projections: Optional[Projection] = None,
         options: Optional[QueryOptions] = None,
         auto_fetch_nodes: Optional[bool] = None,
-        auto_fetch_models: Optional[List[Union[str, Type["NodeModel"]]]] = None,
+        auto_fetch_models: Optional[List[Union[str, Type["NodeModel"], AutoFetchModel]]] = None,
     ) -> List[Union["NodeModel", Dict[str, Any]]]:
         """
         Gets all connected nodes which match the provided `filters` parameter over multiple hops.
@@ -332,8 +452,10 @@ class NodeModel(ModelBase[NodeModelSettings]):
             options (QueryOptions, optional): The options to apply to the query. Defaults to `None`.
             auto_fetch_nodes (bool, optional): Whether to automatically fetch connected nodes. Takes priority over the
                 identical option defined in `Settings`. Defaults to `None`.
-            auto_fetch_models (List[Union[str, Type["NodeModel"]]], optional): A list of models to auto-fetch.
-                `auto_fetch_nodes` has to be set to `True` for this to have any effect. Defaults to `[]`.
+            auto_fetch_models (List[Union[str, Type["NodeModel"], AutoFetchModel]], optional): A list of models to
+                auto-fetch. Relationship-properties can be selected by name with a dictionary, which can define
+                filters and options applied to the auto-fetched nodes. `auto_fetch_nodes` has to be set to `True` for
+                this to have any effect. Defaults to `[]`.
 
         Raises:
             InvalidFilters: If auto-fetch is enabled and no node labels are provided.
@@ -345,6 +467,7 @@ class NodeModel(ModelBase[NodeModelSettings]):
         """
         target_node_model: Optional["NodeModel"] = None
         match_queries, return_queries = [], []
+        auto_fetch_parameters: Dict[str, Any] = {}
         do_auto_fetch: bool = False
 
         logger.info(
@@ -388,7 +511,11 @@ class NodeModel(ModelBase[NodeModelSettings]):
                 raise UnregisteredModel(f"with labels {labels}")
 
             logger.debug("Model with labels %s is registered, building auto-fetch query", labels)
-            match_queries, return_queries = target_node_model._build_auto_fetch(  # pylint: disable=protected-access
+            (
+                match_queries,
+                return_queries,
+                auto_fetch_parameters,
+            ) = target_node_model._build_auto_fetch(  # pylint: disable=protected-access
                 ref="m", nodes_to_fetch=auto_fetch_models
             )
 
@@ -408,65 +535,33 @@ class NodeModel(ModelBase[NodeModelSettings]):
                     {f"AND {self._query_builder.query['where']}" if self._query_builder.query['where'] != "" else ""}
                 WITH DISTINCT m
                 {self._query_builder.query['options']}
-                {" ".join(f"OPTIONAL MATCH {match_query}" for match_query in match_queries) if do_auto_fetch else ""}
+                {" ".join(match_queries) if do_auto_fetch else ""}
                 {projection_query}{f', {", ".join(return_queries)}' if do_auto_fetch else ''}
             """,
             parameters={
                 "element_id": self._element_id,
                 **self._query_builder.parameters,
+                **auto_fetch_parameters,
             },
         )
 
-        instances: List[Union["NodeModel", Dict[str, Any]]] = []
-
         logger.debug("Building instances from results")
-        if do_auto_fetch:
-            # Add auto-fetched nodes to relationship properties
-            # We need to keep track of which nodes have been added to which relationship property
-            instance_map: Dict[str, Set[str]] = {}
-
-            logger.debug("Adding auto-fetched nodes to relationship properties")
-            for result_list in results:
-                for index, result in enumerate(result_list):
-                    target_instance_element_id = getattr(result_list[0], "_element_id", None)
-                    instance_element_id = getattr(result, "_element_id", None)
+        if do_auto_fetch and target_node_model is not None:
+            return target_node_model._inflate_auto_fetch_results(  # pylint: disable=protected-access
+                results=results, meta=meta
+            )
 
-                    if instance_element_id is None or target_instance_element_id is None:
-                        continue
+        instances: List[Union["NodeModel", Dict[str, Any]]] = []
 
-                    # If we are at the first result, we are dealing with a instance of the target node model
-                    # and need to add it to the instances list
-                    if index == 0 and target_node_model is not None and instance_element_id not in instance_map:
-                        instances.append(
-                            target_node_model._inflate(graph_entity=result) if isinstance(result, Node) else result
-                        )
-                        instance_map[instance_element_id] = set()
-
-                    # If we are not at the first result, we are dealing with a instance of a auto-fetched
-                    # node and need to add it to the relationship property of the target node model
-                    elif index != 0 and instance_element_id not in instance_map[target_instance_element_id]:
-                        target_instance = [
-                            instance
-                            for instance in instances
-                            if getattr(result_list[0], "_element_id") == getattr(instance, "_element_id")
-                        ][0]
-
-                        # The meta list contains the names of the relationship properties
-                        relationship_property = getattr(target_instance, meta[index])
-                        nodes = cast(List[str], getattr(relationship_property, "_nodes"))
-                        nodes.append(result)
-
-                        instance_map[target_instance_element_id].add(instance_element_id)
-        else:
-            for result_list in results:
-                for result in result_list:
-                    if result is None:
-                        continue
+        for result_list in results:
+            for result in result_list:
+                if result is None:
+                    continue
 
-                    if isinstance(result, list):
-                        instances.extend(result)
-                    else:
-                        instances.append(result)
+                if isinstance(result, list):
+                    instances.extend(result)
+                else:
+                    instances.append(result)
 
         return instances
 
@@ -477,7 +572,7 @@ class NodeModel(ModelBase[NodeModelSettings]):
         filters: NodeFilters,
         projections: Optional[Projection] = None,
         auto_fetch_nodes: Optional[bool] = None,
-        auto_fetch_models: Optional[List[Union[str, Type["NodeModel"]]]] = None,
+        auto_fetch_models: Optional[List[Union[str, Type["NodeModel"], AutoFetchModel]]] = None,
         raise_on_empty: bool = False,
     ) -> Optional[Union[T, Dict[str, Any]]]:
         """
@@ -491,8 +586,10 @@ class NodeModel(ModelBase[NodeModelSettings]):
                 or empty projection will result in the whole model instance being returned. Defaults to `None`.
             auto_fetch_nodes (bool, optional): Whether to automatically fetch connected nodes. Takes priority over the
                 identical option defined in `Settings`. Can not be used with projections. Defaults to `None`.
-            auto_fetch_models (List[Union[str, Type["NodeModel"]]], optional): A list of models to auto-fetch.
-                `auto_fetch_nodes` has to be set to `True` for this to have any effect. Defaults to `[]`.
+            auto_fetch_models (List[Union[str, Type["NodeModel"], AutoFetchModel]], optional): A list of models to
+                auto-fetch. Relationship-properties can be selected by name with a dictionary, which can define
+                filters and options applied to the auto-fetched nodes. `auto_fetch_nodes` has to be set to `True` for
+                this to have any effect. Defaults to `[]`.
             raise_on_empty (bool, optional): Whether to raise an `NoResultFound` if no match is found. Defaults to
                 `False`.
 
@@ -513,7 +610,9 @@ class NodeModel(ModelBase[NodeModelSettings]):
         cls._query_builder.node_filters(filters=filters)
 
         if projections is not None:
-            cls._query_builder.build_projections(projections=projections)
+            cls._query_builder.build_projections(
+                projections=projections, relationship_resolver=cls._resolve_projection_relationship
+            )
 
         if cls._query_builder.query["where"] == "":
             raise InvalidFilters()
@@ -526,13 +625,22 @@ class NodeModel(ModelBase[NodeModelSettings]):
             ]
         )
 
+        if not do_auto_fetch and projections is None and list(filters.keys()) == ["$elementId"]:
+            # Lookups by element id can be served from the entity cache, if it is enabled
+            cached_instance = cls._client._get_cached_entity(cast(Optional[str], filters["$elementId"]))
+
+            if isinstance(cached_instance, cls):
+                return cached_instance
+
         if do_auto_fetch:
             # If auto-fetch is enabled, we need to build the auto-fetch queries in addition to the normal query
             logger.debug("Querying database with auto-fetch enabled")
             projection_query = (
                 "RETURN n" if cls._query_builder.query["projections"] == "" else cls._query_builder.query["projections"]
             )
-            match_queries, return_queries = cls._build_auto_fetch(nodes_to_fetch=auto_fetch_models)
+            match_queries, return_queries, auto_fetch_parameters = cls._build_auto_fetch(
+                nodes_to_fetch=auto_fetch_models
+            )
 
             results, meta = await cls._client.cypher(
                 query=f"""
@@ -540,10 +648,10 @@ class NodeModel(ModelBase[NodeModelSettings]):
                     WHERE {cls._query_builder.query['where']}
                     WITH DISTINCT n
                     LIMIT 1
-                    {" ".join(f"OPTIONAL MATCH {match_query}" for match_query in match_queries)}
+                    {" ".join(match_queries)}
                     {projection_query}, {', '.join(return_queries)}
                 """,
-                parameters=cls._query_builder.parameters,
+                parameters={**cls._query_builder.parameters, **auto_fetch_parameters},
             )
         else:
             logger.debug("Querying database without auto-fetch")
@@ -553,7 +661,7 @@ class NodeModel(ModelBase[NodeModelSettings]):
                 else cls._query_builder.query["projections"]
             )
 
-            results, meta = await cls._client.cypher(
+            results, meta = await cls._cached_cypher(
                 query=f"""
                     MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
                     WHERE {cls._query_builder.query['where']}
@@ -575,6 +683,9 @@ class NodeModel(ModelBase[NodeModelSettings]):
                 raise NoResultFound(filters)
             return None
 
+        if do_auto_fetch:
+            return cls._inflate_auto_fetch_results(results=results, meta=meta)[0]
+
         # Normalize results to a single instance
         if isinstance(results[0][0], Node):
             instance = cls._inflate(graph_entity=results[0][0])
@@ -583,25 +694,147 @@ class NodeModel(ModelBase[NodeModelSettings]):
         else:
             instance = results[0][0]
 
-        if not do_auto_fetch:
-            return instance
+        return instance
+
+    @classmethod
+    @hooks
+    async def get(cls: Type[T], **unique_key: Any) -> Optional[T]:
+        """
+        Gets the node with the given value for a property with a uniqueness constraint. The lookup skips the
+        filter pipeline and uses a statement which is compiled once per model and property, so the database can
+        resolve it with the index backing the uniqueness constraint.
+
+        Args:
+            unique_key (Any): A single keyword argument with the name of the unique property and the value to
+                look up.
 
-        # Add auto-fetched nodes to relationship properties
-        added_nodes: Set[str] = set()
+        Raises:
+            InvalidUniqueKey: If not exactly one property is provided or the property is not unique.
 
-        logger.debug("Adding auto-fetched nodes to relationship properties")
+        Returns:
+            Optional[T]: The matched model instance or `None` if no node has the given value.
+        """
+        logger.info("Getting node of model %s by unique key %s", cls.__name__, unique_key)
+        property_name, value = cls._get_unique_key(unique_key)
+        query, _ = cls._get_unique_key_queries(property_name)
+
+        results, _ = await cls._cached_cypher(query=query, parameters={"_unique_value": value})
+
+        logger.debug("Checking if query returned a result")
+        if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
+            return None
+
+        if isinstance(results[0][0], Node):
+            return cls._inflate(graph_entity=results[0][0])
+
+        return results[0][0]
+
+    @classmethod
+    @hooks
+    async def get_many(cls: Type[T], **unique_keys: List[Any]) -> List[Optional[T]]:
+        """
+        Gets the nodes with the given values for a property with a uniqueness constraint using a single query. Like
+        `get()`, the lookup skips the filter pipeline and uses a precompiled statement.
+
+        Args:
+            unique_keys (List[Any]): A single keyword argument with the name of the unique property and a list of
+                values to look up.
+
+        Raises:
+            InvalidUniqueKey: If not exactly one property is provided or the property is not unique.
+
+        Returns:
+            List[Optional[T]]: The model instances in the same order as the provided values. If no node has a value,
+                `None` is returned at its position.
+        """
+        logger.info("Getting nodes of model %s by unique keys %s", cls.__name__, unique_keys)
+        property_name, values = cls._get_unique_key(unique_keys)
+        _, query = cls._get_unique_key_queries(property_name)
+
+        if len(values) == 0:
+            return []
+
+        results, _ = await cls._cached_cypher(query=query, parameters={"_unique_values": list(values)})
+        found: Dict[int, T] = {}
+
+        # Results are mapped back by the position of the value, since values are not guaranteed to be hashable
         for result_list in results:
-            for index, result in enumerate(result_list[1:]):
-                if result is not None:
-                    relationship_property = getattr(instance, meta[index + 1])
-                    nodes = cast(List[str], getattr(relationship_property, "_nodes"))
-                    element_id = getattr(result, "_element_id")
+            if len(result_list) < 2 or result_list[1] is None:
+                continue
+
+            if isinstance(result_list[1], Node):
+                found[result_list[0]] = cls._inflate(graph_entity=result_list[1])
+            else:
+                found[result_list[0]] = result_list[1]
 
-                    if element_id not in added_nodes:
-                        nodes.append(result)
-                        added_nodes.add(element_id)
+        return [found.get(index, None) for index in range(len(values))]
 
-        return instance
+    @classmethod
+    @hooks
+    async def find_by_element_ids(cls: Type[T], element_ids: List[str]) -> List[Optional[T]]:
+        """
+        Gets the nodes with the given element IDs using a single query. Compared to `find_many()` with a `$or`
+        of `$elementId` filters, the element IDs are passed as a list parameter and each node is looked up by its
+        element ID.
+
+        Args:
+            element_ids (List[str]): The element IDs of the nodes.
+
+        Returns:
+            List[Optional[T]]: The model instances in the same order as `element_ids`. If no node of the model
+                exists for a element ID, `None` is returned at its position.
+        """
+        logger.info("Getting %s nodes of model %s by element id", len(element_ids), cls.__name__)
+        return await cls._find_by_element_ids(
+            element_ids=list(element_ids),
+            match_query=cls._query_builder.node_match(list(cls._settings.labels)),
+            ref="n",
+        )
+
+    @classmethod
+    @hooks
+    async def refresh_many(cls: Type[T], instances: List[T]) -> List[T]:
+        """
+        Refreshes all provided instances with the corresponding values from the graph using a single query.
+
+        Args:
+            instances (List[T]): The hydrated model instances to refresh.
+
+        Raises:
+            InvalidTargetNode: If a instance is not a instance of the model.
+            InstanceNotHydrated: If a instance has not been hydrated yet.
+            InstanceDestroyed: If a instance has been destroyed.
+            UnexpectedEmptyResult: If the node of a instance does not exist anymore. In this case, no instance is
+                refreshed.
+
+        Returns:
+            List[T]: The provided instances.
+        """
+        logger.info("Refreshing %s nodes of model %s with values from database", len(instances), cls.__name__)
+        for instance in instances:
+            if not isinstance(instance, cls):
+                raise InvalidTargetNode(expected_type=cls.__name__, actual_type=instance.__class__.__name__)
+            if getattr(instance, "_destroyed", False):
+                raise InstanceDestroyed()
+            if getattr(instance, "_element_id", None) is None or getattr(instance, "_id", None) is None:
+                raise InstanceNotHydrated()
+
+        refreshed_instances = await cls._find_by_element_ids(
+            element_ids=[cast(str, instance._element_id) for instance in instances],
+            match_query=cls._query_builder.node_match(list(cls._settings.labels)),
+            ref="n",
+        )
+
+        # If any of the nodes does not exist anymore, we do not refresh any instance
+        logger.debug("Checking if query returned a result for all instances")
+        if any(refreshed_instance is None for refreshed_instance in refreshed_instances):
+            raise UnexpectedEmptyResult()
+
+        logger.debug("Updating instances")
+        for instance, refreshed_instance in zip(instances, refreshed_instances):
+            instance._refresh_from(refreshed_instance)
+
+        return instances
 
     @classmethod
     @hooks
@@ -611,7 +844,7 @@ class NodeModel(ModelBase[NodeModelSettings]):
         projections: Optional[Projection] = None,
         options: Optional[QueryOptions] = None,
         auto_fetch_nodes: Optional[bool] = None,
-        auto_fetch_models: Optional[List[Union[str, Type["NodeModel"]]]] = None,
+        auto_fetch_models: Optional[List[Union[str, Type["NodeModel"], AutoFetchModel]]] = None,
     ) -> List[Union[T, Dict[str, Any]]]:
         """
         Finds the all nodes that matches `filters` and returns them. If no matches are found, an
@@ -625,8 +858,10 @@ class NodeModel(ModelBase[NodeModelSettings]):
             options (QueryOptions, optional): The options to apply to the query. Defaults to `None`.
             auto_fetch_nodes (bool, optional): Whether to automatically fetch connected nodes. Takes priority over the
                 identical option defined in `Settings`. Defaults to `None`.
-            auto_fetch_models (List[Union[str, Type["NodeModel"]]], optional): A list of models to auto-fetch.
-                `auto_fetch_nodes` has to be set to `True` for this to have any effect. Defaults to `[]`.
+            auto_fetch_models (List[Union[str, Type["NodeModel"], AutoFetchModel]], optional): A list of models to
+                auto-fetch. Relationship-properties can be selected by name with a dictionary, which can define
+                filters and options applied to the auto-fetched nodes. `auto_fetch_nodes` has to be set to `True` for
+                this to have any effect. Defaults to `[]`.
 
         Returns:
             List[T | Dict[str, Any]]: A list of model instances or dictionaries of the projected properties.
@@ -639,7 +874,9 @@ class NodeModel(ModelBase[NodeModelSettings]):
         if options is not None:
             cls._query_builder.query_options(options=options)
         if projections is not None:
-            cls._query_builder.build_projections(projections=projections)
+            cls._query_builder.build_projections(
+                projections=projections, relationship_resolver=cls._resolve_projection_relationship
+            )
 
         instances: List[Union[T, Dict[str, Any]]] = []
         projection_query = (
@@ -656,7 +893,9 @@ class NodeModel(ModelBase[NodeModelSettings]):
 
         if do_auto_fetch:
             logger.debug("Querying database with auto-fetch")
-            match_queries, return_queries = cls._build_auto_fetch(nodes_to_fetch=auto_fetch_models)
+            match_queries, return_queries, auto_fetch_parameters = cls._build_auto_fetch(
+                nodes_to_fetch=auto_fetch_models
+            )
 
             results, meta = await cls._client.cypher(
                 query=f"""
@@ -664,50 +903,16 @@ class NodeModel(ModelBase[NodeModelSettings]):
                     {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
                     WITH DISTINCT n
                     {cls._query_builder.query['options']}
-                    {" ".join(f"OPTIONAL MATCH {match_query}" for match_query in match_queries)}
+                    {" ".join(match_queries)}
                     {projection_query}, {', '.join(return_queries)}
                 """,
-                parameters=cls._query_builder.parameters,
+                parameters={**cls._query_builder.parameters, **auto_fetch_parameters},
             )
 
-            # Add auto-fetched nodes to relationship properties and keep track of which nodes
-            # have been added already
-            instance_map: Dict[str, Set[str]] = {}
-
-            logger.debug("Adding auto-fetched nodes to relationship properties")
-            for result_list in results:
-                for index, result in enumerate(result_list):
-                    target_instance_element_id = getattr(result_list[0], "_element_id", None)
-                    instance_element_id = getattr(result, "_element_id", None)
-
-                    if instance_element_id is None or target_instance_element_id is None:
-                        continue
-
-                    # If we are at the first result, we are dealing with a instance of the target node model
-                    # and need to add it to the instances list
-                    if index == 0 and instance_element_id not in instance_map:
-                        instances.append(cls._inflate(graph_entity=result) if isinstance(result, Node) else result)
-
-                        instance_map[instance_element_id] = set()
-
-                    # If we are not at the first result, we are dealing with a instance of a auto-fetched
-                    # node and need to add it to the relationship property of the target node model
-                    elif index != 0 and instance_element_id not in instance_map[target_instance_element_id]:
-                        target_instance = [
-                            instance
-                            for instance in instances
-                            if getattr(result_list[0], "_element_id") == getattr(instance, "_element_id")
-                        ][0]
-                        relationship_property = getattr(target_instance, meta[index])
-                        nodes = cast(List[str], getattr(relationship_property, "_nodes"))
-                        nodes.append(result)
-
-                        instance_map[target_instance_element_id].add(instance_element_id)
-
-            return instances
+            return cls._inflate_auto_fetch_results(results=results, meta=meta)
         else:
             logger.debug("Querying database without auto-fetch")
-            results, _ = await cls._client.cypher(
+            results, _ = await cls._cached_cypher(
                 query=f"""
                     MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
                     {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
@@ -729,10 +934,148 @@ class NodeModel(ModelBase[NodeModelSettings]):
 
             return instances
 
+    @classmethod
+    @hooks
+    async def prefetch(
+        cls: Type[T],
+        instances: List[T],
+        relationship_properties: Optional[List[str]] = None,
+    ) -> List[T]:
+        """
+        Fetches the connected nodes of the given relationship properties for all provided instances at once. A
+        single query is used for all instances and relationship properties, which avoids calling
+        `find_connected_nodes()` for each instance. The fetched nodes are available at the
+        `instance.<relationship-property>.nodes` property and replace any previously fetched nodes.
+
+        Args:
+            instances (List[T]): The hydrated model instances to fetch the connected nodes for.
+            relationship_properties (List[str] | None, optional): The names of the relationship properties to fetch.
+                If `None`, all relationship properties defined on the model are fetched. Defaults to `None`.
+
+        Raises:
+            InvalidTargetNode: If a instance is not a instance of the model.
+            InstanceNotHydrated: If a instance has not been hydrated yet.
+            InstanceDestroyed: If a instance has been destroyed.
+            UnknownRelationshipProperty: If the model does not define one of the relationship properties.
+
+        Returns:
+            List[T]: The provided instances.
+        """
+        logger.info(
+            "Prefetching relationship properties %s for %s instances of model %s",
+            relationship_properties,
+            len(instances),
+            cls.__name__,
+        )
+        for property_name in relationship_properties or []:
+            if property_name not in cls._relationship_properties:
+                raise UnknownRelationshipProperty(model=cls.__name__, property_name=property_name)
+
+        instance_map: Dict[str, List[T]] = {}
+
+        for instance in instances:
+            if not isinstance(instance, cls):
+                raise InvalidTargetNode(expected_type=cls.__name__, actual_type=instance.__class__.__name__)
+            if getattr(instance, "_destroyed", False):
+                raise InstanceDestroyed()
+            if getattr(instance, "_element_id", None) is None or getattr(instance, "_id", None) is None:
+                raise InstanceNotHydrated()
+
+            instance_map.setdefault(cast(str, instance._element_id), []).append(instance)
+
+        if len(instance_map) == 0:
+            return instances
+
+        match_queries, return_queries, parameters = cls._build_auto_fetch(
+            relationship_properties=relationship_properties
+        )
+
+        if len(return_queries) == 0:
+            return instances
+
+        results, meta = await cls._client.cypher(
+            query=f"""
+                UNWIND $_prefetch_element_ids AS element_id
+                MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
+                WHERE elementId(n) = element_id
+                {" ".join(match_queries)}
+                RETURN element_id, {', '.join(return_queries)}
+            """,
+            parameters={"_prefetch_element_ids": list(instance_map.keys()), **parameters},
+            resolve_models=False,
+        )
+
+        logger.debug("Adding prefetched nodes to relationship properties")
+        for result_list in results:
+            for index, fetched_nodes in enumerate(result_list[1:], start=1):
+                nodes: List[Any] = []
+
+                for fetched_node in fetched_nodes or []:
+                    resolved = cls._client._resolve_database_model(fetched_node)
+                    nodes.append(resolved if resolved is not None else fetched_node)
+
+                # The meta list contains the names of the relationship properties
+                for instance in instance_map.get(result_list[0], []):
+                    setattr(getattr(instance, meta[index]), "_nodes", list(nodes))
+
+        return instances
+
+    @classmethod
+    async def iter_many(
+        cls: Type[T],
+        order_by: str,
+        filters: Optional[NodeFilters] = None,
+        batch_size: int = 1000,
+        order: QueryOptionsOrder = QueryOptionsOrder.ASCENDING,
+    ) -> AsyncGenerator[T, None]:
+        """
+        Iterates over all nodes that match `filters` in batches of `batch_size`. Unlike `find_many()` with the
+        `skip` option, each batch continues after the sort key of the last node of the previous batch, which keeps
+        the cost of each batch constant and only holds one batch in memory at a time. The next batch is fetched
+        while the current one is being processed.
+
+        Args:
+            order_by (str): The property to sort the nodes by. Has to be backed by a range index or uniqueness
+                constraint and should be unique or near-unique, since nodes with the same value are only told apart
+                by a residual filter on their element ID. Nodes where this property is not set are skipped.
+            filters (NodeFilters, optional): The filters to apply to the query. Defaults to `None`.
+            batch_size (int, optional): The number of nodes fetched per batch. Defaults to `1000`.
+            order (QueryOptionsOrder, optional): The sort direction. Defaults to `QueryOptionsOrder.ASCENDING`.
+
+        Raises:
+            ValueError: If `batch_size` is not a positive integer.
+            UnknownProperty: If the model does not define the `order_by` property.
+            UnindexedProperty: If the `order_by` property is not backed by a range index or uniqueness constraint.
+
+        Yields:
+            T: The matched model instances.
+        """
+        logger.info("Iterating over nodes of model %s matching filters %s", cls.__name__, filters)
+        cls._query_builder.reset_query()
+
+        if filters is not None:
+            cls._query_builder.node_filters(filters=filters)
+
+        async for instance in cls._iter_keyset_pages(
+            match_query=cls._query_builder.node_match(list(cls._settings.labels)),
+            where_query=cls._query_builder.query["where"],
+            parameters=cls._query_builder.parameters,
+            batch_size=batch_size,
+            order_by=order_by,
+            order=order,
+            ref="n",
+        ):
+            yield instance
+
     @classmethod
     @hooks
     async def update_one(
-        cls: Type[T], update: Dict[str, Any], filters: NodeFilters, new: bool = False, raise_on_empty: bool = False
+        cls: Type[T],
+        update: Dict[str, Any],
+        filters: NodeFilters,
+        new: bool = False,
+        raise_on_empty: bool = False,
+        expected_version: Optional[int] = None,
     ) -> Optional[T]:
         """
         Finds the first node that matches `filters` and updates it with the values defined by
@@ -745,84 +1088,53 @@ class NodeModel(ModelBase[NodeModelSettings]):
                 returned. Defaults to `False`.
             raise_on_empty (bool, optional): Whether to raise an `NoResultFound` if no match is found. Defaults to
                 `False`.
+            expected_version (int, optional): The version the matched node must have. Requires a `version_field`
+                to be defined in the model settings. Defaults to `None`.
 
         Raises:
             InvalidFilters: If no filters or invalid filters are provided.
             NoResultFound: If no match is found and `raise_on_empty` is set to `True`.
+            VersionConflict: If the version of the matched node does not match `expected_version`.
 
         Returns:
             T | None: By default, the old node instance is returned. If `new` is set to `True`, the result
                 will be the `updated` instance.
         """
-        new_instance: T
-
         logger.info(
             "Updating first encountered node of model %s matching filters %s",
             cls.__name__,
             filters,
         )
-        logger.debug(
-            "Getting first encountered node of model %s matching filters %s",
-            cls.__name__,
-            filters,
-        )
         cls._query_builder.reset_query()
         cls._query_builder.node_filters(filters=filters)
 
         if cls._query_builder.query["where"] == "":
             raise InvalidFilters()
 
-        results, _ = await cls._client.cypher(
-            query=f"""
-                MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
-                WHERE {cls._query_builder.query['where']}
-                RETURN DISTINCT n
-                LIMIT 1
-            """,
+        results = await cls._update_entities(
+            match_query=cls._query_builder.node_match(list(cls._settings.labels)),
+            where_query=cls._query_builder.query["where"],
             parameters=cls._query_builder.parameters,
+            update=update,
+            ref="n",
+            limit=1,
+            expected_version=expected_version,
         )
+        cls._client._invalidate_query_caches(cls._settings.labels)
 
         logger.debug("Checking if query returned a result")
-        if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
+        if len(results) == 0:
             if raise_on_empty:
                 raise NoResultFound(filters)
             return None
 
-        old_instance = results[0][0] if isinstance(results[0][0], cls) else cls._inflate(graph_entity=results[0][0])
-
-        # Update existing instance with values and save
-        logger.debug("Creating instance copy with new values %s", update)
-        new_instance = cls(**cast(T, old_instance)._deflate())
-
-        for key, value in update.items():
-            if key in get_model_fields(cls):
-                setattr(new_instance, key, value)
-        setattr(new_instance, "_element_id", getattr(old_instance, "_element_id", None))
-        setattr(new_instance, "_id", getattr(old_instance, "_id", None))
-
-        deflated = new_instance._deflate()
-        set_query = ", ".join(
-            [
-                f"n.{property_name} = ${property_name}"
-                for property_name in deflated
-                if property_name in new_instance.modified_properties
-            ]
-        )
-
-        await cls._client.cypher(
-            query=f"""
-                MATCH {cls._query_builder.node_match(list(new_instance._settings.labels))}
-                WHERE elementId(n) = $element_id
-                {f"SET {set_query}" if set_query != "" else ""}
-            """,
-            parameters={"element_id": new_instance._element_id, **deflated},
-        )
+        new_instance = cls._inflate(graph_entity=results[0][1])
         logger.debug("Successfully updated node %s", getattr(new_instance, "_element_id"))
 
         if new:
             return new_instance
 
-        return old_instance
+        return cls._inflate_previous_state(properties=results[0][0], instance=new_instance)
 
     @classmethod
     @hooks
@@ -831,6 +1143,7 @@ class NodeModel(ModelBase[NodeModelSettings]):
         update: Dict[str, Any],
         filters: Optional[NodeFilters] = None,
         new: bool = False,
+        expected_version: Optional[int] = None,
     ) -> List[T]:
         """
         Finds all nodes that match `filters` and updates them with the values defined by `update`.
@@ -840,77 +1153,49 @@ class NodeModel(ModelBase[NodeModelSettings]):
             filters (NodeFilters, optional): The filters to apply to the query. Defaults to `None`.
             new (bool, optional): Whether to return the updated nodes. By default, the old nodes
                 is returned. Defaults to `False`.
+            expected_version (int, optional): The version all matched nodes must have. Requires a `version_field`
+                to be defined in the model settings. Defaults to `None`.
+
+        Raises:
+            VersionConflict: If the version of a matched node does not match `expected_version`. No node is
+                updated in this case.
 
         Returns:
             List[T]: By default, the old node instances are returned. If `new` is set to `True`,
                 the result will be the `updated/created instances`.
         """
-        new_instance: T
+        instances: List[T] = []
 
         logger.info("Updating all nodes of model %s matching filters %s", cls.__name__, filters)
         cls._query_builder.reset_query()
         if filters is not None:
             cls._query_builder.node_filters(filters=filters)
 
-        logger.debug("Getting all nodes of model %s matching filters %s", cls.__name__, filters)
-        results, _ = await cls._client.cypher(
-            query=f"""
-                MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
-                {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
-                RETURN DISTINCT n
-            """,
+        results = await cls._update_entities(
+            match_query=cls._query_builder.node_match(list(cls._settings.labels)),
+            where_query=cls._query_builder.query["where"],
             parameters=cls._query_builder.parameters,
+            update=update,
+            ref="n",
+            expected_version=expected_version,
         )
+        cls._client._invalidate_query_caches(cls._settings.labels)
 
-        old_instances: List[T] = []
-
+        logger.debug("Building instances from results")
         for result_list in results:
-            for result in result_list:
-                if result is None:
-                    continue
-
-                old_instances.append(cls._inflate(graph_entity=result) if isinstance(result, Node) else result)
+            new_instance = cls._inflate(graph_entity=result_list[1])
 
-        logger.debug("Checking if query returned a result")
-        if len(old_instances) == 0:
-            logger.debug("No results found")
-            return []
-
-        # Try and parse update values into random instance to check validation
-        logger.debug("Creating instance copy with new values %s", update)
-        new_instance = cls(**old_instances[0]._deflate())
-        for key, value in update.items():
-            if key in get_model_fields(cls):
-                setattr(new_instance, key, value)
-
-        deflated_properties = new_instance._deflate()
-
-        # Update instances
-        results, _ = await cls._client.cypher(
-            query=f"""
-                MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
-                {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
-                SET {", ".join([f"n.{property_name} = ${property_name}" for property_name in deflated_properties if property_name in update])}
-                RETURN DISTINCT n
-            """,
-            parameters={**deflated_properties, **cls._query_builder.parameters},
-        )
+            if new:
+                instances.append(new_instance)
+            else:
+                instances.append(cls._inflate_previous_state(properties=result_list[0], instance=new_instance))
 
         logger.debug(
             "Successfully updated %s nodes %s",
-            len(old_instances),
-            [getattr(instance, "_element_id") for instance in old_instances],
+            len(instances),
+            [getattr(instance, "_element_id") for instance in instances],
         )
-        logger.debug("Building instances from results")
-        if new:
-            instances: List[T] = []
-
-            for result_list in results:
-                for result in result_list:
-                    if result is not None:
-                        instances.append(result)
-            return instances
-        return old_instances
+        return instances
 
     @classmethod
     @hooks
@@ -954,6 +1239,8 @@ class NodeModel(ModelBase[NodeModelSettings]):
             """,
             parameters=cls._query_builder.parameters,
         )
+        cls._client._invalidate_query_caches(cls._settings.labels)
+        cls._client._invalidate_cached_entities(labels=cls._settings.labels)
 
         logger.debug("Checking if query returned a result")
         if len(result) == 0 or len(result[0]) == 0 or result[0][0] is None:
@@ -990,6 +1277,8 @@ class NodeModel(ModelBase[NodeModelSettings]):
             """,
             parameters=cls._query_builder.parameters,
         )
+        cls._client._invalidate_query_caches(cls._settings.labels)
+        cls._client._invalidate_cached_entities(labels=cls._settings.labels)
 
         logger.debug("Checking if query returned a result")
         if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
@@ -1019,7 +1308,7 @@ class NodeModel(ModelBase[NodeModelSettings]):
         if filters is not None:
             cls._query_builder.node_filters(filters=filters)
 
-        results, _ = await cls._client.cypher(
+        results, _ = await cls._cached_cypher(
             query=f"""
                 MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
                 {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
@@ -1034,6 +1323,180 @@ class NodeModel(ModelBase[NodeModelSettings]):
 
         return results[0][0]
 
+    @classmethod
+    @hooks
+    async def exists(cls: Type[T], filters: Optional[NodeFilters] = None) -> bool:
+        """
+        Checks whether at least one node matches the provided `filters` parameter. Unlike `count()`, the query
+        stops at the first match and no model instance is built.
+
+        Args:
+            filters (NodeFilters, optional): The filters to apply to the query. Defaults to `None`.
+
+        Returns:
+            bool: Whether a matching node exists.
+        """
+        logger.info(
+            "Checking if node of model %s matching filters %s exists",
+            cls.__name__,
+            filters,
+        )
+        cls._query_builder.reset_query()
+        if filters is not None:
+            cls._query_builder.node_filters(filters=filters)
+
+        results, _ = await cls._cached_cypher(
+            query=f"""
+                RETURN EXISTS {{
+                    MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
+                    {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
+                }} AS has_match
+            """,
+            parameters=cls._query_builder.parameters,
+        )
+
+        logger.debug("Checking if query returned a result")
+        if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
+            raise UnexpectedEmptyResult()
+
+        return results[0][0]
+
+    @classmethod
+    @hooks
+    async def aggregate(
+        cls: Type[T],
+        filters: Optional[NodeFilters] = None,
+        group_by: Optional[List[str]] = None,
+        metrics: Optional[AggregationMetrics] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregates the properties of all nodes which match the provided `filters` parameter on the database
+        instead of loading the nodes into model instances.
+
+        Args:
+            filters (NodeFilters, optional): The filters to apply to the query. Defaults to `None`.
+            group_by (List[str], optional): The properties to group the nodes by. If `None`, all matched nodes are
+                aggregated into a single row. Defaults to `None`.
+            metrics (AggregationMetrics, optional): The metrics to compute for each group. The key defines the
+                name of the metric and the value is a tuple of the aggregation function and the property to aggregate.
+                Use `None` as the property with the `count` function to count the nodes. Defaults to `None`.
+
+        Raises:
+            ValueError: If no property to group by and no metric is provided, if a property is not defined on the
+                model or if a metric uses a unknown aggregation function.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per group containing the grouped properties and the metrics.
+        """
+        logger.info(
+            "Aggregating nodes of model %s matching filters %s with metrics %s grouped by %s",
+            cls.__name__,
+            filters,
+            metrics,
+            group_by,
+        )
+        return_query, keys = cls._build_aggregation_query(group_by=group_by, metrics=metrics, ref="n")
+
+        cls._query_builder.reset_query()
+        if filters is not None:
+            cls._query_builder.node_filters(filters=filters)
+
+        results, _ = await cls._cached_cypher(
+            query=f"""
+                MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
+                {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
+                WITH DISTINCT n
+                {return_query}
+            """,
+            parameters=cls._query_builder.parameters,
+        )
+
+        return [dict(zip(keys, result_list)) for result_list in results]
+
+    @classmethod
+    @hooks
+    async def facets(
+        cls: Type[T],
+        filters: Optional[NodeFilters] = None,
+        fields: Optional[List[str]] = None,
+        limit_per_field: Optional[int] = None,
+    ) -> Dict[str, Dict[Any, int]]:
+        """
+        Counts the distinct values of multiple properties for all nodes which match the provided `filters`
+        parameter. The filters are only evaluated once and the values of each property are counted in a separate
+        `CALL` subquery of the same query.
+
+        Args:
+            filters (NodeFilters, optional): The filters to apply to the query. Defaults to `None`.
+            fields (List[str], optional): The properties to count the distinct values of. Defaults to `None`.
+            limit_per_field (int, optional): The maximum number of values returned per property. If provided, only
+                the most common values are returned. Defaults to `None`.
+
+        Raises:
+            ValueError: If a property is not defined on the model or `limit_per_field` is not a positive integer.
+
+        Returns:
+            Dict[str, Dict[Any, int]]: A dictionary mapping each property to a dictionary of its distinct values
+                and the number of nodes with each value, ordered from the most to the least common value. Nodes
+                without the property are not counted. List values are returned as tuples.
+        """
+        logger.info(
+            "Getting facets %s of nodes of model %s matching filters %s",
+            fields,
+            cls.__name__,
+            filters,
+        )
+        fields = fields or []
+
+        if limit_per_field is not None and limit_per_field <= 0:
+            raise ValueError("limit_per_field must be a positive integer")
+        if len(fields) == 0:
+            return {}
+
+        facet_queries: List[str] = []
+        for index, field in enumerate(fields):
+            property_query = cls._build_property_query(field, "n")
+
+            facet_queries.append(
+                f"""
+                CALL {{
+                    WITH matched_nodes
+                    UNWIND matched_nodes AS n
+                    WITH n
+                    WHERE {property_query} IS NOT NULL
+                    WITH {property_query} AS value, count(*) AS value_count
+                    ORDER BY value_count DESC, value ASC
+                    {"LIMIT $_facet_limit" if limit_per_field is not None else ""}
+                    RETURN collect([value, value_count]) AS facet_{index}
+                }}
+                """
+            )
+
+        cls._query_builder.reset_query()
+        if filters is not None:
+            cls._query_builder.node_filters(filters=filters)
+
+        results, _ = await cls._cached_cypher(
+            query=f"""
+                MATCH {cls._query_builder.node_match(list(cls._settings.labels))}
+                {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
+                WITH collect(DISTINCT n) AS matched_nodes
+                {" ".join(facet_queries)}
+                RETURN {", ".join([f"facet_{index}" for index in range(len(fields))])}
+            """,
+            parameters={**cls._query_builder.parameters, "_facet_limit": limit_per_field},
+        )
+
+        logger.debug("Checking if query returned a result")
+        if len(results) == 0 or len(results[0]) != len(fields):
+            raise UnexpectedEmptyResult()
+
+        facets: Dict[str, Dict[Any, int]] = {}
+        for field, facet in zip(fields, results[0]):
+            facets[field] = {tuple(value) if isinstance(value, list) else value: count for value, count in facet}
+
+        return facets
+
     @classmethod
     def _register_relationship_properties(cls) -> None:
         """
@@ -1044,17 +1507,22 @@ class NodeModel(ModelBase[NodeModelSettings]):
             # Check if value is None here to prevent breaking logic if property_name is of type None
             if get_field_type(value) is not None and hasattr(get_field_type(value), "_build_property"):
                 cls._relationship_properties.add(property_name)
+                cls._relationship_property_definitions[property_name] = cast(RelationshipProperty, value.default)
 
-    def _deflate(self) -> Dict[str, Any]:
+    def _deflate(self, include: Optional[Set[str]] = None) -> Dict[str, Any]:
         """
         Deflates the current model instance into a python dictionary which can be stored in Neo4j.
 
+        Args:
+            include (Set[str], optional): The properties to deflate. If not provided, all properties are deflated.
+                Defaults to `None`.
+
         Returns:
             Dict[str, Any]: The deflated model instance.
         """
         logger.debug("Deflating model %s to storable dictionary", self)
-        deflated: Dict[str, Any] = json.loads(
-            get_model_dump_json(self, exclude={*self._relationship_properties, "_settings"})
+        deflated: Dict[str, Any] = get_model_dump_jsonable(
+            self, include=include, exclude={*self._relationship_properties, "_settings"}
         )
 
         return super()._deflate(deflated=deflated)
@@ -1078,34 +1546,135 @@ class NodeModel(ModelBase[NodeModelSettings]):
         for relationship_property in cls._relationship_properties:
             inflated.pop(relationship_property, None)
 
-        instance = cls(**inflated)
+        instance = cls._hydrate(inflated)
         setattr(instance, "_element_id", graph_entity._element_id)
         setattr(instance, "_id", graph_entity._id)
         return instance
 
+    @classmethod
+    def _inflate_cached(cls: Type[T], cached_entity: CachedNode) -> T:
+        """
+        Inflates the plain data of a node from the entity cache into a instance of the current model.
+
+        Args:
+            cached_entity (CachedNode): The cached node to inflate.
+
+        Raises:
+            InflationFailure: If inflating the node fails.
+
+        Returns:
+            T: A new instance of the current model with the properties from the cached node.
+        """
+        logger.debug("Inflating cached node %s to model instance", cached_entity.element_id)
+        inflated = cls._inflate_properties(QueryCache.copy_results(cached_entity.properties))
+
+        for relationship_property in cls._relationship_properties:
+            inflated.pop(relationship_property, None)
+
+        instance = cls._hydrate(inflated)
+        setattr(instance, "_element_id", cached_entity.element_id)
+        setattr(instance, "_id", cached_entity.id)
+        return instance
+
+    @classmethod
+    def _resolve_projection_relationship(
+        cls, relationship_property: str
+    ) -> Tuple[str, RelationshipPropertyDirection, List[str], RelationshipProjectionResolver]:
+        """
+        Resolves a relationship-property used in a nested projection.
+
+        Args:
+            relationship_property (str): The name of the relationship-property.
+
+        Raises:
+            UnknownRelationshipProperty: If the model does not define the relationship-property.
+            UnregisteredModel: If the relationship or target model of the relationship-property is not registered.
+
+        Returns:
+            Tuple[str, RelationshipPropertyDirection, List[str], RelationshipProjectionResolver]: The type of the
+                relationship, the direction of the relationship-property, the labels of the target model and the
+                resolver of the target model.
+        """
+        if relationship_property not in cls._relationship_properties:
+            raise UnknownRelationshipProperty(model=cls.__name__, property_name=relationship_property)
+
+        definition = cls._relationship_property_definitions[relationship_property]
+        relationship_model_name = getattr(definition, "_relationship_model_name", None)
+        target_model_name = getattr(definition, "_target_model_name", None)
+        relationship_type: Optional[str] = None
+        target_model: Optional[Type["NodeModel"]] = None
+
+        for model in cls._client.models:
+            if model.__name__ == relationship_model_name:
+                relationship_type = cast(RelationshipModelSettings, model._settings).type
+            elif model.__name__ == target_model_name:
+                target_model = cast(Type["NodeModel"], model)
+
+        if relationship_type is None or target_model is None:
+            raise UnregisteredModel(cls.__name__)
+
+        return (
+            relationship_type,
+            getattr(definition, "_direction"),
+            list(target_model._settings.labels),
+            target_model._resolve_projection_relationship,
+        )
+
     @classmethod
     def _build_auto_fetch(
-        cls, nodes_to_fetch: Optional[List[Union[str, Type["NodeModel"]]]] = None, ref: str = "n"
-    ) -> Tuple[List[str], List[str]]:
+        cls,
+        nodes_to_fetch: Optional[List[Union[str, Type["NodeModel"], AutoFetchModel]]] = None,
+        ref: str = "n",
+        relationship_properties: Optional[List[str]] = None,
+    ) -> Tuple[List[str], List[str], Dict[str, Any]]:
         """
         Builds the auto-fetch query for the instance.
 
         Args:
-            nodes_to_fetch (List[Union[str, Type["NodeModel"]]] | None): The nodes to fetch. Can contain the actual
-                model of the node or the model name as a string. If `None`, all nodes will be fetched. Defaults to
-                `None`.
+            nodes_to_fetch (List[Union[str, Type["NodeModel"], AutoFetchModel]] | None): The nodes to fetch. Can
+                contain the actual model of the node, the model name as a string or a dictionary with the name of a
+                relationship property and the filters and options to apply to its fetched nodes. Dictionaries can
+                define a model instead of a relationship property, in which case they apply to all relationship
+                properties with the model as target model. If `None`, all nodes will be fetched. Defaults to `None`.
             ref (str, optional): The reference to use for the node. Defaults to "n".
+            relationship_properties (List[str] | None, optional): The names of the relationship properties to
+                fetch. If `None`, all relationship properties matching `nodes_to_fetch` are fetched. Defaults to
+                `None`.
+
+        Raises:
+            UnknownRelationshipProperty: If the model does not define a relationship property selected by name.
+            UnregisteredModel: If the relationship or target model of a relationship property is not registered.
 
         Returns:
-            Tuple[List[str], List[str]]: The `MATCH` and `RETURN` queries.
+            Tuple[List[str], List[str], Dict[str, Any]]: The `CALL` subqueries, the names of the relationship
+                properties they return and the parameters used by the subqueries. Each subquery collects the connected
+                nodes of a single relationship property into one list, so matching multiple relationship properties
+                does not multiply the number of returned rows.
         """
         match_queries: List[str] = []
         return_queries: List[str] = []
+        parameters: Dict[str, Any] = {}
         node_model_names: List[str] = []
+        # Options defined for a relationship property take priority over the options defined for its target model
+        property_fetch_options: Dict[str, AutoFetchModel] = {}
+        model_fetch_options: Dict[str, AutoFetchModel] = {}
 
         if nodes_to_fetch is not None:
             for node in nodes_to_fetch:
-                if isinstance(node, str):
+                if isinstance(node, dict):
+                    if "relationship_property" in node:
+                        if node["relationship_property"] not in cls._relationship_properties:
+                            raise UnknownRelationshipProperty(
+                                model=cls.__name__, property_name=node["relationship_property"]
+                            )
+
+                        property_fetch_options[node["relationship_property"]] = node
+                        continue
+
+                    model_name = node["model"] if isinstance(node["model"], str) else node["model"].__name__
+                    node_model_names.append(model_name)
+                    model_fetch_options[model_name] = node
+                elif isinstance(node, str):
                     node_model_names.append(node)
                 else:
                     node_model_names.append(node.__name__)
@@ -1114,19 +1683,23 @@ class NodeModel(ModelBase[NodeModelSettings]):
         for defined_relationship in cls._relationship_properties:
             relationship_type: Optional[str] = None
             end_node_labels: Optional[List[str]] = None
-            relationship_property = cast(RelationshipProperty, get_model_fields(cls)[defined_relationship].default)
+            relationship_property = cls._relationship_property_definitions[defined_relationship]
             direction = getattr(relationship_property, "_direction")
+            target_model_name = getattr(relationship_property, "_target_model_name")
 
             if (
                 nodes_to_fetch is not None
-                and getattr(relationship_property, "_target_model_name") not in node_model_names
+                and target_model_name not in node_model_names
+                and defined_relationship not in property_fetch_options
             ):
                 continue
+            if relationship_properties is not None and defined_relationship not in relationship_properties:
+                continue
 
             for model in cls._client.models:
                 if model.__name__ == getattr(relationship_property, "_relationship_model_name", None):
                     relationship_type = cast(RelationshipModelSettings, model._settings).type
-                elif model.__name__ == getattr(relationship_property, "_target_model_name", None):
+                elif model.__name__ == target_model_name:
                     end_node_labels = list(cast(NodeModelSettings, model._settings).labels)
                 elif relationship_type is not None and end_node_labels is not None:
                     break
@@ -1134,16 +1707,191 @@ class NodeModel(ModelBase[NodeModelSettings]):
             if relationship_type is None or end_node_labels is None:
                 raise UnregisteredModel(cls.__name__)
 
+            # Filters and options are built with a separate query builder to not overwrite the
+            # query of the surrounding query
+            query_builder = QueryBuilder()
+            query_builder.reset_query()
+            relationship_ref = f"{defined_relationship}_r"
+            fetch_options = property_fetch_options.get(
+                defined_relationship, model_fetch_options.get(target_model_name, {})
+            )
+            filters = fetch_options.get("filters", None)
+            options = fetch_options.get("options", None)
+
+            if filters is not None:
+                logger.debug("Building auto-fetch filters for relationship property %s", defined_relationship)
+                query_builder.relationship_property_filters(
+                    filters=filters,
+                    ref=relationship_ref,
+                    node_ref=defined_relationship,
+                    parameter_prefix=f"_{defined_relationship}",
+                )
+                parameters.update(query_builder.parameters)
+            if options is not None:
+                logger.debug("Building auto-fetch options for relationship property %s", defined_relationship)
+                query_builder.query_options(options=options, ref=defined_relationship)
+
+            match_query = cls._query_builder.relationship_match(
+                ref=relationship_ref,
+                type_=relationship_type,
+                start_node_ref=ref,
+                direction=direction,
+                end_node_ref=defined_relationship,
+                end_node_labels=end_node_labels,
+            )
+
             return_queries.append(defined_relationship)
             match_queries.append(
-                cls._query_builder.relationship_match(
-                    ref=None,
-                    type_=relationship_type,
-                    start_node_ref=ref,
-                    direction=direction,
-                    end_node_ref=defined_relationship,
-                    end_node_labels=end_node_labels,
-                )
+                f"""
+                CALL {{
+                    WITH {ref}
+                    MATCH {match_query}
+                    {f"WHERE {query_builder.query['where']}" if query_builder.query['where'] != "" else ""}
+                    WITH DISTINCT {defined_relationship}
+                    {query_builder.query['options']}
+                    RETURN collect({defined_relationship}) AS {defined_relationship}
+                }}
+                """
+            )
+
+        return match_queries, return_queries, parameters
+
+    @classmethod
+    def _inflate_auto_fetch_results(
+        cls: Type[T], results: List[List[Any]], meta: List[str]
+    ) -> List[Union[T, Dict[str, Any]]]:
+        """
+        Builds model instances from the results of a auto-fetch query and adds the auto-fetched nodes to their
+        relationship properties. Expects each result list to contain the matched node, followed by one list of
+        connected nodes for each relationship property returned by `_build_auto_fetch()`.
+
+        Args:
+            results (List[List[Any]]): The results of the query.
+            meta (List[str]): The keys of the query results, which contain the names of the relationship properties.
+
+        Returns:
+            List[T | Dict[str, Any]]: The matched model instances with their auto-fetched nodes.
+        """
+        instances: List[Union[T, Dict[str, Any]]] = []
+        instance_map: Dict[str, Union[T, Dict[str, Any]]] = {}
+
+        logger.debug("Adding auto-fetched nodes to relationship properties")
+        for result_list in results:
+            if len(result_list) == 0 or result_list[0] is None:
+                continue
+
+            instance = (
+                cls._inflate(graph_entity=result_list[0]) if isinstance(result_list[0], Node) else result_list[0]
+            )
+            element_id = getattr(instance, "_element_id", None)
+
+            if element_id is not None and element_id in instance_map:
+                continue
+
+            instances.append(instance)
+            if element_id is None:
+                continue
+
+            instance_map[element_id] = instance
+
+            for index, fetched_nodes in enumerate(result_list[1:], start=1):
+                # The meta list contains the names of the relationship properties
+                relationship_property = getattr(instance, meta[index])
+                nodes = cast(List[Any], getattr(relationship_property, "_nodes"))
+
+                for fetched_node in fetched_nodes or []:
+                    resolved = cls._client._resolve_database_model(fetched_node)
+                    nodes.append(resolved if resolved is not None else fetched_node)
+
+        return instances
+
+    @classmethod
+    def _get_unique_key(cls, unique_key: Dict[str, Any]) -> Tuple[str, Any]:
+        """
+        Validates that a unique key consists of exactly one property with a uniqueness constraint.
+
+        Args:
+            unique_key (Dict[str, Any]): The property names and values passed as keyword arguments.
+
+        Raises:
+            InvalidUniqueKey: If not exactly one property is provided or the property is not unique.
+
+        Returns:
+            Tuple[str, Any]: The name of the property and the provided value.
+        """
+        if len(unique_key) != 1:
+            raise InvalidUniqueKey(model=cls.__name__, properties=list(unique_key.keys()))
+
+        property_name, value = next(iter(unique_key.items()))
+        field = get_model_fields(cls).get(property_name, None)
+
+        if field is None or not getattr(get_field_type(field), "_unique", False):
+            raise InvalidUniqueKey(model=cls.__name__, properties=[property_name])
+
+        return property_name, value
+
+    @classmethod
+    def _get_unique_key_queries(cls, property_name: str) -> Tuple[str, str]:
+        """
+        Returns the statements used to look up nodes by a unique property. The statements are compiled on first use
+        and reused for all further lookups by the same property.
+
+        Args:
+            property_name (str): The name of the unique property.
+
+        Returns:
+            Tuple[str, str]: The statement for looking up a single node by the `$_unique_value` parameter and the
+                statement for looking up many nodes by the `$_unique_values` parameter.
+        """
+        if property_name not in cls._unique_key_queries:
+            logger.debug("Compiling unique key queries for property %s of model %s", property_name, cls.__name__)
+            labels = ":".join(cls._escape_identifier(label) for label in cls._settings.labels)
+            unique_property = cls._escape_identifier(property_name)
+
+            cls._unique_key_queries[property_name] = (
+                f"MATCH (n:{labels} {{{unique_property}: $_unique_value}}) RETURN n LIMIT 1",
+                (
+                    "UNWIND range(0, size($_unique_values) - 1) AS index "
+                    f"MATCH (n:{labels} {{{unique_property}: $_unique_values[index]}}) RETURN index, n"
+                ),
             )
 
-        return match_queries, return_queries
+        return cls._unique_key_queries[property_name]
+
+    @classmethod
+    async def _cached_cypher(cls: Type[T], query: str, parameters: Dict[str, Any]) -> Tuple[List[List[Any]], List[str]]:
+        """
+        Runs a read query through the query cache of the model, if one has been enabled with the `query_cache_size`
+        setting. Raw results are cached and resolved to model instances on every call, so callers never share
+        instances. The cache is bypassed while a batch transaction is running to prevent uncommitted changes from
+        being cached.
+
+        Args:
+            query (str): The query to run.
+            parameters (Dict[str, Any]): The parameters used with the query.
+
+        Returns:
+            Tuple[List[List[Any]], List[str]]: A tuple containing the query result and the names of the returned
+                variables.
+        """
+        query_cache = cls._query_cache
+
+        if query_cache is None or getattr(cls._client, "_batch_enabled", False):
+            return await cls._client.cypher(query=query, parameters=parameters)
+
+        cache_key = query_cache.build_key(query=query, parameters=parameters)
+        cached = query_cache.get(cache_key)
+
+        if cached is None:
+            logger.debug("No cached results found for model %s, querying database", cls.__name__)
+            generation = query_cache.generation
+            cached = await cls._client.cypher(query=query, parameters=parameters, resolve_models=False)
+            query_cache.set(cache_key, cached, generation=generation)
+        else:
+            logger.debug("Using cached results for model %s", cls.__name__)
+
+        raw_results, meta = cached
+        results = cast(List[List[Any]], query_cache.copy_results(raw_results))
+        cls._client._resolve_query_results(results)
+
+        return results, list(meta)
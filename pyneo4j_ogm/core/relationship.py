@@ -4,33 +4,45 @@ relationships. It provides base functionality like de-/inflation and validation
 the database for CRUD operations on relationships.
 """
 
-import json
 import re
 from functools import wraps
-from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    AsyncGenerator,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from neo4j.graph import Node, Relationship
 from pydantic import PrivateAttr
 
 from pyneo4j_ogm.core.base import ModelBase, hooks
+from pyneo4j_ogm.core.cache import CachedRelationship, QueryCache
 from pyneo4j_ogm.core.node import NodeModel
 from pyneo4j_ogm.exceptions import (
     InstanceDestroyed,
     InstanceNotHydrated,
+    InvalidEntityType,
     InvalidFilters,
     NoResultFound,
     UnexpectedEmptyResult,
+    VersionConflict,
 )
 from pyneo4j_ogm.fields.settings import RelationshipModelSettings
 from pyneo4j_ogm.logger import logger
-from pyneo4j_ogm.pydantic_utils import (
-    get_model_dump,
-    get_model_dump_json,
-    get_model_fields,
-)
+from pyneo4j_ogm.pydantic_utils import get_model_dump_jsonable
 from pyneo4j_ogm.queries.types import (
+    AggregationMetrics,
     Projection,
     QueryOptions,
+    QueryOptionsOrder,
     RelationshipFilters,
     RelationshipMatchDirection,
 )
@@ -91,20 +103,6 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
     _end_node_id: Optional[int] = PrivateAttr(default=None)
     Settings: ClassVar[Type[RelationshipModelSettings]]
 
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self._db_properties = get_model_dump(
-            self,
-            exclude={
-                "element_id",
-                "id",
-                "start_node_element_id",
-                "start_node_id",
-                "end_node_element_id",
-                "end_node_id",
-            },
-        )
-
     def __init_subclass__(cls) -> None:
         if not isinstance(getattr(cls, "_settings", None), RelationshipModelSettings):
             setattr(cls, "_settings", RelationshipModelSettings())
@@ -134,56 +132,96 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
     @ensure_alive
     async def update(self) -> None:
         """
-        Updates the corresponding relationship in the database with the current instance values.
+        Updates the corresponding relationship in the database with the current instance values. If a
+        `version_field` is defined in the model settings, the relationship is only updated if it's version still
+        matches the version of the instance and the version is incremented.
 
         Raises:
             UnexpectedEmptyResult: If the query should return a result but does not.
+            VersionConflict: If the relationship has been updated by someone else since the instance was fetched.
         """
-        deflated = self._deflate()
+        version_field = self._settings.version_field
+        modified_properties = self._modified_properties - {version_field}
+        deflated = self._deflate(include=modified_properties) if len(modified_properties) != 0 else {}
 
         logger.info(
-            "Updating relationship %s of model %s with current properties %s",
+            "Updating relationship %s of model %s with modified properties %s",
             self._element_id,
             self.__class__.__name__,
             deflated,
         )
-        set_query = ", ".join(
-            [
-                f"r.{property_name} = ${property_name}"
-                for property_name in deflated
-                if property_name in self.modified_properties
-            ]
-        )
-
-        results, _ = await self._client.cypher(
-            query=f"""
-                MATCH {self._query_builder.relationship_match(type_=self._settings.type)}
-                WHERE elementId(r) = $element_id
-                {f"SET {set_query}" if set_query != "" else ""}
-                RETURN r
-            """,
-            parameters={
-                "element_id": self._element_id,
-                **deflated,
-            },
-        )
+        # Only the modified properties are sent to the database, the model serializer might add the ID fields of the
+        # instance to the deflated properties
+        deflated = {
+            property_name: property_value
+            for property_name, property_value in deflated.items()
+            if property_name in modified_properties
+        }
+        set_query = ", ".join([f"r.{property_name} = ${property_name}" for property_name in deflated])
+
+        if version_field is None:
+            results, _ = await self._client.cypher(
+                query=f"""
+                    MATCH {self._query_builder.relationship_match(type_=self._settings.type)}
+                    WHERE elementId(r) = $element_id
+                    {f"SET {set_query}" if set_query != "" else ""}
+                    RETURN r
+                """,
+                parameters={
+                    "element_id": self._element_id,
+                    **deflated,
+                },
+            )
+        else:
+            # A write lock is taken on the relationship before its version is read, so concurrent updates wait for
+            # each other and always compare against the latest version. The current version is returned to be able
+            # to differentiate between a version conflict and a missing relationship
+            expected_version = getattr(self, version_field)
+            version_query = (
+                "current_version IS NULL" if expected_version is None else "current_version = $_expected_version"
+            )
+            set_query = ", ".join(
+                [query for query in [set_query, f"r.{version_field} = coalesce(r.{version_field}, 0) + 1"] if query]
+            )
+            logger.debug("Updating relationship with expected version %s", expected_version)
+
+            results, _ = await self._client.cypher(
+                query=f"""
+                    MATCH {self._query_builder.relationship_match(type_=self._settings.type)}
+                    WHERE elementId(r) = $element_id
+                    SET r._version_lock = true
+                    WITH r, r.{version_field} AS current_version
+                    CALL {{
+                        WITH r, current_version
+                        WITH r, current_version
+                        WHERE {version_query}
+                        SET {set_query}
+                    }}
+                    REMOVE r._version_lock
+                    RETURN r, current_version
+                """,
+                parameters={
+                    "element_id": self._element_id,
+                    "_expected_version": expected_version,
+                    **deflated,
+                },
+            )
+        self._client._invalidate_query_caches()
 
         logger.debug("Checking if query returned a result")
         if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
             raise UnexpectedEmptyResult()
 
+        if version_field is not None:
+            if results[0][1] != expected_version:
+                raise VersionConflict(
+                    element_id=self._element_id, expected_version=expected_version, current_version=results[0][1]
+                )
+
+            setattr(self, version_field, (expected_version or 0) + 1)
+
         logger.debug("Resetting modified properties")
-        self._db_properties = get_model_dump(
-            self,
-            exclude={
-                "element_id",
-                "id",
-                "start_node_element_id",
-                "start_node_id",
-                "end_node_element_id",
-                "end_node_id",
-            },
-        )
+        self._modified_properties = set()
         logger.debug("Updated relationship %s", self)
 
     @hooks
@@ -207,6 +245,8 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
                 "element_id": self._element_id,
             },
         )
+        self._client._invalidate_query_caches()
+        self._client._invalidate_cached_entities(element_id=self._element_id)
 
         logger.debug("Marking instance as destroyed")
         setattr(self, "_destroyed", True)
@@ -214,37 +254,50 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
 
     @hooks
     @ensure_alive
-    async def refresh(self) -> None:
+    async def refresh(self, use_cache: bool = True) -> None:
         """
         Refreshes the current instance with the values from the database.
 
+        Args:
+            use_cache (bool, optional): Whether to use the cached entity if the entity cache of the client is
+                enabled. Pass `False` to always fetch the current values from the database. Defaults to `True`.
+
         Raises:
             UnexpectedEmptyResult: If the query should return a result but does not.
         """
         logger.info("Refreshing relationship %s with values from database", self)
-        results, _ = await self._client.cypher(
-            query=f"""
-                MATCH {self._query_builder.relationship_match(type_=self._settings.type)}
-                WHERE elementId(r) = $element_id
-                RETURN r
-            """,
-            parameters={"element_id": self._element_id},
-        )
+        instance = self._client._get_cached_entity(self._element_id) if use_cache else None
 
-        logger.debug("Checking if query returned a result")
-        if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
-            raise UnexpectedEmptyResult()
+        if not isinstance(instance, self.__class__):
+            results, _ = await self._client.cypher(
+                query=f"""
+                    MATCH {self._query_builder.relationship_match(type_=self._settings.type)}
+                    WHERE elementId(r) = $element_id
+                    RETURN r
+                """,
+                parameters={"element_id": self._element_id},
+            )
+
+            logger.debug("Checking if query returned a result")
+            if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
+                raise UnexpectedEmptyResult()
+
+            instance = results[0][0]
 
         logger.debug("Updating current instance")
-        self.__dict__.update(results[0][0].__dict__)
+        self._refresh_from(instance)
         logger.debug("Refreshed relationship %s", self)
 
     @hooks
     @ensure_alive
-    async def start_node(self) -> Type[NodeModel]:
+    async def start_node(self, use_cache: bool = True) -> Type[NodeModel]:
         """
         Returns the start node the relationship belongs to.
 
+        Args:
+            use_cache (bool, optional): Whether to use the cached node if the entity cache of the client is
+                enabled. Pass `False` to always fetch the node from the database. Defaults to `True`.
+
         Raises:
             UnexpectedEmptyResult: If the query should return a result but does not.
 
@@ -252,6 +305,10 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
             Type[NodeModel]: A instance of the start node model.
         """
         logger.info("Getting start node %s for relationship %s", self._start_node_element_id, self)
+        cached_node = self._client._get_cached_entity(self._start_node_element_id) if use_cache else None
+        if isinstance(cached_node, NodeModel):
+            return cast(Type[NodeModel], cached_node)
+
         results, _ = await self._client.cypher(
             query=f"""
                 MATCH {self._query_builder.relationship_match(type_=self._settings.type, start_node_ref="start")}
@@ -271,10 +328,14 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
 
     @hooks
     @ensure_alive
-    async def end_node(self) -> Type[NodeModel]:
+    async def end_node(self, use_cache: bool = True) -> Type[NodeModel]:
         """
         Returns the end node the relationship belongs to.
 
+        Args:
+            use_cache (bool, optional): Whether to use the cached node if the entity cache of the client is
+                enabled. Pass `False` to always fetch the node from the database. Defaults to `True`.
+
         Raises:
             UnexpectedEmptyResult: If the query should return a result but does not.
 
@@ -282,6 +343,10 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
             Type[NodeModel]: A instance of the end node model.
         """
         logger.info("Getting end node %s for relationship %s", self._end_node_element_id, self)
+        cached_node = self._client._get_cached_entity(self._end_node_element_id) if use_cache else None
+        if isinstance(cached_node, NodeModel):
+            return cast(Type[NodeModel], cached_node)
+
         results, _ = await self._client.cypher(
             query=f"""
                 MATCH {self._query_builder.relationship_match(type_=self._settings.type, start_node_ref="start", end_node_ref="end")}
@@ -344,6 +409,13 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
         if cls._query_builder.query["where"] == "":
             raise InvalidFilters()
 
+        if projections is None and list(filters.keys()) == ["$elementId"]:
+            # Lookups by element id can be served from the entity cache, if it is enabled
+            cached_instance = cls._client._get_cached_entity(cast(Optional[str], filters["$elementId"]))
+
+            if isinstance(cached_instance, cls):
+                return cached_instance
+
         match_query = cls._query_builder.relationship_match(
             type_=cls._settings.type, direction=RelationshipMatchDirection.OUTGOING
         )
@@ -373,6 +445,79 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
 
         return results[0][0]
 
+    @classmethod
+    @hooks
+    async def find_by_element_ids(cls: Type[T], element_ids: List[str]) -> List[Optional[T]]:
+        """
+        Gets the relationships with the given element IDs using a single query. Compared to `find_many()` with a
+        `$or` of `$elementId` filters, the element IDs are passed as a list parameter and each relationship is looked
+        up by its element ID.
+
+        Args:
+            element_ids (List[str]): The element IDs of the relationships.
+
+        Returns:
+            List[Optional[T]]: The model instances in the same order as `element_ids`. If no relationship of the
+                model exists for a element ID, `None` is returned at its position.
+        """
+        logger.info("Getting %s relationships of model %s by element id", len(element_ids), cls.__name__)
+        return await cls._find_by_element_ids(
+            element_ids=list(element_ids),
+            match_query=cls._query_builder.relationship_match(
+                type_=cls._settings.type, direction=RelationshipMatchDirection.OUTGOING
+            ),
+            ref="r",
+        )
+
+    @classmethod
+    @hooks
+    async def refresh_many(cls: Type[T], instances: List[T]) -> List[T]:
+        """
+        Refreshes all provided instances with the values from the database using a single query.
+
+        Args:
+            instances (List[T]): The hydrated model instances to refresh.
+
+        Raises:
+            InvalidEntityType: If a instance is not a instance of the model.
+            InstanceNotHydrated: If a instance has not been hydrated yet.
+            InstanceDestroyed: If a instance has been destroyed.
+            UnexpectedEmptyResult: If the relationship of a instance does not exist anymore. In this case, no
+                instance is refreshed.
+
+        Returns:
+            List[T]: The provided instances.
+        """
+        logger.info(
+            "Refreshing %s relationships of model %s with values from database", len(instances), cls.__name__
+        )
+        for instance in instances:
+            if not isinstance(instance, cls):
+                raise InvalidEntityType(available_types=[cls.__name__], entity_type=instance.__class__.__name__)
+            if getattr(instance, "_destroyed", False):
+                raise InstanceDestroyed()
+            if getattr(instance, "_element_id", None) is None or getattr(instance, "_id", None) is None:
+                raise InstanceNotHydrated()
+
+        refreshed_instances = await cls._find_by_element_ids(
+            element_ids=[cast(str, instance._element_id) for instance in instances],
+            match_query=cls._query_builder.relationship_match(
+                type_=cls._settings.type, direction=RelationshipMatchDirection.OUTGOING
+            ),
+            ref="r",
+        )
+
+        # If any of the relationships does not exist anymore, we do not refresh any instance
+        logger.debug("Checking if query returned a result for all instances")
+        if any(refreshed_instance is None for refreshed_instance in refreshed_instances):
+            raise UnexpectedEmptyResult()
+
+        logger.debug("Updating instances")
+        for instance, refreshed_instance in zip(instances, refreshed_instances):
+            instance._refresh_from(refreshed_instance)
+
+        return instances
+
     @classmethod
     @hooks
     async def find_many(
@@ -444,6 +589,56 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
 
         return instances
 
+    @classmethod
+    async def iter_many(
+        cls: Type[T],
+        order_by: str,
+        filters: Optional[RelationshipFilters] = None,
+        batch_size: int = 1000,
+        order: QueryOptionsOrder = QueryOptionsOrder.ASCENDING,
+    ) -> AsyncGenerator[T, None]:
+        """
+        Iterates over all relationships that match `filters` in batches of `batch_size`. Unlike `find_many()` with
+        the `skip` option, each batch continues after the sort key of the last relationship of the previous batch,
+        which keeps the cost of each batch constant and only holds one batch in memory at a time. The next batch is
+        fetched while the current one is being processed.
+
+        Args:
+            order_by (str): The property to sort the relationships by. Has to be backed by a range index or
+                uniqueness constraint and should be unique or near-unique, since relationships with the same value
+                are only told apart by a residual filter on their element ID. Relationships where this property is
+                not set are skipped.
+            filters (RelationshipFilters | None, optional): Expressions applied to the query. Defaults to `None`.
+            batch_size (int, optional): The number of relationships fetched per batch. Defaults to `1000`.
+            order (QueryOptionsOrder, optional): The sort direction. Defaults to `QueryOptionsOrder.ASCENDING`.
+
+        Raises:
+            ValueError: If `batch_size` is not a positive integer.
+            UnknownProperty: If the model does not define the `order_by` property.
+            UnindexedProperty: If the `order_by` property is not backed by a range index or uniqueness constraint.
+
+        Yields:
+            T: The matched model instances.
+        """
+        logger.info("Iterating over relationships of model %s matching filters %s", cls.__name__, filters)
+        cls._query_builder.reset_query()
+
+        if filters is not None:
+            cls._query_builder.relationship_filters(filters=filters)
+
+        async for instance in cls._iter_keyset_pages(
+            match_query=cls._query_builder.relationship_match(
+                type_=cls._settings.type, direction=RelationshipMatchDirection.OUTGOING
+            ),
+            where_query=cls._query_builder.query["where"],
+            parameters=cls._query_builder.parameters,
+            batch_size=batch_size,
+            order_by=order_by,
+            order=order,
+            ref="r",
+        ):
+            yield instance
+
     @classmethod
     @hooks
     async def update_one(
@@ -452,6 +647,7 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
         filters: RelationshipFilters,
         new: bool = False,
         raise_on_empty: bool = False,
+        expected_version: Optional[int] = None,
     ) -> Optional[T]:
         """
         Finds the first relationship that matches `filters` and updates it with the values defined by `update`. If
@@ -464,27 +660,23 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
                 returned. Defaults to `False`.
             raise_on_empty (bool, optional): Whether to raise a `NoResultFound` if no match is found. Defaults to
                 `False`.
+            expected_version (int, optional): The version the matched relationship must have. Requires a
+                `version_field` to be defined in the model settings. Defaults to `None`.
 
         Raises:
             InvalidFilters: If no filters or invalid filters are provided.
             NoResultFound: If no match is found and `raise_on_empty` is set to `True`.
+            VersionConflict: If the version of the matched relationship does not match `expected_version`.
 
         Returns:
             T | None: By default, the old relationship instance is returned. If `new` is set to `True`, the result
                 will be the `updated instance`. If no match is found, `None` is returned.
         """
-        new_instance: T
-
         logger.info(
             "Updating first encountered relationship of model %s matching filters %s",
             cls.__name__,
             filters,
         )
-        logger.debug(
-            "Getting first encountered relationship of model %s matching filters %s",
-            cls.__name__,
-            filters,
-        )
         cls._query_builder.reset_query()
         cls._query_builder.relationship_filters(filters=filters)
 
@@ -494,62 +686,30 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
         match_query = cls._query_builder.relationship_match(
             type_=cls._settings.type, direction=RelationshipMatchDirection.OUTGOING
         )
-
-        results, _ = await cls._client.cypher(
-            query=f"""
-                MATCH {match_query}
-                WHERE {cls._query_builder.query['where']}
-                RETURN DISTINCT r
-                LIMIT 1
-            """,
+        results = await cls._update_entities(
+            match_query=match_query,
+            where_query=cls._query_builder.query["where"],
             parameters=cls._query_builder.parameters,
+            update=update,
+            ref="r",
+            limit=1,
+            expected_version=expected_version,
         )
+        cls._client._invalidate_query_caches()
 
         logger.debug("Checking if query returned a result")
-        if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
+        if len(results) == 0:
             if raise_on_empty:
                 raise NoResultFound(filters)
             return None
 
-        old_instance = results[0][0] if isinstance(results[0][0], cls) else cls._inflate(graph_entity=results[0][0])
-
-        # Update existing instance with values and save
-        logger.debug("Creating instance copy with new values %s", update)
-        new_instance = cls(**old_instance._deflate())
-
-        for key, value in update.items():
-            if key in get_model_fields(cls):
-                setattr(new_instance, key, value)
-
-        setattr(new_instance, "_element_id", getattr(old_instance, "_element_id", None))
-        setattr(new_instance, "_start_node_element_id", getattr(old_instance, "_start_node_element_id", None))
-        setattr(new_instance, "_start_node_id", getattr(old_instance, "_start_node_id", None))
-        setattr(new_instance, "_end_node_element_id", getattr(old_instance, "_end_node_element_id", None))
-        setattr(new_instance, "_end_node_id", getattr(old_instance, "_end_node_id", None))
-
-        deflated = new_instance._deflate()
-        set_query = ", ".join(
-            [
-                f"r.{property_name} = ${property_name}"
-                for property_name in deflated
-                if property_name in new_instance.modified_properties
-            ]
-        )
+        new_instance = cls._inflate(graph_entity=results[0][1])
+        logger.debug("Successfully updated relationship %s", getattr(new_instance, "_element_id"))
 
-        await cls._client.cypher(
-            query=f"""
-                MATCH {cls._query_builder.relationship_match(type_=new_instance._settings.type)}
-                WHERE elementId(r) = $element_id
-                {f"SET {set_query}" if set_query != "" else ""}
-            """,
-            parameters={
-                "element_id": new_instance._element_id,
-                **deflated,
-            },
-        )
+        if new:
+            return new_instance
 
-        logger.debug("Successfully updated relationship %s", getattr(new_instance, "_element_id"))
-        return new_instance if new else old_instance
+        return cls._inflate_previous_state(properties=results[0][0], instance=new_instance)
 
     @classmethod
     @hooks
@@ -558,6 +718,7 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
         update: Dict[str, Any],
         filters: Optional[RelationshipFilters] = None,
         new: bool = False,
+        expected_version: Optional[int] = None,
     ) -> List[T]:
         """
         Finds all relationships that match `filters` and updates them with the values defined by `update`.
@@ -567,12 +728,18 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
             filters (RelationshipFilters): Expressions applied to the query. Defaults to `None`.
             new (bool, optional): Whether to return the updated relationships. By default, the old relationships is
                 returned. Defaults to `False`.
+            expected_version (int, optional): The version all matched relationships must have. Requires a
+                `version_field` to be defined in the model settings. Defaults to `None`.
+
+        Raises:
+            VersionConflict: If the version of a matched relationship does not match `expected_version`. No
+                relationship is updated in this case.
 
         Returns:
             List[T]: By default, the old relationship instances are returned. If `new` is set to `True`, the
                 result will be the `updated instance`.
         """
-        new_instance: T
+        instances: List[T] = []
 
         logger.info(
             "Updating all relationships of model %s matching filters %s",
@@ -586,74 +753,31 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
         match_query = cls._query_builder.relationship_match(
             type_=cls._settings.type, direction=RelationshipMatchDirection.OUTGOING
         )
-
-        logger.debug(
-            "Getting all relationships of model %s matching filters %s",
-            cls.__name__,
-            filters,
-        )
-        results, _ = await cls._client.cypher(
-            query=f"""
-                MATCH {match_query}
-                {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
-                RETURN DISTINCT r
-            """,
+        results = await cls._update_entities(
+            match_query=match_query,
+            where_query=cls._query_builder.query["where"],
             parameters=cls._query_builder.parameters,
+            update=update,
+            ref="r",
+            expected_version=expected_version,
         )
+        cls._client._invalidate_query_caches()
 
-        old_instances: List[T] = []
-
+        logger.debug("Building instances from results")
         for result_list in results:
-            for result in result_list:
-                if result is None:
-                    continue
-
-                if isinstance(results[0][0], Relationship):
-                    old_instances.append(cls._inflate(graph_entity=results[0][0]))
-                else:
-                    old_instances.append(result)
-
-        logger.debug("Checking if query returned a result")
-        if len(old_instances) == 0:
-            logger.debug("No results found")
-            return []
+            new_instance = cls._inflate(graph_entity=result_list[1])
 
-        # Try and parse update values into random instance to check validation
-        logger.debug("Creating instance copy with new values %s", update)
-        new_instance = cls(**old_instances[0]._deflate())
-
-        for key, value in update.items():
-            if key in get_model_fields(cls):
-                setattr(new_instance, key, value)
-
-        deflated_properties = new_instance._deflate()
-
-        # Update instances
-        results, _ = await cls._client.cypher(
-            query=f"""
-                MATCH {match_query}
-                {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
-                SET {", ".join([f"r.{property_name} = ${property_name}" for property_name in deflated_properties if property_name in update])}
-                RETURN DISTINCT r
-            """,
-            parameters={**deflated_properties, **cls._query_builder.parameters},
-        )
+            if new:
+                instances.append(new_instance)
+            else:
+                instances.append(cls._inflate_previous_state(properties=result_list[0], instance=new_instance))
 
         logger.debug(
             "Successfully updated %s relationships %s",
-            len(old_instances),
-            [getattr(instance, "_element_id") for instance in old_instances],
+            len(instances),
+            [getattr(instance, "_element_id") for instance in instances],
         )
-        if new:
-            instances: List[T] = []
-
-            for result_list in results:
-                for result in result_list:
-                    if result is not None:
-                        instances.append(result)
-
-            return instances
-        return old_instances
+        return instances
 
     @classmethod
     @hooks
@@ -700,6 +824,8 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
             """,
             parameters=cls._query_builder.parameters,
         )
+        cls._client._invalidate_query_caches()
+        cls._client._invalidate_cached_entities(type_=cls._settings.type)
 
         if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
             raise UnexpectedEmptyResult()
@@ -759,6 +885,8 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
             """,
             parameters=cls._query_builder.parameters,
         )
+        cls._client._invalidate_query_caches()
+        cls._client._invalidate_cached_entities(type_=cls._settings.type)
 
         logger.debug("Deleted %s relationships", results[0][0])
         return results[0][0]
@@ -804,14 +932,119 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
 
         return results[0][0]
 
-    def _deflate(self) -> Dict[str, Any]:
+    @classmethod
+    @hooks
+    async def exists(cls: Type[T], filters: Optional[RelationshipFilters] = None) -> bool:
+        """
+        Checks whether at least one relationship matches the provided `filters` parameter. Unlike `count()`, the
+        query stops at the first match and no model instance is built.
+
+        Args:
+            filters (RelationshipFilters | None, optional): Expressions applied to the query. Defaults
+                to `None`.
+
+        Returns:
+            bool: Whether a matching relationship exists.
+        """
+        logger.info(
+            "Checking if relationship of model %s matching filters %s exists",
+            cls.__name__,
+            filters,
+        )
+        cls._query_builder.reset_query()
+        if filters is not None:
+            cls._query_builder.relationship_filters(filters=filters)
+
+        match_query = cls._query_builder.relationship_match(
+            type_=cls._settings.type, direction=RelationshipMatchDirection.OUTGOING
+        )
+
+        results, _ = await cls._client.cypher(
+            query=f"""
+                RETURN EXISTS {{
+                    MATCH {match_query}
+                    {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
+                }} AS has_match
+            """,
+            parameters=cls._query_builder.parameters,
+            resolve_models=False,
+        )
+
+        logger.debug("Checking if query returned a result")
+        if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
+            raise UnexpectedEmptyResult()
+
+        return results[0][0]
+
+    @classmethod
+    @hooks
+    async def aggregate(
+        cls: Type[T],
+        filters: Optional[RelationshipFilters] = None,
+        group_by: Optional[List[str]] = None,
+        metrics: Optional[AggregationMetrics] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregates the properties of all relationships which match the provided `filters` parameter on the
+        database instead of loading the relationships into model instances.
+
+        Args:
+            filters (RelationshipFilters, optional): The filters to apply to the query. Defaults to `None`.
+            group_by (List[str], optional): The properties to group the relationships by. If `None`, all matched
+                relationships are aggregated into a single row. Defaults to `None`.
+            metrics (AggregationMetrics, optional): The metrics to compute for each group. The key defines the
+                name of the metric and the value is a tuple of the aggregation function and the property to aggregate.
+                Use `None` as the property with the `count` function to count the relationships. Defaults to `None`.
+
+        Raises:
+            ValueError: If no property to group by and no metric is provided, if a property is not defined on the
+                model or if a metric uses a unknown aggregation function.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per group containing the grouped properties and the metrics.
+        """
+        logger.info(
+            "Aggregating relationships of model %s matching filters %s with metrics %s grouped by %s",
+            cls.__name__,
+            filters,
+            metrics,
+            group_by,
+        )
+        return_query, keys = cls._build_aggregation_query(group_by=group_by, metrics=metrics, ref="r")
+
+        cls._query_builder.reset_query()
+        if filters is not None:
+            cls._query_builder.relationship_filters(filters=filters)
+
+        match_query = cls._query_builder.relationship_match(
+            type_=cls._settings.type, direction=RelationshipMatchDirection.OUTGOING
+        )
+
+        results, _ = await cls._client.cypher(
+            query=f"""
+                MATCH {match_query}
+                {f"WHERE {cls._query_builder.query['where']}" if cls._query_builder.query['where'] != "" else ""}
+                WITH DISTINCT r
+                {return_query}
+            """,
+            parameters=cls._query_builder.parameters,
+            resolve_models=False,
+        )
+
+        return [dict(zip(keys, result_list)) for result_list in results]
+
+    def _deflate(self, include: Optional[Set[str]] = None) -> Dict[str, Any]:
         """
         Deflates the current model instance into a python dictionary which can be stored in Neo4j.
 
+        Args:
+            include (Set[str], optional): The properties to deflate. If not provided, all properties are deflated.
+                Defaults to `None`.
+
         Returns:
             Dict[str, Any]: The deflated model instance.
         """
-        deflated: Dict[str, Any] = json.loads(get_model_dump_json(self, exclude={"_settings"}))
+        deflated: Dict[str, Any] = get_model_dump_jsonable(self, include=include, exclude={"_settings"})
 
         return super()._deflate(deflated=deflated)
 
@@ -830,7 +1063,7 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
             T: A new instance of the current model with the properties from the relationship instance.
         """
         inflated = super()._inflate(graph_entity=graph_entity)
-        instance = cls(**inflated)
+        instance = cls._hydrate(inflated)
 
         setattr(instance, "_element_id", graph_entity.element_id)
         setattr(instance, "_id", graph_entity.id)
@@ -841,6 +1074,54 @@ class RelationshipModel(ModelBase[RelationshipModelSettings]):
 
         return instance
 
+    @classmethod
+    def _inflate_cached(cls: Type[T], cached_entity: CachedRelationship) -> T:
+        """
+        Inflates the plain data of a relationship from the entity cache into a instance of the current model.
+
+        Args:
+            cached_entity (CachedRelationship): The cached relationship to inflate.
+
+        Raises:
+            InflationFailure: If inflating the relationship fails.
+
+        Returns:
+            T: A new instance of the current model with the properties from the cached relationship.
+        """
+        logger.debug("Inflating cached relationship %s to model instance", cached_entity.element_id)
+        inflated = cls._inflate_properties(QueryCache.copy_results(cached_entity.properties))
+        instance = cls._hydrate(inflated)
+
+        setattr(instance, "_element_id", cached_entity.element_id)
+        setattr(instance, "_id", cached_entity.id)
+        setattr(instance, "_start_node_element_id", cached_entity.start_node.element_id)
+        setattr(instance, "_start_node_id", cached_entity.start_node.id)
+        setattr(instance, "_end_node_element_id", cached_entity.end_node.element_id)
+        setattr(instance, "_end_node_id", cached_entity.end_node.id)
+
+        return instance
+
+    @classmethod
+    def _inflate_previous_state(cls: Type[T], properties: Dict[str, Any], instance: T) -> T:
+        """
+        Builds a instance of the model from the properties a relationship had before it was updated. The element
+        IDs and IDs of the relationship and its start and end node are taken from the updated `instance`.
+
+        Args:
+            properties (Dict[str, Any]): The properties of the relationship before the update.
+            instance (T): The updated instance.
+
+        Returns:
+            T: A new instance of the current model with the properties before the update.
+        """
+        previous_instance = super()._inflate_previous_state(properties=properties, instance=instance)
+
+        setattr(previous_instance, "_start_node_element_id", getattr(instance, "_start_node_element_id", None))
+        setattr(previous_instance, "_start_node_id", getattr(instance, "_start_node_id", None))
+        setattr(previous_instance, "_end_node_element_id", getattr(instance, "_end_node_element_id", None))
+        setattr(previous_instance, "_end_node_id", getattr(instance, "_end_node_id", None))
+        return previous_instance
+
     @property
     def start_node_element_id(self) -> Optional[str]:
         """
@@ -0,0 +1,203 @@
+"""
+Classifies model properties by how they are encoded when stored in the graph, so models do not have to inspect
+every value on every write or read.
+"""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from inspect import isclass
+from types import NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from pyneo4j_ogm.pydantic_utils import get_field_type, get_field_validator, get_model_fields
+
+# Types which are stored as a single property value after being dumped to JSON compatible values
+PRIMITIVE_TYPES = (str, int, float, bool, datetime, date, time, timedelta, UUID, Decimal)
+LIST_TYPES = (list, set, frozenset, tuple)
+# Types which are returned by the database exactly as they are held by models
+NATIVE_TYPES = (str, int, float, bool)
+
+
+class PropertyEncoding(str, Enum):
+    """
+    Enum for the encodings used to store model properties in the graph.
+    """
+
+    PRIMITIVE = "PRIMITIVE"
+    PRIMITIVE_LIST = "PRIMITIVE_LIST"
+    JSON = "JSON"
+    JSON_LIST = "JSON_LIST"
+    DYNAMIC = "DYNAMIC"
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """
+    Removes `Optional` and `Annotated` wrappers from a type annotation.
+
+    Args:
+        annotation (Any): The type annotation to unwrap.
+
+    Returns:
+        Any: The unwrapped type annotation or `None` if the annotation is a union of multiple types.
+    """
+    origin = get_origin(annotation)
+
+    if origin is Annotated:
+        return _unwrap_optional(get_args(annotation)[0])
+    if origin is Union or origin is UnionType:
+        types = [arg for arg in get_args(annotation) if arg is not NoneType]
+        return _unwrap_optional(types[0]) if len(types) == 1 else None
+
+    return annotation
+
+
+def _is_primitive(annotation: Any) -> bool:
+    """
+    Checks whether values of the given type are stored as a primitive property value.
+
+    Args:
+        annotation (Any): The type annotation to check.
+
+    Returns:
+        bool: Whether the type is primitive.
+    """
+    if get_origin(annotation) is Literal:
+        return all(isinstance(value, PRIMITIVE_TYPES) for value in get_args(annotation))
+
+    return isclass(annotation) and issubclass(annotation, PRIMITIVE_TYPES)
+
+
+def _is_json(annotation: Any) -> bool:
+    """
+    Checks whether values of the given type are stored as a JSON string.
+
+    Args:
+        annotation (Any): The type annotation to check.
+
+    Returns:
+        bool: Whether the type is JSON encoded.
+    """
+    origin = get_origin(annotation)
+
+    if origin is not None:
+        return isclass(origin) and issubclass(origin, Mapping)
+
+    return isclass(annotation) and issubclass(annotation, (Mapping, BaseModel))
+
+
+def get_property_encoding(annotation: Any) -> PropertyEncoding:
+    """
+    Returns the encoding used to store values of the given type in the graph. Properties which can not be
+    classified by their type are encoded based on their value instead.
+
+    Args:
+        annotation (Any): The type annotation of the property.
+
+    Returns:
+        PropertyEncoding: The encoding of the property.
+    """
+    annotation = _unwrap_optional(annotation)
+
+    if annotation is None:
+        return PropertyEncoding.DYNAMIC
+    if _is_primitive(annotation):
+        return PropertyEncoding.PRIMITIVE
+    if _is_json(annotation):
+        return PropertyEncoding.JSON
+
+    origin = get_origin(annotation)
+    if origin in LIST_TYPES:
+        # Optional items are not unwrapped, since `None` items are stored as JSON strings as well
+        item_types = [arg for arg in get_args(annotation) if arg is not Ellipsis]
+
+        if len(item_types) != 0 and all(_is_primitive(item_type) for item_type in item_types):
+            return PropertyEncoding.PRIMITIVE_LIST
+        if len(item_types) != 0 and all(_is_json(item_type) for item_type in item_types):
+            return PropertyEncoding.JSON_LIST
+
+    return PropertyEncoding.DYNAMIC
+
+
+def build_property_encodings(model: Type[BaseModel]) -> Dict[str, PropertyEncoding]:
+    """
+    Builds the encodings for all fields of a model.
+
+    Args:
+        model (Type[BaseModel]): The model to build the encodings for.
+
+    Returns:
+        Dict[str, PropertyEncoding]: The encoding of each field.
+    """
+    return {
+        field_name: get_property_encoding(get_field_type(field))
+        for field_name, field in get_model_fields(model).items()
+    }
+
+
+def _is_native(annotation: Any) -> bool:
+    """
+    Checks whether values of the given type are returned by the database exactly as the model holds them.
+
+    Args:
+        annotation (Any): The type annotation to check.
+
+    Returns:
+        bool: Whether the type is native.
+    """
+    annotation = _unwrap_optional(annotation)
+
+    if get_origin(annotation) is list:
+        item_types = get_args(annotation)
+        return len(item_types) == 1 and _is_native(item_types[0])
+
+    return isclass(annotation) and issubclass(annotation, NATIVE_TYPES) and not issubclass(annotation, Enum)
+
+
+def build_hydration_validators(
+    model: Type[BaseModel], exclude: Optional[Set[str]] = None, skip_native: bool = True, with_validators: bool = False
+) -> Dict[str, Optional[Callable[[Any], Any]]]:
+    """
+    Builds the validators used to convert the properties of a graph entity to the field values of a model without
+    validating the whole model. Fields with native types do not need any conversion and map to `None`.
+
+    Args:
+        model (Type[BaseModel]): The model to build the validators for.
+        exclude (Set[str], optional): Fields to leave out. Defaults to `None`.
+        skip_native (bool, optional): Whether fields with native types map to `None` instead of being validated.
+            Defaults to `True`.
+        with_validators (bool, optional): Whether the field validators defined on the model are run as well.
+            Defaults to `False`.
+
+    Returns:
+        Dict[str, Callable[[Any], Any] | None]: The validator of each field.
+    """
+    validators: Dict[str, Optional[Callable[[Any], Any]]] = {}
+
+    for field_name, field in get_model_fields(model).items():
+        if exclude is not None and field_name in exclude:
+            continue
+
+        validators[field_name] = (
+            None
+            if skip_native and _is_native(get_field_type(field))
+            else get_field_validator(model, field_name, with_validators=with_validators)
+        )
+
+    return validators
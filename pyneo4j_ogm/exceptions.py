@@ -118,6 +118,38 @@ class InvalidTargetNode(Pyneo4jException):
         )
 
 
+class UnknownRelationshipProperty(Pyneo4jException):
+    """
+    A relationship-property was referenced by name, but the model does not define a relationship-property with
+    the given name.
+    """
+
+    def __init__(self, model: str, property_name: str, *args: object) -> None:
+        super().__init__(f"Model {model} has no relationship-property named {property_name}", *args)
+
+
+class UnknownProperty(Pyneo4jException):
+    """
+    A property was referenced by name, but the model does not define a property with the given name.
+    """
+
+    def __init__(self, model: str, property_name: str, *args: object) -> None:
+        super().__init__(f"Model {model} has no property named {property_name}", *args)
+
+
+class InvalidUniqueKey(Pyneo4jException):
+    """
+    A lookup by unique key was made, but the key does not consist of exactly one property with a uniqueness
+    constraint.
+    """
+
+    def __init__(self, model: str, properties: List[str], *args: object) -> None:
+        super().__init__(
+            f"Expected exactly one property of model {model} with a uniqueness constraint, got {properties}",
+            *args,
+        )
+
+
 class InvalidLabelOrType(Pyneo4jException):
     """
     Invalid node label or relationship type was provided.
@@ -215,3 +247,44 @@ class ListItemNotEncodable(Pyneo4jException):
 
     def __init__(self, *args: object) -> None:
         super().__init__("List item is not JSON encodable and can not be stored inside the database", *args)
+
+
+class VersionConflict(Pyneo4jException):
+    """
+    A instance was updated, but the version of the graph entity in the database does not match the version
+    of the instance anymore.
+    """
+
+    def __init__(self, element_id: Any, expected_version: Any, current_version: Any, *args: object) -> None:
+        super().__init__(
+            f"Graph entity {element_id} has been modified since it was fetched. Expected version "
+            f"{expected_version}, got {current_version}",
+            *args,
+        )
+
+
+class SourceNodeReleased(Pyneo4jException):
+    """
+    A relationship-property was used after the node it belongs to has been garbage-collected. Relationship-properties
+    only hold a weak reference to their source node.
+    """
+
+    def __init__(self, *args: object) -> None:
+        super().__init__(
+            "The source node of the relationship-property has been garbage-collected, keep a reference to the node "
+            "while using its relationship-properties",
+            *args,
+        )
+
+
+class UnindexedProperty(Pyneo4jException):
+    """
+    A property was used for a query which relies on an index, but the property is not backed by a range index or
+    uniqueness constraint.
+    """
+
+    def __init__(self, model: str, property_name: str, *args: object) -> None:
+        super().__init__(
+            f"Property {property_name} of model {model} is not backed by a range index or uniqueness constraint",
+            *args,
+        )
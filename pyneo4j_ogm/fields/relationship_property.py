@@ -5,6 +5,7 @@ which defines the other end of the relationship.
 
 import asyncio
 from asyncio import iscoroutinefunction
+from copy import copy, deepcopy
 from enum import Enum
 from functools import wraps
 from typing import (
@@ -18,7 +19,6 @@ from typing import (
     List,
     Optional,
     ParamSpec,
-    Set,
     Type,
     TypeVar,
     Union,
@@ -26,15 +26,18 @@ from typing import (
     get_args,
     get_origin,
 )
+from weakref import ReferenceType, ref
 
 from neo4j.graph import Node, Relationship
 
+from pyneo4j_ogm.core.hooks import get_compiled_hooks, run_background_hooks, run_hooks
 from pyneo4j_ogm.exceptions import (
     CardinalityViolation,
     InstanceDestroyed,
     InstanceNotHydrated,
     InvalidTargetNode,
     NotConnectedToSourceNode,
+    SourceNodeReleased,
     UnexpectedEmptyResult,
     UnregisteredModel,
 )
@@ -43,6 +46,7 @@ from pyneo4j_ogm.logger import logger
 from pyneo4j_ogm.pydantic_utils import IS_PYDANTIC_V2, parse_model
 from pyneo4j_ogm.queries.query_builder import QueryBuilder
 from pyneo4j_ogm.queries.types import (
+    AutoFetchModel,
     Projection,
     QueryOptions,
     RelationshipFilters,
@@ -107,27 +111,19 @@ def hooks(func):
         async def async_wrapper(self: "RelationshipProperty", *args, **kwargs):
             source_node = getattr(self, "_source_node")
             settings: NodeModelSettings = getattr(source_node, "_settings")
-            hook_name = f"{getattr(self, '_registered_name')}.{func.__name__}"
+            compiled_hooks = get_compiled_hooks(source_node, f"{getattr(self, '_registered_name')}.{func.__name__}")
+
+            if compiled_hooks is None:
+                return await func(self, *args, **kwargs)
 
             # Run pre hooks if defined
-            logger.debug("Checking pre hooks for %s", hook_name)
-            if hook_name in settings.pre_hooks:
-                for hook_function in settings.pre_hooks[hook_name]:
-                    if iscoroutinefunction(hook_function):
-                        await hook_function(source_node, *args, **kwargs)
-                    else:
-                        hook_function(source_node, *args, **kwargs)
+            await run_hooks(compiled_hooks.pre, settings.concurrent_hooks, source_node, *args, **kwargs)
 
             result = await func(self, *args, **kwargs)
 
-            # Run post hooks if defined
-            logger.debug("Checking post hooks for %s", hook_name)
-            if hook_name in settings.post_hooks:
-                for hook_function in settings.post_hooks[hook_name]:
-                    if iscoroutinefunction(hook_function):
-                        await hook_function(source_node, result, *args, **kwargs)
-                    else:
-                        hook_function(source_node, result, *args, **kwargs)
+            # Run post hooks if defined, non-blocking post hooks are run in the background
+            await run_hooks(compiled_hooks.post, settings.concurrent_hooks, source_node, result, *args, **kwargs)
+            run_background_hooks(compiled_hooks.background, source_node, result, *args, **kwargs)
 
             return result
 
@@ -226,7 +222,7 @@ class RelationshipProperty(Generic[T, U]):
     _query_builder: QueryBuilder
     _target_model: Optional[Type[T]]
     _target_model_name: str
-    _source_node: T
+    _source_node_ref: Optional["ReferenceType[T]"]
     _direction: RelationshipPropertyDirection
     _cardinality: RelationshipPropertyCardinality
     _relationship_model: Optional[Type[U]]
@@ -386,6 +382,7 @@ class RelationshipProperty(Generic[T, U]):
         """
         self._nodes = []
         self._registered_name = None
+        self._source_node_ref = None
         self._target_model = None
         self._relationship_model = None
         self._allow_multiple = allow_multiple
@@ -396,6 +393,31 @@ class RelationshipProperty(Generic[T, U]):
         )
         self._target_model_name = target_model if isinstance(target_model, str) else target_model.__name__
 
+    @property
+    def _source_node(self) -> T:
+        """
+        The node the relationship-property belongs to. Only a weak reference to the node is kept, since the node
+        holds the relationship-property as well, which would otherwise create a reference cycle.
+
+        Raises:
+            SourceNodeReleased: Raised if the source node has already been garbage-collected.
+
+        Returns:
+            T: The source node or `None` if the relationship-property has not been bound to a node.
+        """
+        if self._source_node_ref is None:
+            return cast(T, None)
+
+        source_node = self._source_node_ref()
+        if source_node is None:
+            raise SourceNodeReleased()
+
+        return source_node
+
+    @_source_node.setter
+    def _source_node(self, source_node: Optional[T]) -> None:
+        self._source_node_ref = ref(source_node) if source_node is not None else None
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, RelationshipProperty):
             return False
@@ -411,6 +433,26 @@ class RelationshipProperty(Generic[T, U]):
     def __ne__(self, other: Any) -> bool:
         return not self.__eq__(other)
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "RelationshipProperty[T, U]":
+        # Definitions which are not bound to a model instance are never modified, so the copies Pydantic makes of
+        # field defaults can share them
+        if getattr(self, "_source_node", None) is None and len(self._nodes) == 0:
+            return self
+
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+
+        for attribute_name, attribute_value in self.__dict__.items():
+            if attribute_name != "_source_node_ref":
+                setattr(copied, attribute_name, deepcopy(attribute_value, memo))
+
+        # The source node is only referenced weakly, so it is not copied. If the source node is copied as well, the
+        # copy references the copied node instead
+        source_node = self._source_node
+        copied._source_node = memo.get(id(source_node), source_node)
+
+        return copied
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}(target_model_name={self._target_model_name}, "
@@ -502,6 +544,60 @@ class RelationshipProperty(Generic[T, U]):
 
         return relationships
 
+    @hooks
+    @check_models_registered
+    async def is_connected(self, node: T, filters: Optional[RelationshipFilters] = None) -> bool:
+        """
+        Checks whether the provided node is connected to the source node. Unlike `relationships()`, the query stops
+        at the first matching relationship and no model instances are built.
+
+        Args:
+            node (T): The node to check.
+            filters (RelationshipFilters | None, optional): Expressions applied to the relationships. Defaults to
+                `None`.
+
+        Raises:
+            UnexpectedEmptyResult: If the query should return a result but does not.
+
+        Returns:
+            bool: Whether at least one (matching) relationship exists between the nodes.
+        """
+        self._ensure_alive(node)
+        self._query_builder.reset_query()
+
+        logger.info("Checking if target node %s is connected to source node %s", node, self._source_node)
+        if filters is not None:
+            self._query_builder.relationship_filters(filters=filters)
+
+        match_query = self._query_builder.relationship_match(
+            direction=self._direction,
+            type_=cast(U, self._relationship_model)._settings.type,
+            start_node_ref="start",
+            start_node_labels=list(self._source_node._settings.labels),
+            end_node_ref="end",
+            end_node_labels=list(cast(Type[T], self._target_model)._settings.labels),
+        )
+
+        results, _ = await self._client.cypher(
+            query=f"""
+                RETURN EXISTS {{
+                    MATCH {match_query}
+                    WHERE elementId(start) = $start_element_id AND elementId(end) = $end_element_id
+                    {f"AND {self._query_builder.query['where']}" if self._query_builder.query['where'] != "" else ""}
+                }} AS is_connected
+            """,
+            parameters={
+                "start_element_id": getattr(self._source_node, "_element_id", None),
+                "end_element_id": getattr(node, "_element_id", None),
+                **self._query_builder.parameters,
+            },
+            resolve_models=False,
+        )
+
+        if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
+            raise UnexpectedEmptyResult()
+        return results[0][0]
+
     @hooks
     @check_models_registered
     async def connect(self, node: T, properties: Optional[Dict[str, Any]] = None) -> U:
@@ -571,6 +667,7 @@ class RelationshipProperty(Generic[T, U]):
                 **deflated_properties,
             },
         )
+        self._invalidate_caches()
 
         if len(results) == 0 or len(results[0]) == 0 or results[0][0] is None:
             raise UnexpectedEmptyResult()
@@ -651,6 +748,7 @@ class RelationshipProperty(Generic[T, U]):
                 "end_element_id": getattr(node, "_element_id", None),
             },
         )
+        self._invalidate_caches(relationships_deleted=True)
 
         return count_results[0][0]
 
@@ -712,6 +810,7 @@ class RelationshipProperty(Generic[T, U]):
                 "start_element_id": getattr(self._source_node, "_element_id", None),
             },
         )
+        self._invalidate_caches(relationships_deleted=True)
 
         return count_results[0][0]
 
@@ -776,6 +875,7 @@ class RelationshipProperty(Generic[T, U]):
                     "end_element_id": getattr(new_node, "_element_id", None),
                 },
             )
+            self._invalidate_caches(relationships_deleted=True)
 
         logger.debug("Getting relationship between source node and old node")
         results, _ = await self._client.cypher(
@@ -805,6 +905,7 @@ class RelationshipProperty(Generic[T, U]):
                 "end_element_id": getattr(old_node, "_element_id", None),
             },
         )
+        self._invalidate_caches(relationships_deleted=True)
 
         logger.debug("Creating relationship between source node and new node")
         create_queries: List[str] = []
@@ -851,6 +952,7 @@ class RelationshipProperty(Generic[T, U]):
                 **query_parameters,
             },
         )
+        self._invalidate_caches()
 
         return cast(List[U], results[0])
 
@@ -862,7 +964,7 @@ class RelationshipProperty(Generic[T, U]):
         projections: Optional[Projection] = None,
         options: Optional[QueryOptions] = None,
         auto_fetch_nodes: bool = False,
-        auto_fetch_models: Optional[List[Union[str, Type["NodeModel"]]]] = None,
+        auto_fetch_models: Optional[List[Union[str, Type["NodeModel"], AutoFetchModel]]] = None,
     ) -> List[Union[T, Dict[str, Any]]]:
         """
         Finds all nodes that matches `filters` and are connected to the source node.
@@ -875,8 +977,10 @@ class RelationshipProperty(Generic[T, U]):
             options (QueryOptions | None, optional): Options for modifying the query result. Defaults to `None`.
             auto_fetch_nodes (bool, optional): Whether to automatically fetch connected nodes. Takes priority over the
                 identical option defined in `Settings`. Defaults to `False`.
-            auto_fetch_models (List[Union[str, T]], optional): A list of models to auto-fetch. `auto_fetch_nodes` has
-                to be set to `True` for this to have any effect. Defaults to `[]`.
+            auto_fetch_models (List[Union[str, T, AutoFetchModel]], optional): A list of models to auto-fetch.
+                Relationship-properties of the target model can be selected by name with a dictionary, which can
+                define filters and options applied to the auto-fetched nodes. `auto_fetch_nodes` has to be set to
+                `True` for this to have any effect. Defaults to `[]`.
 
         Returns:
             List[T | Dict[str, Any]]: A list of model instances or dictionaries of the projected properties.
@@ -884,6 +988,7 @@ class RelationshipProperty(Generic[T, U]):
         instances: List[Union[T, Dict[str, Any]]] = []
         do_auto_fetch: bool = False
         match_queries, return_queries = [], []
+        auto_fetch_parameters: Dict[str, Any] = {}
 
         logger.info("Getting connected nodes matching filters %s", filters)
         self._query_builder.reset_query()
@@ -892,7 +997,11 @@ class RelationshipProperty(Generic[T, U]):
         if options is not None:
             self._query_builder.query_options(options=options, ref="end")
         if projections is not None:
-            self._query_builder.build_projections(projections=projections, ref="end")
+            self._query_builder.build_projections(
+                projections=projections,
+                ref="end",
+                relationship_resolver=getattr(self._target_model, "_resolve_projection_relationship", None),
+            )
 
         projection_query = (
             "RETURN end" if self._query_builder.query["projections"] == "" else self._query_builder.query["projections"]
@@ -901,7 +1010,7 @@ class RelationshipProperty(Generic[T, U]):
         if auto_fetch_nodes:
             logger.debug("Auto-fetching nodes is enabled")
 
-            match_queries, return_queries = cast(
+            match_queries, return_queries, auto_fetch_parameters = cast(
                 Type[T], self._target_model
             )._build_auto_fetch(  # pylint: disable=protected-access
                 ref="end", nodes_to_fetch=auto_fetch_models
@@ -926,6 +1035,44 @@ class RelationshipProperty(Generic[T, U]):
             end_node_labels=list(cast(Type[T], self._target_model)._settings.labels),
         )
 
+        loader = getattr(self._client, "_loader", None)
+        if loader is not None and projections is None and not do_auto_fetch:
+            # Lookups for other source nodes with the same query are combined into a single query by the loader
+            logger.debug("Queueing lookup with loader")
+            start_match_query = self._query_builder.node_match(
+                list(cast(T, self._source_node)._settings.labels), ref="start"
+            )
+            where_query = self._query_builder.query["where"]
+
+            fetched_nodes = await loader.load(
+                query=f"""
+                    UNWIND $_loader_element_ids AS start_element_id
+                    MATCH {start_match_query}
+                    WHERE elementId(start) = start_element_id
+                    CALL {{
+                        WITH start
+                        MATCH {match_query}
+                        {f"WHERE {where_query}" if where_query != "" else ""}
+                        WITH DISTINCT end
+                        {self._query_builder.query['options']}
+                        RETURN collect(end) AS nodes
+                    }}
+                    RETURN start_element_id, nodes
+                """,
+                parameters=dict(self._query_builder.parameters),
+                element_id=cast(str, getattr(self._source_node, "_element_id", None)),
+            )
+
+            for fetched_node in fetched_nodes:
+                resolved = self._client._resolve_database_model(fetched_node)
+                instances.append(
+                    resolved
+                    if resolved is not None
+                    else cast(Type[T], self._target_model)._inflate(graph_entity=fetched_node)
+                )
+
+            return instances
+
         results, meta = await self._client.cypher(
             query=f"""
                 MATCH {match_query}
@@ -934,47 +1081,22 @@ class RelationshipProperty(Generic[T, U]):
                     {f"AND {self._query_builder.query['where']}" if self._query_builder.query['where'] != "" else ""}
                 WITH DISTINCT end
                 {self._query_builder.query['options']}
-                {" ".join(f"OPTIONAL MATCH {match_query}" for match_query in match_queries) if do_auto_fetch else ""}
+                {" ".join(match_queries) if do_auto_fetch else ""}
                 {projection_query}{f', {", ".join(return_queries)}' if do_auto_fetch else ''}
             """,
             parameters={
                 "start_element_id": getattr(self._source_node, "_element_id", None),
                 **self._query_builder.parameters,
+                **auto_fetch_parameters,
             },
         )
 
         logger.debug("Building instances from results")
         if do_auto_fetch:
-            # Add auto-fetched nodes to relationship properties
-            added_nodes: Set[str] = set()
-
-            logger.debug("Adding auto-fetched nodes to relationship properties")
-            for result_list in results:
-                for index, result in enumerate(result_list):
-                    if result is None or result_list[0] is None:
-                        continue
-
-                    instance_element_id = getattr(result, "_element_id")
-                    if instance_element_id in added_nodes:
-                        continue
-
-                    if index == 0:
-                        instances.append(
-                            cast(Type[T], self._target_model)._inflate(graph_entity=result)
-                            if isinstance(result, Node)
-                            else result
-                        )
-                    else:
-                        target_instance = [
-                            instance
-                            for instance in instances
-                            if getattr(result_list[0], "_element_id") == getattr(instance, "_element_id")
-                        ][0]
-                        relationship_property = getattr(target_instance, meta[index])
-                        nodes = cast(List[str], getattr(relationship_property, "_nodes"))
-                        nodes.append(result)
-
-                    added_nodes.add(instance_element_id)
+            target_model = cast(Type[T], self._target_model)
+            instances = target_model._inflate_auto_fetch_results(  # pylint: disable=protected-access
+                results=results, meta=meta
+            )
         else:
             for result_list in results:
                 for result in result_list:
@@ -990,6 +1112,22 @@ class RelationshipProperty(Generic[T, U]):
 
         return instances
 
+    def _resolve_models(self, client: Pyneo4jClient) -> None:
+        """
+        Resolves the target and relationship models from the models registered with the client. Called once for the
+        relationship-property definition of each model when models are registered, so instances do not have to
+        resolve them again.
+
+        Args:
+            client (Pyneo4jClient): The client the models are registered with.
+        """
+        registered_models = {model.__name__: model for model in client.models}
+
+        self._client = client
+        self._query_builder = QueryBuilder()
+        self._target_model = cast(Optional[Type[T]], registered_models.get(self._target_model_name, None))
+        self._relationship_model = cast(Optional[Type[U]], registered_models.get(self._relationship_model_name, None))
+
     def _build_property(self, source_model: T, property_name: str) -> None:
         """
         Sets the source node and returns self.
@@ -1004,20 +1142,43 @@ class RelationshipProperty(Generic[T, U]):
         if getattr(source_model, "_client", None) is None:
             raise UnregisteredModel(model=source_model.__class__.__name__)
 
+        client = cast(Pyneo4jClient, getattr(source_model, "_client"))
+        if getattr(self, "_client", None) is not client:
+            self._resolve_models(client)
+
         self._registered_name = property_name
-        self._client = cast(Pyneo4jClient, getattr(source_model, "_client"))
-        self._query_builder = QueryBuilder()
         self._source_node = source_model
 
-        registered_node_model = [model for model in self._client.models if model.__name__ == self._target_model_name]
-        if len(registered_node_model) > 0:
-            self._target_model = cast(Type[T], registered_node_model[0])
+    def _bind(self, source_model: T, property_name: str) -> "RelationshipProperty[T, U]":
+        """
+        Creates a new relationship-property for a model instance from the relationship-property definition of the
+        model. The resolved models of the definition are shared with the new instance, but each instance gets its own
+        query builder, since query builders hold the state of the query which is currently being built.
+
+        Args:
+            source_model (T): The source model instance.
+            property_name (str): The name under which the relationship property is defined on the source model.
+
+        Raises:
+            UnregisteredModel: Raised if the source model has not been registered with the client.
+
+        Returns:
+            RelationshipProperty[T, U]: The relationship-property of the model instance.
+        """
+        client = getattr(source_model, "_client", None)
+        if client is None:
+            raise UnregisteredModel(model=source_model.__class__.__name__)
+
+        if getattr(self, "_client", None) is not client:
+            logger.debug("Resolving models of relationship-property %s", property_name)
+            self._resolve_models(client)
 
-        registered_relationship_model = [
-            model for model in self._client.models if model.__name__ == self._relationship_model_name
-        ]
-        if len(registered_relationship_model) > 0:
-            self._relationship_model = cast(Type[U], registered_relationship_model[0])
+        bound = copy(self)
+        bound._nodes = []
+        bound._query_builder = QueryBuilder()
+        bound._registered_name = property_name
+        bound._source_node = source_model
+        return bound
 
     def _ensure_alive(self, nodes: Union[T, List[T]]) -> None:
         """
@@ -1057,6 +1218,23 @@ class RelationshipProperty(Generic[T, U]):
         if getattr(self._source_node, "_destroyed", True):
             raise InstanceDestroyed()
 
+    def _invalidate_caches(self, relationships_deleted: bool = False) -> None:
+        """
+        Invalidates the query caches of all models sharing labels with the source or target model, and optionally
+        the cached entities, after the relationships between them have been modified.
+
+        Args:
+            relationships_deleted (bool, optional): Whether relationships have been deleted, in which case cached
+                relationships of the relationship model are removed from the entity cache. Defaults to `False`.
+        """
+        labels = set(cast(T, self._source_node)._settings.labels)
+        labels.update(cast(Type[T], self._target_model)._settings.labels)
+
+        self._client._invalidate_query_caches(labels)
+
+        if relationships_deleted:
+            self._client._invalidate_cached_entities(type_=cast(Type[U], self._relationship_model)._settings.type)
+
     async def _ensure_cardinality(self) -> None:
         """
         Checks for any cardinality violations before creating a new relationship.
@@ -36,6 +36,10 @@ class BaseModelSettings(BaseModel):
 
     pre_hooks: Dict[str, List[Callable]] = {}
     post_hooks: Dict[str, List[Callable]] = {}
+    version_field: Optional[str] = None
+    trusted_hydration: bool = False
+    concurrent_hooks: bool = False
+    lazy_fields: Set[str] = set()
 
     if IS_PYDANTIC_V2:
         normalize_pre_hooks = field_validator("pre_hooks", mode="before")(_normalize_hooks)
@@ -61,6 +65,8 @@ class NodeModelSettings(BaseModelSettings):
 
     labels: Set[str] = set()
     auto_fetch_nodes: Optional[bool] = None
+    query_cache_size: Optional[int] = None
+    query_cache_ttl: Optional[float] = None
 
 
 class RelationshipModelSettings(BaseModelSettings):
@@ -2,7 +2,8 @@
 Pydantic compatibility utility module.
 """
 
-from typing import Any, Type, Union
+import json
+from typing import Annotated, Any, Callable, Type, Union
 
 import pydantic
 from pydantic import BaseModel
@@ -11,8 +12,9 @@ IS_PYDANTIC_V2 = int(pydantic.VERSION.split(".", maxsplit=1)[0]) >= 2
 
 if IS_PYDANTIC_V2:
     from pydantic import TypeAdapter
+    from pydantic_core import SchemaValidator
 else:
-    from pydantic import parse_obj_as
+    from pydantic import ValidationError, parse_obj_as
 
 
 def parse_object_as(object_type: Type, data: Any):
@@ -29,6 +31,48 @@ def get_field_type(field):
         return field.outer_type_
 
 
+def get_field_validator(model, field_name: str, with_validators: bool = False) -> Callable[[Any], Any]:
+    if IS_PYDANTIC_V2:
+        if with_validators:
+            # The field validators defined on the model are only part of the core schema of the model, so the
+            # schema of the field is taken from there
+            schema = model.__pydantic_core_schema__
+            definitions = schema["definitions"] if schema["type"] == "definitions" else []
+            schema = schema["schema"] if schema["type"] == "definitions" else schema
+            config = None
+
+            while schema["type"] != "model-fields":
+                if schema["type"] == "definition-ref":
+                    schema = next(
+                        definition for definition in definitions if definition.get("ref") == schema["schema_ref"]
+                    )
+                    continue
+                if schema["type"] == "model":
+                    config = schema.get("config", None)
+
+                schema = schema["schema"]
+
+            field_schema = schema["fields"][field_name]["schema"]
+            if len(definitions) != 0:
+                field_schema = {"type": "definitions", "schema": field_schema, "definitions": definitions}
+
+            return SchemaValidator(field_schema, config).validate_python
+
+        field = model.model_fields[field_name]
+        annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+        return TypeAdapter(annotation).validate_python
+    else:
+        field = model.__fields__[field_name]
+
+        def validate(value: Any) -> Any:
+            validated, errors = field.validate(value, {}, loc=field_name, cls=model)
+            if errors:
+                raise ValidationError(errors if isinstance(errors, list) else [errors], model)
+            return validated
+
+        return validate
+
+
 def get_model_fields(model):
     if IS_PYDANTIC_V2:
         return model.model_fields
@@ -59,6 +103,13 @@ def get_config_value(model, parameter: str):
         return getattr(model.Config, parameter, None)
 
 
+def construct_model(model_type, **kwargs):
+    if IS_PYDANTIC_V2:
+        return model_type.model_construct(**kwargs)
+    else:
+        return model_type.construct(**kwargs)
+
+
 def get_model_dump(model: BaseModel, *args, **kwargs):
     if IS_PYDANTIC_V2:
         return model.model_dump(*args, **kwargs)
@@ -73,6 +124,13 @@ def get_model_dump_json(model: BaseModel, *args, **kwargs):
         return model.json(*args, **kwargs)
 
 
+def get_model_dump_jsonable(model: BaseModel, *args, **kwargs):
+    if IS_PYDANTIC_V2:
+        return model.model_dump(*args, mode="json", **kwargs)
+    else:
+        return json.loads(model.json(*args, **kwargs))
+
+
 def get_schema(model: Union[BaseModel, Type[BaseModel]], *args, **kwargs):
     if IS_PYDANTIC_V2:
         return model.model_json_schema(*args, **kwargs)
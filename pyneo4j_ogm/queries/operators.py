@@ -11,6 +11,7 @@ class Operators:
     """
 
     _parameter_indent: int = 0
+    _parameter_prefix: str = ""
     _operators: Dict[str, str] = {
         "$eq": "{property_var} = ${param_var}",
         "$neq": "{property_var} <> ${param_var}",
@@ -34,8 +35,9 @@ class Operators:
     ref: str = "n"
     parameters: Dict[str, Union[Any, List[str]]] = {}
 
-    def reset_state(self) -> None:
+    def reset_state(self, parameter_prefix: str = "") -> None:
         self._parameter_indent = 0
+        self._parameter_prefix = parameter_prefix
         self.parameters = {}
 
     def build_operators(self, filters: Dict[str, Any]) -> Optional[str]:
@@ -451,7 +453,7 @@ class Operators:
         Returns:
             str: The unique variable name.
         """
-        param_var = f"_n_{self._parameter_indent}"
+        param_var = f"{self._parameter_prefix}_n_{self._parameter_indent}"
 
         self._parameter_indent += 1
         return param_var
@@ -1,14 +1,17 @@
 """
 Builds parts of queries related to filters and options.
 """
+import re
 from copy import deepcopy
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     List,
     Literal,
     Optional,
+    Tuple,
     TypedDict,
     Union,
     cast,
@@ -41,6 +44,15 @@ else:
     RelationshipPropertyDirection = object
 
 
+# Resolves the name of a relationship-property used in a nested projection to the type of the relationship, the
+# direction of the relationship-property, the labels of the target model and the resolver of the target model
+RelationshipProjectionResolver = Callable[
+    [str], Tuple[str, RelationshipPropertyDirection, List[str], "RelationshipProjectionResolver"]
+]
+
+IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
 class FilterQueries(TypedDict):
     """
     Type definition for `query` attribute.
@@ -132,7 +144,11 @@ class QueryBuilder:
         self.parameters = self._operator_builder.parameters
 
     def relationship_property_filters(
-        self, filters: RelationshipPropertyFilters, ref: str = "r", node_ref: str = "end"
+        self,
+        filters: RelationshipPropertyFilters,
+        ref: str = "r",
+        node_ref: str = "end",
+        parameter_prefix: str = "",
     ) -> None:
         """
         Builds the relationship and node filters for relationship property queries.
@@ -141,9 +157,11 @@ class QueryBuilder:
             filters (Dict[str, Any]): The filters to build.
             ref (str, optional): The reference to the relationship. Defaults to `'r'`.
             node_ref (str, optional): The reference to the node. Defaults to `'end'`.
+            parameter_prefix (str, optional): Prefix for the generated parameter names. Used to avoid name collisions
+                when the filters are used in the same query as other filters. Defaults to `''`.
         """
         logger.debug("Building relationship property filters %s", filters)
-        self._operator_builder.reset_state()
+        self._operator_builder.reset_state(parameter_prefix=parameter_prefix)
         normalized_filters = self._operator_builder.normalize_expressions(expressions=cast(Dict[str, Any], filters))
 
         # Validate filters with pydantic model
@@ -387,26 +405,27 @@ class QueryBuilder:
             case _:
                 raise InvalidRelationshipDirection(direction)
 
-    def build_projections(self, projections: Projection, ref: str = "n") -> None:
+    def build_projections(
+        self,
+        projections: Projection,
+        ref: str = "n",
+        relationship_resolver: Optional[RelationshipProjectionResolver] = None,
+    ) -> None:
         """
         Builds a projection which only returns the node properties defined in the projection.
 
         Args:
             ref (str): The reference to the node. Defaults to `'n'`.
             projections (Projection): The projections to build.
+            relationship_resolver (RelationshipProjectionResolver, optional): Resolves the relationship-properties
+                used in nested projections. If `None`, nested projections are ignored. Defaults to `None`.
         """
         if not isinstance(projections, dict):
             return
 
-        projection_queries: List[str] = []
-
-        for projection, property_name in projections.items():
-            if property_name == "$elementId":
-                projection_queries.append(f"{str(projection)}: elementId({ref})")
-            elif property_name == "$id":
-                projection_queries.append(f"{str(projection)}: ID({ref})")
-            else:
-                projection_queries.append(f"{str(projection)}: {ref}.{str(property_name)}")
+        projection_queries = self._build_projection_map(
+            projections=projections, ref=ref, relationship_resolver=relationship_resolver
+        )
 
         if len(projection_queries) > 0:
             self.query["projections"] = (
@@ -415,3 +434,89 @@ class QueryBuilder:
                 if len(projection_queries) > 0
                 else ""
             )
+
+    def _build_projection_map(
+        self,
+        projections: Projection,
+        ref: str,
+        relationship_resolver: Optional[RelationshipProjectionResolver],
+    ) -> List[str]:
+        """
+        Builds the entries of a map projection. Nested projections of relationship-properties are compiled to
+        pattern comprehensions, which project the connected nodes within the same query.
+
+        Args:
+            projections (Projection): The projections to build.
+            ref (str): The reference to the node.
+            relationship_resolver (Optional[RelationshipProjectionResolver]): Resolves the relationship-properties
+                used in nested projections. If `None`, nested projections are ignored.
+
+        Returns:
+            List[str]: The entries of the map projection.
+        """
+        projection_queries: List[str] = []
+        ref_query = self._escape_identifier(ref)
+
+        for projection, property_name in projections.items():
+            projection_key = self._escape_identifier(str(projection))
+
+            if isinstance(property_name, dict):
+                relationship_property = property_name.get("$relationship", None)
+                fields = property_name.get("fields", None)
+
+                if relationship_resolver is None or not isinstance(relationship_property, str):
+                    logger.debug("Skipping nested projection %s, no relationship-property to resolve", projection)
+                    continue
+                if not isinstance(fields, dict):
+                    logger.debug("Skipping nested projection %s, no fields to project", projection)
+                    continue
+
+                relationship_type, direction, end_node_labels, end_node_resolver = relationship_resolver(
+                    relationship_property
+                )
+                # The reference is only escaped where it is used, so nested references can be built from it
+                end_node_ref = f"{ref}_{projection}"
+                match_query = self.relationship_match(
+                    ref=None,
+                    type_=relationship_type,
+                    direction=direction,
+                    start_node_ref=ref_query,
+                    end_node_ref=self._escape_identifier(end_node_ref),
+                    end_node_labels=end_node_labels,
+                )
+                nested_queries = self._build_projection_map(
+                    projections=fields, ref=end_node_ref, relationship_resolver=end_node_resolver
+                )
+                limit = property_name.get("limit", None)
+                limit_query = f"[..{int(limit)}]" if limit is not None else ""
+
+                projection_queries.append(
+                    f"{projection_key}: [{match_query} | {{{', '.join(nested_queries)}}}]{limit_query}"
+                )
+            elif property_name == "$elementId":
+                projection_queries.append(f"{projection_key}: elementId({ref_query})")
+            elif property_name == "$id":
+                projection_queries.append(f"{projection_key}: ID({ref_query})")
+            else:
+                projection_queries.append(
+                    f"{projection_key}: {ref_query}.{self._escape_identifier(str(property_name))}"
+                )
+
+        return projection_queries
+
+    @staticmethod
+    def _escape_identifier(name: str) -> str:
+        """
+        Escapes a name which is not a valid identifier, so it can be safely used in a query. Valid identifiers are
+        returned as they are.
+
+        Args:
+            name (str): The name to escape.
+
+        Returns:
+            str: The name or the escaped identifier.
+        """
+        if IDENTIFIER_PATTERN.match(name) is not None:
+            return name
+
+        return f"`{name.replace('`', '``')}`"
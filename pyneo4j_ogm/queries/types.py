@@ -2,9 +2,9 @@
 Types used to describe queries.
 """
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
 
-from typing_extensions import NotRequired, TypedDict
+from typing_extensions import NotRequired, Required, TypedDict
 
 
 class QueryOptionsOrder(str, Enum):
@@ -26,6 +26,19 @@ class RelationshipMatchDirection(str, Enum):
     BOTH = "BOTH"
 
 
+class AggregationFunction(str, Enum):
+    """
+    Enum for aggregation functions which can be used in a aggregation metric.
+    """
+
+    COUNT = "count"
+    SUM = "sum"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+    COLLECT = "collect"
+
+
 NumericQueryDataType = Union[int, float]
 
 # We need to define 5 different typed dictionaries here because the `$size` operator can only be
@@ -198,5 +211,35 @@ class QueryOptions(TypedDict, total=False):
     order: Optional[QueryOptionsOrder]
 
 
+class AutoFetchModel(TypedDict, total=False):
+    """
+    Interface to describe a relationship-property to auto-fetch with filters and options applied to the auto-fetched
+    nodes. Instead of the name of a relationship-property, a model can be defined as a shorthand for all
+    relationship-properties with the model as target model.
+    """
+
+    relationship_property: str
+    model: Union[str, Type[Any]]
+    filters: Optional[RelationshipPropertyFilters]
+    options: Optional[QueryOptions]
+
+
+# Interface for a nested projection of the nodes connected through a relationship-property. The `fields` are
+# projected from the connected nodes and can contain further nested projections
+RelationshipProjection = TypedDict(
+    "RelationshipProjection",
+    {
+        "$relationship": Required[str],
+        "fields": Required[Dict[str, Any]],
+        "limit": NotRequired[Optional[int]],
+    },
+)
+
+
 # Interface for a projection
-Projection = Dict[str, Union[str, Literal["$elementId"], Literal["$id"]]]
+Projection = Dict[str, Union[str, Literal["$elementId"], Literal["$id"], RelationshipProjection]]
+
+
+# Interface for aggregation metrics. The key defines the name of the metric in the returned rows and the value
+# defines the aggregation function and the model property to aggregate
+AggregationMetrics = Dict[str, Tuple[Union[AggregationFunction, str], Optional[str]]]
@@ -2,7 +2,7 @@
 # pyright: reportGeneralTypeIssues=false
 
 import json
-from typing import Union, cast
+from typing import List, Union, cast
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,7 +10,11 @@ import pytest
 from pyneo4j_ogm.core.base import ModelBase, hooks
 from pyneo4j_ogm.core.node import NodeModel
 from pyneo4j_ogm.core.relationship import RelationshipModel
-from pyneo4j_ogm.exceptions import ListItemNotEncodable, UnregisteredModel
+from pyneo4j_ogm.exceptions import (
+    ListItemNotEncodable,
+    UnknownProperty,
+    UnregisteredModel,
+)
 from pyneo4j_ogm.fields.settings import BaseModelSettings
 from pyneo4j_ogm.pydantic_utils import get_model_dump, get_model_dump_json
 from tests.fixtures.db_setup import Developer
@@ -106,6 +110,24 @@ def test_node_model_modified_properties():
     assert model.modified_properties == {"a", "b"}
 
 
+def test_mark_modified():
+    class MarkModifiedTest(NodeModel):
+        a: str = "a"
+        b: List[str] = []
+
+    setattr(MarkModifiedTest, "_client", None)
+
+    model = MarkModifiedTest()
+    model.b.append("b")
+    assert model.modified_properties == set()
+
+    model.mark_modified("b")
+    assert model.modified_properties == {"b"}
+
+    with pytest.raises(UnknownProperty):
+        model.mark_modified("c")
+
+
 def test_relationship_model_modified_properties():
     class ModifiedPropertiesTest(RelationshipModel):
         a: str = "a"
@@ -181,6 +203,33 @@ def test_deflate_non_encodable_list():
         NonEncodableModel()._deflate({"list_field": [object()]})
 
 
+def test_deflate_uses_property_encodings():
+    class EncodedModel(ModelBase):
+        tags: List[str] = []
+        values: list = []
+
+    setattr(EncodedModel, "_client", None)
+
+    deflated = EncodedModel()._deflate({"tags": ["a", "b"], "values": ["a", {"b": 1}], "extra": {"c": 2}})
+
+    assert deflated == {"tags": ["a", "b"], "values": ["a", '{"b": 1}'], "extra": '{"c": 2}'}
+
+
+def test_inflate_uses_property_encodings():
+    class EncodedModel(ModelBase):
+        name: str = ""
+        tags: List[str] = []
+        values: list = []
+
+    setattr(EncodedModel, "_client", None)
+
+    inflated = EncodedModel._inflate_properties(
+        {"name": "123", "tags": ["true", "null"], "values": ["a", '{"b": 1}'], "extra": '{"c": 2}'}
+    )
+
+    assert inflated == {"name": "123", "tags": ["true", "null"], "values": ["a", {"b": 1}], "extra": {"c": 2}}
+
+
 def test_node_model_serialization():
     id_ = 1
     element_id = "4:08f8a347-1856-487c-8705-26d2b4a69bb7:1"
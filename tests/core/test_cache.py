@@ -0,0 +1,206 @@
+# pylint: disable=unused-argument, unused-import, redefined-outer-name, protected-access, missing-module-docstring, missing-class-docstring
+# pyright: reportGeneralTypeIssues=false
+
+from unittest.mock import patch
+
+from neo4j.graph import Graph, Node
+
+from pyneo4j_ogm.core.cache import CachedNode, CachedRelationship, EntityCache, QueryCache
+
+
+def test_build_key():
+    key = QueryCache.build_key("MATCH (n) RETURN n", {"b": 1, "a": [1, 2]})
+
+    assert key == QueryCache.build_key("MATCH (n) RETURN n", {"a": [1, 2], "b": 1})
+    assert key != QueryCache.build_key("MATCH (n) RETURN n", {"a": [1, 2], "b": 2})
+    assert key != QueryCache.build_key("MATCH (n) RETURN count(n)", {"a": [1, 2], "b": 1})
+
+
+def test_get_and_set():
+    cache = QueryCache(max_size=2)
+
+    assert cache.get("key") is None
+
+    cache.set("key", ([[1]], ["n"]))
+    assert cache.get("key") == ([[1]], ["n"])
+    assert len(cache) == 1
+
+
+def test_lru_eviction():
+    cache = QueryCache(max_size=2)
+
+    cache.set("a", ([[1]], ["n"]))
+    cache.set("b", ([[2]], ["n"]))
+    cache.get("a")
+    cache.set("c", ([[3]], ["n"]))
+
+    assert len(cache) == 2
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_ttl_expiration():
+    cache = QueryCache(max_size=2, ttl=10)
+
+    with patch("pyneo4j_ogm.core.cache.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100
+        cache.set("key", ([[1]], ["n"]))
+
+        mock_monotonic.return_value = 105
+        assert cache.get("key") is not None
+
+        mock_monotonic.return_value = 111
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+
+def test_clear():
+    cache = QueryCache(max_size=2)
+
+    cache.set("key", ([[1]], ["n"]))
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.generation == 1
+
+
+def test_set_skips_outdated_generation():
+    cache = QueryCache(max_size=2)
+    generation = cache.generation
+
+    cache.clear()
+    cache.set("key", ([[1]], ["n"]), generation=generation)
+
+    assert cache.get("key") is None
+
+
+def test_copy_results():
+    projection = {"name": "John", "tags": ["a"]}
+    results = [[[projection], 1]]
+
+    copied = QueryCache.copy_results(results)
+    copied[0][0][0]["name"] = "Jane"
+    copied[0][0][0]["tags"].append("b")
+
+    assert copied == [[[{"name": "Jane", "tags": ["a", "b"]}], 1]]
+    assert projection == {"name": "John", "tags": ["a"]}
+
+
+def build_graph():
+    graph = Graph()
+    start_node = Node(graph, "start", 1, {"Developer"}, {"name": "John"})
+    end_node = Node(graph, "end", 2, {"Coffee"}, {"flavor": "Mocha"})
+    relationship = graph.relationship_type("CONSUMED")(graph, "relationship", 3, {"liked": True})
+    setattr(relationship, "_start_node", start_node)
+    setattr(relationship, "_end_node", end_node)
+
+    return start_node, end_node, relationship
+
+
+def test_entity_cache_stores_plain_data():
+    start_node, _, relationship = build_graph()
+    cache = EntityCache(max_size=10)
+
+    cache.set(start_node)
+    cache.set(relationship)
+
+    cached_node = cache.get("start")
+    cached_relationship = cache.get("relationship")
+
+    assert isinstance(cached_node, CachedNode)
+    assert cached_node.element_id == "start" and cached_node.id == 1
+    assert cached_node.labels == frozenset({"Developer"})
+    assert cached_node.properties == {"name": "John"}
+    assert isinstance(cached_relationship, CachedRelationship)
+    assert cached_relationship.type == "CONSUMED"
+    assert cached_relationship.properties == {"liked": True}
+    assert cached_relationship.start_node.element_id == "start"
+    assert cached_relationship.start_node.properties == {}
+    assert cached_relationship.end_node.element_id == "end"
+    assert cached_relationship.end_node.labels == frozenset({"Coffee"})
+
+
+def test_entity_cache_ttl_expiration():
+    start_node, _, _ = build_graph()
+    cache = EntityCache(max_size=10, ttl=10)
+
+    with patch("pyneo4j_ogm.core.cache.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100
+        cache.set(start_node)
+
+        mock_monotonic.return_value = 105
+        assert cache.get("start") is not None
+
+        mock_monotonic.return_value = 111
+        assert "start" not in cache
+        assert cache.get("start") is None
+        assert len(cache) == 0
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+
+def test_entity_cache_stats():
+    start_node, end_node, _ = build_graph()
+    cache = EntityCache(max_size=1)
+
+    cache.set(start_node)
+    cache.get("start")
+    cache.get("end")
+    cache.set(end_node)
+
+    assert cache.stats == {
+        "size": 1,
+        "max_size": 1,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "invalidations": 0,
+    }
+    assert "end" in cache
+
+
+def test_entity_cache_invalidate():
+    start_node, end_node, relationship = build_graph()
+    cache = EntityCache(max_size=10)
+
+    for entity in [start_node, end_node, relationship]:
+        cache.set(entity)
+
+    cache.invalidate("start")
+
+    assert "start" not in cache
+    assert "relationship" not in cache
+    assert "end" in cache
+    assert cache.invalidations == 2
+
+
+def test_entity_cache_invalidate_labels():
+    start_node, end_node, relationship = build_graph()
+    cache = EntityCache(max_size=10)
+
+    for entity in [start_node, end_node, relationship]:
+        cache.set(entity)
+
+    cache.invalidate_labels({"Coffee"})
+
+    assert "start" in cache
+    assert "end" not in cache
+    assert "relationship" not in cache
+
+
+def test_entity_cache_invalidate_type():
+    start_node, end_node, relationship = build_graph()
+    cache = EntityCache(max_size=10)
+
+    for entity in [start_node, end_node, relationship]:
+        cache.set(entity)
+
+    cache.invalidate_type("CONSUMED")
+
+    assert len(cache) == 2
+    assert "relationship" not in cache
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.invalidations == 3
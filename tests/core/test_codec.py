@@ -0,0 +1,115 @@
+# pylint: disable=unused-argument, unused-import, redefined-outer-name, protected-access, missing-module-docstring, missing-class-docstring
+# pyright: reportGeneralTypeIssues=false
+
+import json
+from importlib.util import find_spec
+from typing import Any, Dict
+
+import pytest
+
+from pyneo4j_ogm.core.base import ModelBase
+from pyneo4j_ogm.core.codec import (
+    JSONCodec,
+    JSONCodecBackend,
+    MsgspecCodec,
+    OrjsonCodec,
+    get_codec,
+)
+from pyneo4j_ogm.pydantic_utils import IS_PYDANTIC_V2
+
+
+class CodecClient:
+    def __init__(self, codec: JSONCodec) -> None:
+        self.codec = codec
+
+
+def test_json_codec_matches_stdlib():
+    value = {"name": "test", "values": [1, 2.5, None, True], "nested": {"ü": "ö"}}
+    codec = get_codec(JSONCodecBackend.JSON)
+
+    assert codec.dumps(value) == json.dumps(value)
+    assert codec.loads(json.dumps(value)) == value
+
+
+@pytest.mark.parametrize(
+    "backend, codec_class",
+    [(JSONCodecBackend.ORJSON, OrjsonCodec), (JSONCodecBackend.MSGSPEC, MsgspecCodec)],
+)
+def test_optional_codecs(backend, codec_class):
+    codec = get_codec(backend)
+
+    if find_spec(backend.value) is None:
+        assert type(codec) is JSONCodec  # pylint: disable=unidiomatic-typecheck
+        return
+
+    value = {"name": "test", "values": [1, 2.5, None, True], "nested": {"ü": "ö"}}
+
+    assert isinstance(codec, codec_class)
+    assert json.loads(codec.dumps(value)) == value
+    assert codec.loads(json.dumps(value)) == value
+    assert codec.dumps({"value": object()}, default=lambda _: "encoded") == codec.dumps({"value": "encoded"})
+
+    with pytest.raises(ValueError):
+        codec.loads("not json")
+
+
+@pytest.mark.parametrize("backend", [JSONCodecBackend.JSON, JSONCodecBackend.ORJSON, JSONCodecBackend.MSGSPEC])
+def test_codec_dumps_kwargs(backend):
+    codec = get_codec(backend)
+    value = {"b": [1, 2], "a": {"c": None}}
+
+    assert codec.dumps(value, sort_keys=True, indent=2) == json.dumps(value, sort_keys=True, indent=2)
+
+    if codec.backend == JSONCodecBackend.JSON:
+        assert codec.dumps(value, separators=(",", ":")) == json.dumps(value, separators=(",", ":"))
+    else:
+        with pytest.raises(TypeError):
+            codec.dumps(value, separators=(",", ":"))
+
+
+def test_auto_codec():
+    codec = get_codec(JSONCodecBackend.AUTO)
+
+    if find_spec("orjson") is not None:
+        assert codec.backend == JSONCodecBackend.ORJSON
+    elif find_spec("msgspec") is not None:
+        assert codec.backend == JSONCodecBackend.MSGSPEC
+    else:
+        assert codec.backend == JSONCodecBackend.JSON
+
+
+def test_invalid_codec_backend():
+    with pytest.raises(ValueError):
+        get_codec("invalid")
+
+
+def test_models_use_client_codec():
+    class CodecModel(ModelBase):
+        dict_field: Dict[str, Any] = {}
+
+    setattr(CodecModel, "_client", None)
+    assert CodecModel._get_codec().backend == JSONCodecBackend.JSON
+
+    codec = get_codec(JSONCodecBackend.AUTO)
+    setattr(CodecModel, "_client", CodecClient(codec))
+
+    deflated = CodecModel()._deflate({"dict_field": {"a": [1, 2]}})
+
+    assert deflated == {"dict_field": codec.dumps({"a": [1, 2]})}
+    assert CodecModel._inflate_properties(deflated) == {"dict_field": {"a": [1, 2]}}
+
+
+def test_model_json_kwargs():
+    class CodecModel(ModelBase):
+        str_field: str = "test"
+        dict_field: Dict[str, Any] = {"b": 1, "a": 2}
+
+    setattr(CodecModel, "_client", None)
+    model = CodecModel()
+
+    if IS_PYDANTIC_V2:
+        assert json.loads(model.model_dump_json(indent=2)) == json.loads(model.model_dump_json())
+    else:
+        serialized = json.loads(model.json())
+
+        assert model.json(indent=2, sort_keys=True) == json.dumps(serialized, indent=2, sort_keys=True)
@@ -0,0 +1,149 @@
+# pylint: disable=unused-argument, unused-import, redefined-outer-name, protected-access, missing-module-docstring, missing-class-docstring
+# pyright: reportGeneralTypeIssues=false
+
+import asyncio
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pyneo4j_ogm.core.base import hooks
+from pyneo4j_ogm.core.client import Pyneo4jClient
+from pyneo4j_ogm.core.hooks import (
+    DEFAULT_EXECUTOR,
+    BackgroundHookExecutor,
+    get_compiled_hooks,
+    non_blocking,
+)
+from pyneo4j_ogm.fields.settings import BaseModelSettings
+
+
+class HookClient:
+    def __init__(self) -> None:
+        self.hook_executor = BackgroundHookExecutor(max_concurrency=2)
+
+
+def build_model(settings: BaseModelSettings):
+    class HookModel:
+        _client = HookClient()
+        _settings = settings
+        _compiled_hooks = {}
+
+        @hooks
+        async def save(self):
+            calls.append("save")
+            return "result"
+
+    calls: List[str] = []
+    return HookModel, calls
+
+
+def test_compiled_hooks_are_cached():
+    def pre_hook(instance):
+        pass
+
+    settings = BaseModelSettings(pre_hooks={"save": [pre_hook]})
+    model, _ = build_model(settings)
+
+    compiled = get_compiled_hooks(model(), "save")
+    assert compiled is not None
+    assert compiled.pre == ((pre_hook, False),)
+    assert get_compiled_hooks(model(), "save") is compiled
+    assert get_compiled_hooks(model(), "delete") is None
+
+    settings.pre_hooks["save"].append(pre_hook)
+    recompiled = get_compiled_hooks(model(), "save")
+    assert recompiled is not compiled
+    assert len(recompiled.pre) == 2
+
+
+async def test_concurrent_hooks():
+    events: List[str] = []
+
+    async def slow_hook(instance):
+        events.append("slow start")
+        await asyncio.sleep(0.01)
+        events.append("slow end")
+
+    async def fast_hook(instance):
+        events.append("fast")
+
+    settings = BaseModelSettings(pre_hooks={"save": [slow_hook, fast_hook]}, concurrent_hooks=True)
+    model, calls = build_model(settings)
+
+    await model().save()
+
+    assert events == ["slow start", "fast", "slow end"]
+    assert calls == ["save"]
+
+
+async def test_non_blocking_post_hooks():
+    events: List[str] = []
+
+    @non_blocking
+    async def audit_hook(instance, result):
+        await asyncio.sleep(0.01)
+        events.append(f"audit {result}")
+
+    def failing_hook(instance, result):
+        raise ValueError("Background hooks only log exceptions")
+
+    def post_hook(instance, result):
+        events.append(f"post {result}")
+
+    settings = BaseModelSettings(post_hooks={"save": [audit_hook, non_blocking(failing_hook), post_hook]})
+    model, _ = build_model(settings)
+    executor = model._client.hook_executor
+
+    with patch("pyneo4j_ogm.core.hooks.logger") as mock_logger:
+        assert await model().save() == "result"
+        assert events == ["post result"]
+        assert executor.pending == 2
+
+        await executor.flush()
+
+        mock_logger.exception.assert_called_once_with("Background hook %s failed", "failing_hook")
+
+    assert events == ["post result", "audit result"]
+    assert executor.pending == 0
+
+
+async def test_background_executor_limits_concurrency():
+    running = 0
+    max_running = 0
+
+    async def hook():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    executor = BackgroundHookExecutor(max_concurrency=2)
+    for _ in range(5):
+        executor.submit(hook)
+
+    await executor.flush()
+
+    assert max_running == 2
+    assert executor.pending == 0
+
+    with pytest.raises(ValueError):
+        BackgroundHookExecutor(max_concurrency=0)
+
+
+async def test_close_flushes_default_executor():
+    events: List[str] = []
+
+    async def hook():
+        await asyncio.sleep(0.01)
+        events.append("hook")
+
+    client = Pyneo4jClient()
+    setattr(client, "_driver", AsyncMock())
+
+    DEFAULT_EXECUTOR.submit(hook)
+    await client.close()
+
+    assert events == ["hook"]
+    assert DEFAULT_EXECUTOR.pending == 0
@@ -1,41 +1,63 @@
 # pylint: disable=unused-argument, unused-import, redefined-outer-name, protected-access, missing-module-docstring, missing-class-docstring
 # pyright: reportGeneralTypeIssues=false
 
+import asyncio
+import gc
 import json
+import weakref
+from copy import deepcopy
 from typing import Any, Dict, List, cast
 from unittest.mock import patch
 
 import pytest
 from neo4j import AsyncSession
 from neo4j.graph import Graph, Node
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from typing_extensions import LiteralString
 
 from pyneo4j_ogm.core.client import Pyneo4jClient
 from pyneo4j_ogm.core.node import NodeModel, ensure_alive
+from pyneo4j_ogm.core.relationship import RelationshipModel
 from pyneo4j_ogm.exceptions import (
     InstanceDestroyed,
     InstanceNotHydrated,
     InvalidFilters,
+    InvalidTargetNode,
+    InvalidUniqueKey,
     ListItemNotEncodable,
     NoResultFound,
+    SourceNodeReleased,
     UnexpectedEmptyResult,
+    UnindexedProperty,
+    UnknownProperty,
+    UnknownRelationshipProperty,
     UnregisteredModel,
+    VersionConflict,
 )
 from pyneo4j_ogm.fields.property_options import WithOptions
+from pyneo4j_ogm.fields.relationship_property import (
+    RelationshipProperty,
+    RelationshipPropertyDirection,
+)
 from pyneo4j_ogm.pydantic_utils import (
     IS_PYDANTIC_V2,
     get_model_dump,
     get_model_dump_json,
     get_schema,
+    parse_model,
+)
+from pyneo4j_ogm.queries.types import (
+    AggregationFunction,
+    QueryOptionsOrder,
+    RelationshipMatchDirection,
 )
-from pyneo4j_ogm.queries.types import RelationshipMatchDirection
 from tests.fixtures.db_setup import (
     Bestseller,
     Coffee,
     CoffeeShop,
     Consumed,
     Developer,
+    Sells,
     WorkedWith,
     client,
     session,
@@ -43,6 +65,12 @@ from tests.fixtures.db_setup import (
 )
 from tests.utils.string_utils import assert_string_equality
 
+if IS_PYDANTIC_V2:
+    from pydantic import field_validator, model_validator
+else:
+    from pydantic import root_validator
+    from pydantic import validator as field_validator
+
 
 async def test_update(client: Pyneo4jClient, session: AsyncSession):
     await client.register_models([CoffeeShop])
@@ -51,9 +79,10 @@ async def test_update(client: Pyneo4jClient, session: AsyncSession):
     await node.create()
 
     node.tags.append("neighborhood")
+    node.mark_modified("tags")
     await node.update()
     assert node.tags == ["modern", "trendy", "neighborhood"]
-    assert node._db_properties == {"rating": 5, "tags": ["modern", "trendy", "neighborhood"]}
+    assert node.modified_properties == set()
 
     results = await session.run(
         cast(
@@ -76,6 +105,156 @@ async def test_update(client: Pyneo4jClient, session: AsyncSession):
     assert node_result["tags"] == ["modern", "trendy", "neighborhood"]
 
 
+async def test_update_with_version_field(client: Pyneo4jClient, session: AsyncSession):
+    class VersionedNode(NodeModel):
+        name: str
+        version: int = 0
+
+        class Settings:
+            version_field = "version"
+
+    await client.register_models([VersionedNode])
+
+    node = await VersionedNode(name="John").create()
+    node.name = "Sam"
+    await node.update()
+
+    assert node.version == 1
+    assert node.modified_properties == set()
+
+    results = await session.run(
+        "MATCH (n:VersionedNode) WHERE elementId(n) = $element_id RETURN n",
+        {"element_id": node._element_id},
+    )
+    query_result: List[List[Node]] = await results.values()
+    await results.consume()
+
+    assert query_result[0][0]["name"] == "Sam"
+    assert query_result[0][0]["version"] == 1
+
+    concurrent_node = await VersionedNode.find_one({"name": "Sam"})
+    assert concurrent_node is not None
+    concurrent_node.name = "Alice"
+    await concurrent_node.update()
+
+    node.name = "Bob"
+    with pytest.raises(VersionConflict):
+        await node.update()
+
+    results = await session.run(
+        "MATCH (n:VersionedNode) WHERE elementId(n) = $element_id RETURN n",
+        {"element_id": node._element_id},
+    )
+    query_result = await results.values()
+    await results.consume()
+
+    assert query_result[0][0]["name"] == "Alice"
+    assert query_result[0][0]["version"] == 2
+
+
+async def test_concurrent_updates_with_version_field(client: Pyneo4jClient, session: AsyncSession):
+    class VersionedNode(NodeModel):
+        name: str
+        version: int = 0
+
+        class Settings:
+            version_field = "version"
+
+    await client.register_models([VersionedNode])
+    await VersionedNode(name="John").create()
+
+    first = await VersionedNode.find_one({"name": "John"})
+    second = await VersionedNode.find_one({"name": "John"})
+    assert first is not None and second is not None
+
+    first.name = "Sam"
+    second.name = "Alice"
+    results = await asyncio.gather(first.update(), second.update(), return_exceptions=True)
+
+    assert len([result for result in results if isinstance(result, VersionConflict)]) == 1
+    assert len([result for result in results if result is None]) == 1
+
+    results = await session.run(
+        "MATCH (n:VersionedNode) WHERE elementId(n) = $element_id RETURN n",
+        {"element_id": first._element_id},
+    )
+    query_result: List[List[Node]] = await results.values()
+    await results.consume()
+
+    assert query_result[0][0]["version"] == 1
+    assert "_version_lock" not in query_result[0][0]
+
+
+async def test_update_one_with_version_field(client: Pyneo4jClient):
+    class VersionedNode(NodeModel):
+        name: str
+        version: int = 0
+
+        class Settings:
+            version_field = "version"
+
+    await client.register_models([VersionedNode])
+    await VersionedNode(name="John").create()
+
+    updated_node = await VersionedNode.update_one({"name": "Sam", "version": 10}, {"name": "John"}, new=True)
+
+    assert updated_node is not None
+    assert updated_node.name == "Sam"
+    assert updated_node.version == 1
+
+    updated_node = await VersionedNode.update_one({"name": "Alice"}, {"name": "Sam", "version": 0})
+    assert updated_node is None
+
+
+async def test_update_one_expected_version(client: Pyneo4jClient):
+    class VersionedNode(NodeModel):
+        name: str
+        version: int = 0
+
+        class Settings:
+            version_field = "version"
+
+    await client.register_models([VersionedNode])
+
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_cypher.return_value = ([[[], [["element-id", 2]]]], ["_updated", "_conflicts"])
+
+        with pytest.raises(VersionConflict):
+            await VersionedNode.update_one({"name": "Sam"}, {"name": "John"}, expected_version=1)
+
+        query = mock_cypher.call_args.kwargs["query"]
+        assert query.index("SET n._version_lock = true") < query.index("_entity.version <> $_expected_version")
+        assert "REMOVE n._version_lock" in query
+        assert mock_cypher.call_args.kwargs["parameters"]["_expected_version"] == 1
+
+        mock_node = Node(
+            graph=Graph(),
+            element_id="element-id",
+            id_=1,
+            properties={"name": "Sam", "version": 2},
+        )
+        mock_cypher.return_value = (
+            [[[[{"name": "John", "version": 1}, mock_node]], []]],
+            ["_updated", "_conflicts"],
+        )
+        updated_node = await VersionedNode.update_one({"name": "Sam"}, {"name": "John"}, expected_version=1)
+
+        assert updated_node is not None
+        assert updated_node.name == "John"
+        assert updated_node.version == 1
+
+    with pytest.raises(ValueError):
+        await Developer.update_many({"age": 50}, expected_version=1)
+
+    with pytest.raises(UnknownProperty):
+
+        class InvalidVersionedNode(NodeModel):
+            name: str
+
+            class Settings:
+                version_field = "version"
+
+
 async def test_update_no_result(client: Pyneo4jClient):
     await client.register_models([CoffeeShop])
 
@@ -158,6 +337,104 @@ async def test_update_one_no_match(setup_test_data):
         await Developer.update_one({"age": 50}, {"uid": 99999}, raise_on_empty=True)
 
 
+async def test_update_one_single_query(client: Pyneo4jClient):
+    await client.register_models([Developer])
+
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_node = Node(
+            graph=Graph(),
+            element_id="element-id",
+            id_=1,
+            properties={"age": 50, "uid": 1, "name": "John"},
+        )
+        mock_cypher.return_value = (
+            [[{"age": 30, "uid": 1, "name": "John"}, mock_node]],
+            ["old", "n"],
+        )
+        updated_node = await Developer.update_one({"age": 50, "non_existing": True}, {"uid": 1})
+
+        assert mock_cypher.call_count == 1
+        query = mock_cypher.call_args.kwargs["query"]
+        assert "n {.*} AS old" in query
+        assert "SET n.age = $age" in query
+        assert "non_existing" not in query
+        assert mock_cypher.call_args.kwargs["parameters"]["age"] == 50
+
+        assert isinstance(updated_node, Developer)
+        assert updated_node.age == 30
+        assert updated_node._element_id == mock_node.element_id
+
+
+async def test_update_one_invalid_update(client: Pyneo4jClient):
+    await client.register_models([Developer])
+
+    with patch.object(client, "cypher") as mock_cypher:
+        with pytest.raises(ValidationError):
+            await Developer.update_one({"age": "not-a-number"}, {"uid": 1})
+
+        assert mock_cypher.call_count == 0
+
+
+async def test_update_one_with_model_validator(client: Pyneo4jClient):
+    class DiscountedCoffee(NodeModel):
+        price: int = 0
+        discount: int = 0
+
+        if IS_PYDANTIC_V2:
+
+            @model_validator(mode="after")  # type: ignore
+            def _check_discount(self):
+                if self.discount > self.price:
+                    raise ValueError("discount must not exceed price")
+                return self
+
+        else:
+
+            @root_validator(skip_on_failure=True)  # type: ignore
+            def _check_discount(cls, values):  # type: ignore
+                if values["discount"] > values["price"]:
+                    raise ValueError("discount must not exceed price")
+                return values
+
+    await client.register_models([DiscountedCoffee])
+
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_node = Node(
+            graph=Graph(),
+            element_id="element-id",
+            id_=1,
+            properties={"price": 10, "discount": 0},
+        )
+        updated_mock_node = Node(
+            graph=Graph(),
+            element_id="element-id",
+            id_=1,
+            properties={"price": 10, "discount": 5},
+        )
+        mock_cypher.side_effect = [
+            ([[mock_node]], ["n"]),
+            ([[{"price": 10, "discount": 0}, updated_mock_node]], ["old", "n"]),
+        ]
+        updated_node = await DiscountedCoffee.update_one({"discount": 5}, {"price": 10}, new=True)
+
+        assert mock_cypher.call_count == 2
+        query = mock_cypher.call_args.kwargs["query"]
+        assert "n += $_updates[elementId(n)]" in query
+        assert mock_cypher.call_args.kwargs["parameters"]["_updates"] == {"element-id": {"discount": 5}}
+        assert mock_cypher.call_args.kwargs["parameters"]["_element_ids"] == ["element-id"]
+
+        assert isinstance(updated_node, DiscountedCoffee)
+        assert updated_node.discount == 5
+
+        mock_cypher.reset_mock()
+        mock_cypher.side_effect = [([[mock_node]], ["n"])]
+
+        with pytest.raises(ValidationError):
+            await DiscountedCoffee.update_many({"discount": 50}, {"price": 10})
+
+        assert mock_cypher.call_count == 1
+
+
 async def test_update_one_missing_filters(client: Pyneo4jClient):
     await client.register_models([Developer])
 
@@ -203,24 +480,29 @@ async def test_update_many_raw_results(client: Pyneo4jClient):
     await client.register_models([Developer])
 
     with patch.object(client, "cypher") as mock_cypher:
-        mock_nodes = [
-            Node(
-                graph=Graph(),
-                element_id="element-id",
-                id_=1,
-                properties={"age": 30, "uid": 1, "name": "John"},
-            ),
-            None,
-        ]
+        mock_node = Node(
+            graph=Graph(),
+            element_id="element-id",
+            id_=1,
+            properties={"age": 50, "uid": 1, "name": "John"},
+        )
         mock_cypher.return_value = (
-            [mock_nodes],
-            [],
+            [[{"age": 30, "uid": 1, "name": "John"}, mock_node], [None, None]],
+            ["old", "n"],
         )
         updated_nodes = await Developer.update_many({"age": 50}, {"age": {"$gte": 30}})
 
         assert isinstance(updated_nodes, list)
         assert len(updated_nodes) == 1
         assert all(isinstance(node, Developer) for node in updated_nodes)
+        assert updated_nodes[0].age == 30
+        assert updated_nodes[0]._element_id == mock_node.element_id
+        assert updated_nodes[0]._id == mock_node.id
+
+        updated_nodes = await Developer.update_many({"age": 50}, {"age": {"$gte": 30}}, new=True)
+
+        assert len(updated_nodes) == 1
+        assert updated_nodes[0].age == 50
 
 
 async def test_update_many_no_results(client: Pyneo4jClient):
@@ -285,6 +567,58 @@ async def test_refresh_no_result(client: Pyneo4jClient):
             await node.refresh()
 
 
+async def test_find_by_element_ids(client: Pyneo4jClient, setup_test_data):
+    found_nodes = cast(List[Developer], await Developer.find_many(options={"sort": "uid"}))
+    element_ids = [found_nodes[2]._element_id, "4:non-existing:0", found_nodes[0]._element_id]
+
+    with patch.object(client, "cypher", wraps=client.cypher) as mock_cypher:
+        nodes = await Developer.find_by_element_ids(cast(List[str], element_ids))
+
+        assert mock_cypher.call_count == 1
+        assert "UNWIND $_element_ids AS element_id" in mock_cypher.call_args.kwargs["query"]
+
+    assert len(nodes) == 3
+    assert nodes[1] is None
+    assert [node.uid for node in nodes if node is not None] == [found_nodes[2].uid, found_nodes[0].uid]
+    assert await Developer.find_by_element_ids([]) == []
+
+
+async def test_refresh_many(client: Pyneo4jClient, setup_test_data):
+    found_nodes = cast(List[Developer], await Developer.find_many(options={"sort": "uid"}))
+    names = [node.name for node in found_nodes]
+
+    for node in found_nodes:
+        node.name = "Changed"
+
+    with patch.object(client, "cypher", wraps=client.cypher) as mock_cypher:
+        refreshed_nodes = await Developer.refresh_many(found_nodes)
+
+        assert mock_cypher.call_count == 1
+
+    assert refreshed_nodes is found_nodes
+    assert [node.name for node in found_nodes] == names
+
+
+async def test_refresh_many_invalid_instances(client: Pyneo4jClient, setup_test_data):
+    found_nodes = cast(List[Developer], await Developer.find_many())
+
+    with pytest.raises(InstanceNotHydrated):
+        await Developer.refresh_many([Developer(uid=10, name="Jane", age=30)])
+
+    with pytest.raises(InvalidTargetNode):
+        await Developer.refresh_many(cast(List[Developer], await Coffee.find_many()))
+
+    found_nodes[0].name = "Changed"
+
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_cypher.return_value = ([[found_nodes[1]._element_id, None]], [])
+
+        with pytest.raises(UnexpectedEmptyResult):
+            await Developer.refresh_many(found_nodes[:2])
+
+    assert found_nodes[0].name == "Changed"
+
+
 @pytest.fixture()
 def use_deflate_inflate_model():
     class NestedModel(BaseModel):
@@ -365,6 +699,265 @@ def test_inflate(use_deflate_inflate_model):
     assert inflated.list_field[2] == {"test": "test"}
 
 
+def test_trusted_hydration():
+    class NestedModel(BaseModel):
+        name: str = "test"
+
+    class TrustedModel(NodeModel):
+        str_field: str = ""
+        list_field: List[str] = []
+        nested_model: NestedModel = NestedModel()
+
+        @field_validator("str_field")
+        @classmethod
+        def validate_str_field(cls, value):
+            raise ValueError("Validators are not run for trusted properties")
+
+        class Settings:
+            trusted_hydration = True
+
+    setattr(TrustedModel, "_client", None)
+
+    mock_node = Node(
+        graph=Graph(),
+        element_id="element-id",
+        id_=1,
+        properties={"str_field": "123", "list_field": ["a", "b"], "nested_model": '{"name": "other"}'},
+    )
+
+    inflated = TrustedModel._inflate(mock_node)
+
+    assert inflated.str_field == "123"
+    assert inflated.list_field == ["a", "b"]
+    assert inflated.nested_model.name == "other"
+    assert inflated.element_id == "element-id"
+    assert inflated.modified_properties == set()
+
+    inflated.list_field.append("c")
+    inflated.mark_modified("list_field")
+    assert inflated.modified_properties == {"list_field"}
+
+
+def test_lazy_fields():
+    class NestedModel(BaseModel):
+        name: str = "test"
+
+    class LazyFieldsModel(NodeModel):
+        str_field: str = ""
+        dict_field: Dict[str, Any] = {}
+        nested_model: NestedModel = NestedModel()
+
+        class Settings:
+            lazy_fields = {"dict_field", "nested_model", "str_field"}
+
+    setattr(LazyFieldsModel, "_client", None)
+
+    assert LazyFieldsModel._lazy_fields == {"dict_field", "nested_model"}
+
+    mock_node = Node(
+        graph=Graph(),
+        element_id="element-id",
+        id_=1,
+        properties={"str_field": "123", "dict_field": '{"a": 1}', "nested_model": '{"name": "other"}'},
+    )
+
+    inflated = LazyFieldsModel._inflate(mock_node)
+
+    assert inflated.str_field == "123"
+    assert "dict_field" not in inflated.__dict__
+    assert "nested_model" not in inflated.__dict__
+
+    assert inflated.nested_model.name == "other"
+    assert inflated._lazy_properties is not None
+    assert "dict_field" not in inflated.__dict__
+
+    assert get_model_dump(inflated)["dict_field"] == {"a": 1}
+    assert inflated._lazy_properties is None
+    assert inflated.modified_properties == set()
+
+    inflated = LazyFieldsModel._inflate(mock_node)
+    inflated.dict_field = {"b": 2}
+
+    assert inflated.dict_field == {"b": 2}
+    assert inflated.modified_properties == {"dict_field"}
+    assert json.loads(inflated._deflate()["dict_field"]) == {"b": 2}
+
+    invalid_node = Node(graph=Graph(), element_id="element-id", id_=1, properties={"nested_model": '{"name": []}'})
+    inflated = LazyFieldsModel._inflate(invalid_node)
+
+    with pytest.raises(ValidationError):
+        _ = inflated.nested_model
+
+    class ParentModel(BaseModel):
+        child: LazyFieldsModel
+
+    inflated = LazyFieldsModel._inflate(mock_node)
+    assert parse_model(LazyFieldsModel, inflated).dict_field == {"a": 1}
+
+    inflated = LazyFieldsModel._inflate(mock_node)
+    assert ParentModel(child=inflated).child.nested_model.name == "other"
+
+
+def test_lazy_fields_with_validators():
+    class ValidatedLazyModel(NodeModel):
+        name: str = ""
+        payload: Dict[str, Any] = {}
+
+        @field_validator("name")
+        def _upper_name(cls, value):
+            return value.upper()
+
+        @field_validator("payload")
+        def _mark_payload(cls, value):
+            return {**value, "validated": True}
+
+        if IS_PYDANTIC_V2:
+
+            @model_validator(mode="after")  # type: ignore
+            def _check_payload(self):
+                if self.payload.get("owner", self.name) != self.name:
+                    raise ValueError("payload must belong to the node")
+                return self
+
+        else:
+
+            @root_validator(skip_on_failure=True)  # type: ignore
+            def _check_payload(cls, values):  # type: ignore
+                if values["payload"].get("owner", values["name"]) != values["name"]:
+                    raise ValueError("payload must belong to the node")
+                return values
+
+        class Settings:
+            lazy_fields = {"payload"}
+
+    setattr(ValidatedLazyModel, "_client", None)
+
+    eager_node = Node(graph=Graph(), element_id="element-id", id_=1, properties={"name": "john"})
+    lazy_node = Node(graph=Graph(), element_id="element-id", id_=1, properties={"name": "john", "payload": "{}"})
+
+    assert ValidatedLazyModel._inflate(eager_node).name == "JOHN"
+
+    inflated = ValidatedLazyModel._inflate(lazy_node)
+    assert inflated.name == "JOHN"
+    assert "payload" not in inflated.__dict__
+    assert inflated.payload == {"validated": True}
+
+    invalid_node = Node(
+        graph=Graph(), element_id="element-id", id_=1, properties={"name": "john", "payload": '{"owner": "sam"}'}
+    )
+    inflated = ValidatedLazyModel._inflate(invalid_node)
+
+    with pytest.raises(ValidationError):
+        _ = inflated.payload
+
+
+def test_relationship_properties_created_on_access():
+    class LazyRelationship(RelationshipModel):
+        pass
+
+    class LazyModel(NodeModel):
+        name: str = ""
+
+        friends: RelationshipProperty["LazyModel", LazyRelationship] = RelationshipProperty(
+            target_model="LazyModel",
+            relationship_model="LazyRelationship",
+            direction=RelationshipPropertyDirection.OUTGOING,
+        )
+
+    client = Pyneo4jClient()
+    client.models = {LazyModel}
+    setattr(LazyModel, "_client", client)
+
+    first = LazyModel(name="first")
+    second = LazyModel(name="second")
+
+    assert "friends" not in first.__dict__
+    assert get_model_dump(first)["friends"] == []
+    assert "friends" not in get_model_dump(first, exclude={"friends"})
+
+    assert first.friends is first.friends
+    assert first.friends is not second.friends
+    assert first.friends._source_node is first
+    assert second.friends._source_node is second
+    assert first.friends._target_model is LazyModel
+    assert first.friends._query_builder is not second.friends._query_builder
+    assert "friends" in first.__dict__
+
+    third = LazyModel(name="third")
+    assert "friends" not in third.__dict__
+    assert dict(third)["friends"] is third.friends
+    assert "friends" in dict(iter(LazyModel(name="fourth")))
+
+    with pytest.raises(AttributeError):
+        getattr(first, "unknown")
+
+
+def test_relationship_property_definitions():
+    class CachedRelationship(RelationshipModel):
+        pass
+
+    class CachedModel(NodeModel):
+        name: str = ""
+
+        friends: RelationshipProperty["CachedModel", CachedRelationship] = RelationshipProperty(
+            target_model="CachedModel",
+            relationship_model=CachedRelationship,
+            direction=RelationshipPropertyDirection.OUTGOING,
+        )
+
+    client = Pyneo4jClient()
+    client.models = {CachedModel}
+    setattr(CachedModel, "_client", client)
+
+    definition = CachedModel._relationship_property_definitions["friends"]
+    assert list(CachedModel._relationship_property_definitions.keys()) == ["friends"]
+
+    friend = CachedModel(name="friend")
+    instance = CachedModel(name="instance", friends=[friend, {"name": "other", "element_id": "element-id"}])
+
+    assert [node.name for node in instance.friends.nodes] == ["friend", "other"]
+    assert instance.friends.nodes[1].element_id == "element-id"
+    assert instance.friends._source_node is instance
+    assert definition.nodes == []
+    assert getattr(definition, "_source_node", None) is None
+
+
+def test_relationship_properties_reference_source_node_weakly():
+    class WeakRelationship(RelationshipModel):
+        pass
+
+    class WeakModel(NodeModel):
+        name: str = ""
+
+        friends: RelationshipProperty["WeakModel", WeakRelationship] = RelationshipProperty(
+            target_model="WeakModel",
+            relationship_model=WeakRelationship,
+            direction=RelationshipPropertyDirection.OUTGOING,
+        )
+
+    client = Pyneo4jClient()
+    client.models = {WeakModel}
+    setattr(WeakModel, "_client", client)
+
+    instance = WeakModel(name="instance", friends=[WeakModel(name="friend")])
+    copied = deepcopy(instance)
+    assert copied.friends._source_node is copied
+    assert instance.friends._source_node is instance
+
+    relationship_property = instance.friends
+    instance_ref = weakref.ref(instance)
+
+    gc.disable()
+    try:
+        del instance
+        assert instance_ref() is None
+    finally:
+        gc.enable()
+
+    with pytest.raises(SourceNodeReleased):
+        getattr(relationship_property, "_source_node")
+
+
 async def test_model_parse(setup_test_data):
     node = cast(Developer, await Developer.find_one({"uid": 1}, auto_fetch_nodes=False))
 
@@ -571,6 +1164,52 @@ async def test_find_one_auto_fetch_models_as_string(setup_test_data):
     assert len(found_node.coffee.nodes) == 2
 
 
+async def test_find_one_auto_fetch_models_with_filters_and_options(setup_test_data):
+    found_node = await Developer.find_one(
+        {"uid": 1},
+        auto_fetch_nodes=True,
+        auto_fetch_models=[
+            {
+                "model": Developer,
+                "filters": {"$relationship": {"language": "Python"}},
+                "options": {"sort": "uid", "order": QueryOptionsOrder.DESCENDING, "limit": 1},
+            }
+        ],
+    )
+
+    assert found_node is not None
+    assert isinstance(found_node, Developer)
+    assert len(found_node.colleagues.nodes) == 1
+    assert cast(Developer, found_node.colleagues.nodes[0]).uid == 3
+    assert len(found_node.coffee.nodes) == 0
+
+
+def test_auto_fetch_options_by_relationship_property():
+    client = Pyneo4jClient()
+    client.models = {Coffee, CoffeeShop, Sells, Bestseller}
+
+    with patch.object(CoffeeShop, "_client", client, create=True):
+        match_queries, return_queries, _ = CoffeeShop._build_auto_fetch(
+            nodes_to_fetch=[
+                {"relationship_property": "bestseller", "options": {"limit": 1}},
+                {"model": Coffee, "options": {"limit": 5}},
+            ]
+        )
+        queries = dict(zip(return_queries, match_queries))
+
+        assert set(queries.keys()) == {"coffees", "bestseller"}
+        assert "LIMIT 1" in queries["bestseller"]
+        assert "LIMIT 5" in queries["coffees"]
+
+        _, return_queries, _ = CoffeeShop._build_auto_fetch(
+            nodes_to_fetch=[{"relationship_property": "bestseller", "options": {"limit": 1}}]
+        )
+        assert return_queries == ["bestseller"]
+
+        with pytest.raises(UnknownRelationshipProperty):
+            CoffeeShop._build_auto_fetch(nodes_to_fetch=[{"relationship_property": "non_existing"}])
+
+
 async def test_find_one_auto_fetch_models_unregistered_relationship(setup_test_data):
     Developer._client.models.remove(Consumed)
 
@@ -631,6 +1270,27 @@ async def test_find_many_projections(setup_test_data):
     assert all("has_sugar" in cast(Dict[str, Any], node) for node in found_nodes)
 
 
+async def test_find_many_nested_projections(setup_test_data):
+    found_nodes = await Developer.find_many(
+        {"uid": 1},
+        projections={
+            "name": "name",
+            "coffee": {
+                "$relationship": "coffee",
+                "fields": {"flavor": "flavor", "drinkers": {"$relationship": "developers", "fields": {"uid": "uid"}}},
+            },
+            "colleagues": {"$relationship": "colleagues", "fields": {"name": "name"}, "limit": 1},
+        },
+    )
+
+    assert len(found_nodes) == 1
+    found_node = cast(Dict[str, Any], found_nodes[0])
+    assert found_node["name"] == "John"
+    assert sorted(coffee["flavor"] for coffee in found_node["coffee"]) == ["Espresso", "Latte"]
+    assert all({"uid": 1} in coffee["drinkers"] for coffee in found_node["coffee"])
+    assert len(found_node["colleagues"]) == 1
+
+
 async def test_find_many_options(setup_test_data):
     found_nodes = await Coffee.find_many({"sugar": True}, options={"limit": 1})
 
@@ -665,6 +1325,59 @@ async def test_find_many_auto_fetch(setup_test_data):
     assert len(found_nodes[0].bestseller_for.nodes) == 1
 
 
+async def test_find_many_auto_fetch_multiple_nodes(setup_test_data):
+    found_nodes = await Developer.find_many(auto_fetch_nodes=True)
+
+    assert isinstance(found_nodes, list)
+    assert len(found_nodes) == 4
+
+    fetched_counts = {
+        cast(Developer, node).uid: (
+            len(cast(Developer, node).colleagues.nodes),
+            len(cast(Developer, node).coffee.nodes),
+        )
+        for node in found_nodes
+    }
+    assert fetched_counts == {1: (2, 2), 2: (1, 1), 3: (2, 3), 4: (1, 0)}
+
+
+async def test_prefetch(setup_test_data):
+    found_nodes = cast(List[Developer], await Developer.find_many())
+    prefetched_nodes = await Developer.prefetch(found_nodes, ["coffee", "colleagues"])
+
+    assert prefetched_nodes is found_nodes
+
+    fetched_counts = {node.uid: (len(node.colleagues.nodes), len(node.coffee.nodes)) for node in found_nodes}
+    assert fetched_counts == {1: (2, 2), 2: (1, 1), 3: (2, 3), 4: (1, 0)}
+    assert all(isinstance(coffee, Coffee) for node in found_nodes for coffee in node.coffee.nodes)
+
+
+async def test_prefetch_selected_properties(client: Pyneo4jClient, setup_test_data):
+    found_nodes = cast(List[Developer], await Developer.find_many())
+
+    with patch.object(client, "cypher", wraps=client.cypher) as mock_cypher:
+        await Developer.prefetch(found_nodes, ["coffee"])
+
+        assert mock_cypher.call_count == 1
+        assert "UNWIND $_prefetch_element_ids AS element_id" in mock_cypher.call_args.kwargs["query"]
+
+    assert all(len(node.colleagues.nodes) == 0 for node in found_nodes)
+    assert any(len(node.coffee.nodes) != 0 for node in found_nodes)
+
+
+async def test_prefetch_invalid_instances(setup_test_data):
+    found_nodes = cast(List[Developer], await Developer.find_many())
+
+    with pytest.raises(UnknownRelationshipProperty):
+        await Developer.prefetch(found_nodes, ["non_existing"])
+
+    with pytest.raises(InstanceNotHydrated):
+        await Developer.prefetch([Developer(uid=10, name="Jane", age=30)])
+
+    with pytest.raises(InvalidTargetNode):
+        await Developer.prefetch(cast(List[Developer], await Coffee.find_many()))
+
+
 async def test_find_many_auto_fetch_models(setup_test_data):
     found_nodes = await Coffee.find_many({"flavor": "Mocha"}, auto_fetch_nodes=True, auto_fetch_models=[Developer])
 
@@ -675,6 +1388,17 @@ async def test_find_many_auto_fetch_models(setup_test_data):
     assert len(found_nodes[0].bestseller_for.nodes) == 0
 
 
+async def test_find_many_auto_fetch_models_with_limit(setup_test_data):
+    found_nodes = await Developer.find_many(
+        auto_fetch_nodes=True, auto_fetch_models=[{"model": "Coffee", "options": {"limit": 1}}]
+    )
+
+    assert len(found_nodes) == 4
+    assert all(len(cast(Developer, node).coffee.nodes) <= 1 for node in found_nodes)
+    assert sum(len(cast(Developer, node).coffee.nodes) for node in found_nodes) == 3
+    assert all(len(cast(Developer, node).colleagues.nodes) == 0 for node in found_nodes)
+
+
 async def test_find_many_auto_fetch_models_as_string(setup_test_data):
     found_nodes = await Coffee.find_many({"flavor": "Mocha"}, auto_fetch_nodes=True, auto_fetch_models=["CoffeeShop"])
 
@@ -699,6 +1423,96 @@ async def test_find_many_auto_fetch_models_unregistered_node(setup_test_data):
         await Coffee.find_many({"flavor": "Mocha"}, auto_fetch_nodes=True, auto_fetch_models=["CoffeeShop"])
 
 
+class IndexedDeveloper(NodeModel):
+    uid: WithOptions(int, unique=True)
+    name: str
+    age: int
+
+    class Settings:
+        labels = {"Developer"}
+
+
+async def test_iter_many(client: Pyneo4jClient, setup_test_data):
+    await client.register_models([IndexedDeveloper])
+    found_nodes = [node async for node in IndexedDeveloper.iter_many("uid", batch_size=3)]
+
+    assert len(found_nodes) == 4
+    assert all(isinstance(node, IndexedDeveloper) for node in found_nodes)
+    assert len({node._element_id for node in found_nodes}) == 4
+
+
+async def test_iter_many_filters(client: Pyneo4jClient, setup_test_data):
+    await client.register_models([IndexedDeveloper])
+    found_nodes = [node async for node in IndexedDeveloper.iter_many("uid", {"age": {"$gte": 27}}, batch_size=1)]
+
+    assert [node.uid for node in found_nodes] == [1, 3, 4]
+
+
+async def test_iter_many_order(client: Pyneo4jClient, setup_test_data):
+    await client.register_models([IndexedDeveloper])
+    ascending = [node.uid async for node in IndexedDeveloper.iter_many("uid", batch_size=1)]
+    descending = [
+        node.uid
+        async for node in IndexedDeveloper.iter_many("uid", batch_size=3, order=QueryOptionsOrder.DESCENDING)
+    ]
+
+    assert ascending == [1, 2, 3, 4]
+    assert descending == [4, 3, 2, 1]
+
+
+async def test_iter_many_stop_early(client: Pyneo4jClient, setup_test_data):
+    await client.register_models([IndexedDeveloper])
+    found_nodes = []
+
+    async for node in IndexedDeveloper.iter_many("uid", batch_size=2):
+        found_nodes.append(node)
+
+        if len(found_nodes) == 3:
+            break
+
+    assert [node.uid for node in found_nodes] == [1, 2, 3]
+    assert await IndexedDeveloper.count() == 4
+
+
+async def test_iter_many_keyset_query(client: Pyneo4jClient):
+    await client.register_models([IndexedDeveloper])
+
+    with patch.object(client, "_cypher_in_session") as mock_cypher:
+        mock_nodes = [
+            Node(graph=Graph(), element_id=f"element-id-{uid}", id_=uid, properties={"uid": uid, "name": "", "age": 1})
+            for uid in [1, 2]
+        ]
+        mock_cypher.side_effect = [
+            ([[mock_nodes[0], 1]], ["n", "n.uid"]),
+            ([[mock_nodes[1], 2]], ["n", "n.uid"]),
+            ([], ["n", "n.uid"]),
+        ]
+
+        found_nodes = [node async for node in IndexedDeveloper.iter_many("uid", batch_size=1)]
+
+        assert [node.uid for node in found_nodes] == [1, 2]
+        query = mock_cypher.call_args_list[1].kwargs["query"]
+        assert "n.`uid` >= $_keyset_last_key" in query
+        assert "NOT (n.`uid` = $_keyset_last_key AND elementId(n) <= $_keyset_last_element_id)" in query
+        assert mock_cypher.call_args_list[1].kwargs["parameters"]["_keyset_last_key"] == 1
+
+
+async def test_iter_many_invalid_order_by(client: Pyneo4jClient):
+    await client.register_models([IndexedDeveloper, Developer])
+
+    with pytest.raises(ValueError):
+        async for _ in IndexedDeveloper.iter_many("uid", batch_size=0):
+            pass
+
+    with pytest.raises(UnknownProperty):
+        async for _ in IndexedDeveloper.iter_many("non_existing"):
+            pass
+
+    with pytest.raises(UnindexedProperty):
+        async for _ in Developer.iter_many("uid"):
+            pass
+
+
 async def test_find_connected_nodes(setup_test_data):
     node = await Developer.find_one({"uid": 3})
     assert node is not None
@@ -1033,12 +1847,7 @@ async def test_create(client: Pyneo4jClient, session: AsyncSession):
 
     assert node._element_id is not None
     assert node._id is not None
-    assert node._db_properties == {
-        "flavor": "Mocha",
-        "sugar": True,
-        "milk": True,
-        "note": {"roast": "dark"},
-    }
+    assert node.modified_properties == set()
 
     results = await session.run(
         cast(
@@ -1099,6 +1908,138 @@ async def test_count_no_query_result(client: Pyneo4jClient):
             await Coffee.count({"milk": True})
 
 
+async def test_exists(setup_test_data):
+    assert await Coffee.exists({"milk": True}) is True
+    assert await Coffee.exists({"flavor": "SomethingElse"}) is False
+
+
+async def test_exists_no_query_result(client: Pyneo4jClient):
+    await client.register_models([Coffee])
+
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_cypher.return_value = [[], []]
+        with pytest.raises(UnexpectedEmptyResult):
+            await Coffee.exists({"milk": True})
+
+        assert "RETURN EXISTS {" in mock_cypher.call_args.kwargs["query"]
+
+
+async def test_aggregate(setup_test_data):
+    results = await Developer.aggregate(
+        metrics={
+            "total": ("sum", "age"),
+            "average": (AggregationFunction.AVG, "age"),
+            "youngest": ("min", "age"),
+            "count": ("count", None),
+        }
+    )
+    assert results == [{"total": 114, "average": 28.5, "youngest": 25, "count": 4}]
+
+    grouped_results = await Coffee.aggregate(group_by=["milk"], metrics={"count": ("count", None)})
+    assert sorted(grouped_results, key=lambda row: row["milk"]) == [
+        {"milk": False, "count": 2},
+        {"milk": True, "count": 3},
+    ]
+
+    filtered_results = await Developer.aggregate({"age": {"$gt": 26}}, metrics={"names": ("collect", "name")})
+    assert len(filtered_results) == 1
+    assert sorted(filtered_results[0]["names"]) == ["Alice", "Bob", "John"]
+
+
+async def test_aggregate_invalid_arguments():
+    setattr(Developer, "_client", None)
+
+    with pytest.raises(ValueError):
+        await Developer.aggregate()
+
+    with pytest.raises(ValueError):
+        await Developer.aggregate(group_by=["coffee"])
+
+    with pytest.raises(ValueError):
+        await Developer.aggregate(metrics={"median": ("median", "age")})
+
+    with pytest.raises(ValueError):
+        await Developer.aggregate(metrics={"total": ("sum", None)})
+
+
+async def test_facets(client: Pyneo4jClient, setup_test_data):
+    with patch.object(client, "cypher", wraps=client.cypher) as mock_cypher:
+        facets = await Coffee.facets(fields=["milk", "flavor"], limit_per_field=2)
+
+        assert mock_cypher.call_count == 1
+
+    assert facets["milk"] == {True: 3, False: 2}
+    assert len(facets["flavor"]) == 2
+
+    filtered_facets = await Developer.facets({"age": {"$lt": 30}}, fields=["name"])
+    assert filtered_facets == {"name": {"Alice": 1, "Sam": 1}}
+
+
+async def test_facets_invalid_arguments():
+    setattr(Coffee, "_client", None)
+
+    assert await Coffee.facets() == {}
+
+    with pytest.raises(ValueError):
+        await Coffee.facets(fields=["non_existing"])
+
+    with pytest.raises(ValueError):
+        await Coffee.facets(fields=["milk"], limit_per_field=0)
+
+
+async def test_get_by_unique_key(client: Pyneo4jClient):
+    class UniqueDeveloper(NodeModel):
+        uid: WithOptions(int, unique=True)
+        name: str
+
+    await client.register_models([UniqueDeveloper])
+    await UniqueDeveloper(uid=1, name="John").create()
+    await UniqueDeveloper(uid=2, name="Sam").create()
+
+    with patch.object(client, "cypher", wraps=client.cypher) as mock_cypher:
+        found_node = await UniqueDeveloper.get(uid=2)
+        found_nodes = await UniqueDeveloper.get_many(uid=[2, 3, 1])
+
+        assert mock_cypher.call_count == 2
+        assert "{`uid`: $_unique_value}" in mock_cypher.call_args_list[0].kwargs["query"]
+        assert "WHERE" not in mock_cypher.call_args_list[1].kwargs["query"]
+
+    assert found_node is not None
+    assert found_node.name == "Sam"
+    assert [node.name if node is not None else None for node in found_nodes] == ["Sam", None, "John"]
+    assert await UniqueDeveloper.get(uid=3) is None
+
+
+async def test_get_by_invalid_unique_key():
+    class UniqueDeveloper(NodeModel):
+        uid: WithOptions(int, unique=True)
+        name: str
+
+    setattr(UniqueDeveloper, "_client", None)
+
+    with pytest.raises(InvalidUniqueKey):
+        await UniqueDeveloper.get(name="John")
+
+    with pytest.raises(InvalidUniqueKey):
+        await UniqueDeveloper.get(uid=1, name="John")
+
+    with pytest.raises(InvalidUniqueKey):
+        await UniqueDeveloper.get_many(non_existing=[1])
+
+
+def test_get_by_unique_key_escapes_identifiers():
+    class UniqueDeveloper(NodeModel):
+        uid: WithOptions(int, unique=True)
+
+        class Settings:
+            labels = {"Unique`Developer"}
+
+    query, many_query = UniqueDeveloper._get_unique_key_queries("uid")
+
+    assert query == "MATCH (n:`Unique``Developer` {`uid`: $_unique_value}) RETURN n LIMIT 1"
+    assert "MATCH (n:`Unique``Developer` {`uid`: $_unique_values[index]})" in many_query
+
+
 def test_json_schema():
     setattr(Developer, "_client", None)
     setattr(Coffee, "_client", None)
@@ -1252,3 +2193,68 @@ def test_json_schema_with_index_and_constraint():
 
         assert "uniqueness_constraint" in schema["properties"]["uid"]
         assert schema["properties"]["uid"]["uniqueness_constraint"]
+
+
+async def test_query_cache(client: Pyneo4jClient):
+    class CachedCoffee(NodeModel):
+        flavor: str
+
+        class Settings:
+            query_cache_size = 10
+
+    await client.register_models([CachedCoffee])
+
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_node = Node(
+            graph=Graph(),
+            element_id="element-id",
+            id_=1,
+            labels={"CachedCoffee"},
+            properties={"flavor": "Mocha"},
+        )
+        mock_cypher.return_value = ([[mock_node]], ["n"])
+
+        first_result = await CachedCoffee.find_one({"flavor": "Mocha"})
+        second_result = await CachedCoffee.find_one({"flavor": "Mocha"})
+
+        assert mock_cypher.call_count == 1
+        assert mock_cypher.call_args.kwargs["resolve_models"] is False
+        assert isinstance(first_result, CachedCoffee)
+        assert first_result == second_result
+        assert first_result is not second_result
+
+        mock_cypher.return_value = ([[3]], ["count(n)"])
+        assert await CachedCoffee.count() == 3
+        assert await CachedCoffee.count() == 3
+        assert mock_cypher.call_count == 2
+
+        mock_cypher.return_value = ([], ["old", "n"])
+        await CachedCoffee.update_many({"flavor": "Latte"})
+        assert mock_cypher.call_count == 3
+
+        mock_cypher.return_value = ([[4]], ["count(n)"])
+        assert await CachedCoffee.count() == 4
+        assert mock_cypher.call_count == 4
+
+
+async def test_query_cache_bypassed_in_batch(client: Pyneo4jClient):
+    class CachedCoffee(NodeModel):
+        flavor: str
+
+        class Settings:
+            query_cache_size = 10
+
+    await client.register_models([CachedCoffee])
+
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_cypher.return_value = ([[3]], ["count(n)"])
+        setattr(client, "_batch_enabled", True)
+
+        try:
+            await CachedCoffee.count()
+            await CachedCoffee.count()
+        finally:
+            setattr(client, "_batch_enabled", False)
+
+        assert mock_cypher.call_count == 2
+        assert len(cast(Any, CachedCoffee._query_cache)) == 0
@@ -10,18 +10,24 @@ from neo4j.graph import Graph, Node, Relationship
 from pydantic import BaseModel
 from typing_extensions import LiteralString
 
+from pyneo4j_ogm.core.cache import EntityCache
 from pyneo4j_ogm.core.client import Pyneo4jClient
 from pyneo4j_ogm.core.relationship import RelationshipModel, ensure_alive
 from pyneo4j_ogm.exceptions import (
     InstanceDestroyed,
     InstanceNotHydrated,
+    InvalidEntityType,
     InvalidFilters,
     NoResultFound,
     UnexpectedEmptyResult,
+    UnindexedProperty,
     UnregisteredModel,
+    VersionConflict,
 )
+from pyneo4j_ogm.fields.property_options import WithOptions
 from pyneo4j_ogm.fields.relationship_property import check_models_registered
 from tests.fixtures.db_setup import (
+    Consumed,
     Developer,
     Sells,
     WorkedWith,
@@ -49,7 +55,7 @@ async def test_update(client: Pyneo4jClient, session: AsyncSession, setup_test_d
     relationship_model.language = "TypeScript"
     await relationship_model.update()
     assert relationship_model.language == "TypeScript"
-    assert relationship_model._db_properties == {"language": "TypeScript"}
+    assert relationship_model.modified_properties == set()
 
     results = await session.run(
         cast(
@@ -95,6 +101,73 @@ async def test_update_no_result(client: Pyneo4jClient, setup_test_data):
             await relationship_model.update()
 
 
+class IndexedWorkedWith(RelationshipModel):
+    language: WithOptions(str, range_index=True)
+
+    class Settings:
+        type = "WAS_WORK_BUDDY_WITH"
+
+
+async def test_iter_many(client: Pyneo4jClient, setup_test_data):
+    await client.register_models([IndexedWorkedWith])
+    results = [result async for result in IndexedWorkedWith.iter_many("language", batch_size=2)]
+    assert len(results) == 7
+    assert all(isinstance(result, IndexedWorkedWith) for result in results)
+    assert len({result._element_id for result in results}) == 7
+
+
+async def test_iter_many_filters_and_order(client: Pyneo4jClient, setup_test_data):
+    await client.register_models([IndexedWorkedWith])
+    results = [
+        result
+        async for result in IndexedWorkedWith.iter_many("language", {"language": {"$in": ["Python", "Go"]}}, 1)
+    ]
+    assert [result.language for result in results] == ["Go", "Python", "Python"]
+
+
+async def test_iter_many_unindexed_order_by(client: Pyneo4jClient):
+    await client.register_models([WorkedWith])
+
+    with pytest.raises(UnindexedProperty):
+        async for _ in WorkedWith.iter_many("language"):
+            pass
+
+
+async def test_update_version_conflict(client: Pyneo4jClient):
+    class VersionedRelationship(RelationshipModel):
+        version: int = 0
+
+        class Settings:
+            version_field = "version"
+
+    await client.register_models([VersionedRelationship])
+
+    relationship_model = VersionedRelationship(version=1)
+    relationship_model._element_id = "element-id"
+    relationship_model._id = 1
+    relationship_model._start_node_element_id = "start-element-id"
+    relationship_model._start_node_id = 2
+    relationship_model._end_node_element_id = "end-element-id"
+    relationship_model._end_node_id = 3
+
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_cypher.return_value = ([[MagicMock(), 2]], ["r", "current_version"])
+
+        with pytest.raises(VersionConflict):
+            await relationship_model.update()
+
+        assert "current_version = $_expected_version" in mock_cypher.call_args.kwargs["query"]
+        assert "SET r._version_lock = true" in mock_cypher.call_args.kwargs["query"]
+        assert "r.version = coalesce(r.version, 0) + 1" in mock_cypher.call_args.kwargs["query"]
+        assert mock_cypher.call_args.kwargs["parameters"]["_expected_version"] == 1
+        assert relationship_model.version == 1
+
+        mock_cypher.return_value = ([[MagicMock(), 1]], ["r", "current_version"])
+        await relationship_model.update()
+
+        assert relationship_model.version == 2
+
+
 async def test_update_one(client: Pyneo4jClient, session: AsyncSession, setup_test_data):
     result = await WorkedWith.update_one({"language": "Rust"}, {"language": "Python"})
     assert result is not None
@@ -163,8 +236,8 @@ async def test_update_one_raw_result(client: Pyneo4jClient):
         setattr(mock_relationship, "_end_node", mock_end_node)
 
         mock_cypher.return_value = (
-            [[mock_relationship]],
-            [],
+            [[{"language": "Go"}, mock_relationship]],
+            ["old", "r"],
         )
 
         result = await WorkedWith.update_one({"language": "Rust"}, {"language": "Go"})
@@ -237,8 +310,8 @@ async def test_update_many_raw_result(client: Pyneo4jClient):
         setattr(mock_relationship, "_end_node", mock_end_node)
 
         mock_cypher.return_value = (
-            [[mock_relationship, None]],
-            [],
+            [[{"language": "Go"}, mock_relationship], [None, None]],
+            ["old", "r"],
         )
 
         results = await WorkedWith.update_many({"language": "Rust"}, {"language": "Go"})
@@ -274,6 +347,43 @@ async def test_start_node(client: Pyneo4jClient, setup_test_data):
     assert start_node._id == node.id
 
 
+async def test_start_node_from_entity_cache(client: Pyneo4jClient, setup_test_data):
+    relationship: Relationship = [
+        result
+        for result in setup_test_data[0][1]
+        if result.type == "WAS_WORK_BUDDY_WITH" and result["language"] == "Go"
+    ][0]
+    node = cast(Node, relationship.start_node)
+
+    relationship_model = WorkedWith(**relationship)
+    relationship_model._element_id = relationship.element_id
+    relationship_model._id = relationship.id
+    relationship_model._start_node_element_id = node.element_id
+    relationship_model._start_node_id = node.id
+    relationship_model._end_node_element_id = cast(Node, relationship.end_node).element_id
+    relationship_model._end_node_id = cast(Node, relationship.end_node).id
+
+    client.entity_cache = EntityCache(max_size=10)
+    client.entity_cache.set(node)
+
+    try:
+        with patch.object(client, "cypher") as mock_cypher:
+            start_node = cast(Developer, await relationship_model.start_node())
+
+            assert mock_cypher.call_count == 0
+            assert isinstance(start_node, Developer)
+            assert start_node._element_id == node.element_id
+            assert client.entity_cache.stats["hits"] == 1
+
+            mock_cypher.return_value = ([[start_node]], [])
+            await relationship_model.start_node(use_cache=False)
+
+            assert mock_cypher.call_count == 1
+            assert client.entity_cache.stats["hits"] == 1
+    finally:
+        client.entity_cache = None
+
+
 async def test_start_node_no_result(client: Pyneo4jClient, setup_test_data):
     relationship: Relationship = [
         result
@@ -339,6 +449,49 @@ async def test_refresh_no_result(client: Pyneo4jClient, setup_test_data):
             await relationship_model.refresh()
 
 
+async def test_find_by_element_ids(client: Pyneo4jClient, setup_test_data):
+    found_relationships = cast(List[WorkedWith], await WorkedWith.find_many(options={"sort": "language"}))
+    element_ids = [found_relationships[1]._element_id, "5:non-existing:0", found_relationships[0]._element_id]
+
+    with patch.object(client, "cypher", wraps=client.cypher) as mock_cypher:
+        relationships = await WorkedWith.find_by_element_ids(cast(List[str], element_ids))
+
+        assert mock_cypher.call_count == 1
+        assert "UNWIND $_element_ids AS element_id" in mock_cypher.call_args.kwargs["query"]
+
+    assert len(relationships) == 3
+    assert relationships[1] is None
+    assert [relationship._element_id for relationship in relationships if relationship is not None] == [
+        found_relationships[1]._element_id,
+        found_relationships[0]._element_id,
+    ]
+
+
+async def test_refresh_many(client: Pyneo4jClient, setup_test_data):
+    found_relationships = cast(List[WorkedWith], await WorkedWith.find_many(options={"sort": "language"}))
+    languages = [relationship.language for relationship in found_relationships]
+
+    for relationship in found_relationships:
+        relationship.language = "TypeScript"
+
+    with patch.object(client, "cypher", wraps=client.cypher) as mock_cypher:
+        refreshed_relationships = await WorkedWith.refresh_many(found_relationships)
+
+        assert mock_cypher.call_count == 1
+
+    assert refreshed_relationships is found_relationships
+    assert [relationship.language for relationship in found_relationships] == languages
+
+    with pytest.raises(InvalidEntityType):
+        await WorkedWith.refresh_many(cast(List[WorkedWith], await Consumed.find_many()))
+
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_cypher.return_value = ([], [])
+
+        with pytest.raises(UnexpectedEmptyResult):
+            await WorkedWith.refresh_many(found_relationships)
+
+
 @pytest.fixture()
 def mock_relationship_property():
     mock_source_node = MagicMock()
@@ -519,6 +672,61 @@ def test_inflate(use_deflate_inflate_model):
     assert inflated.list_field[2] == {"test": "test"}
 
 
+def test_trusted_hydration():
+    class TrustedModel(RelationshipModel):
+        str_field: str = ""
+        dict_field: Dict[str, Any] = {}
+
+        class Settings:
+            trusted_hydration = True
+
+    setattr(TrustedModel, "_client", None)
+
+    mock_relationship = Relationship(
+        element_id="4:08f8a347-1856-487c-8705-26d2b4a69bb7:6",
+        id_=6,
+        graph=Graph(),
+        properties={"str_field": "true", "dict_field": '{"test": 1}'},
+    )
+    setattr(mock_relationship, "_start_node", Node(graph=Graph(), element_id="start-element-id", id_=2))
+    setattr(mock_relationship, "_end_node", Node(graph=Graph(), element_id="end-element-id", id_=3))
+
+    inflated = TrustedModel._inflate(mock_relationship)
+
+    assert inflated.str_field == "true"
+    assert inflated.dict_field == {"test": 1}
+    assert inflated.start_node_element_id == "start-element-id"
+    assert inflated.end_node_id == 3
+    assert inflated.modified_properties == set()
+
+
+def test_lazy_fields():
+    class LazyFieldsModel(RelationshipModel):
+        str_field: str = ""
+        dict_field: Dict[str, Any] = {}
+
+        class Settings:
+            lazy_fields = {"dict_field"}
+
+    setattr(LazyFieldsModel, "_client", None)
+
+    mock_relationship = Relationship(
+        element_id="4:08f8a347-1856-487c-8705-26d2b4a69bb7:6",
+        id_=6,
+        graph=Graph(),
+        properties={"str_field": "true", "dict_field": '{"test": 1}'},
+    )
+    setattr(mock_relationship, "_start_node", Node(graph=Graph(), element_id="start-element-id", id_=2))
+    setattr(mock_relationship, "_end_node", Node(graph=Graph(), element_id="end-element-id", id_=3))
+
+    inflated = LazyFieldsModel._inflate(mock_relationship)
+
+    assert "dict_field" not in inflated.__dict__
+    assert inflated.dict_field == {"test": 1}
+    assert inflated.start_node_element_id == "start-element-id"
+    assert inflated._lazy_properties is None
+
+
 def test_iter():
     class Rel(RelationshipModel):
         foo_prop: str = "foo"
@@ -835,6 +1043,34 @@ async def test_count_no_query_result(client: Pyneo4jClient, setup_test_data):
             await WorkedWith.count({})
 
 
+async def test_exists(client: Pyneo4jClient, setup_test_data):
+    assert await WorkedWith.exists({"language": "Python"}) is True
+    assert await WorkedWith.exists({"language": "non-existent"}) is False
+
+
+async def test_exists_no_query_result(client: Pyneo4jClient, setup_test_data):
+    with patch.object(client, "cypher") as mock_cypher:
+        mock_cypher.return_value = [[], []]
+        with pytest.raises(UnexpectedEmptyResult):
+            await WorkedWith.exists({})
+
+
+async def test_aggregate(setup_test_data):
+    results = await WorkedWith.aggregate(group_by=["language"], metrics={"count": ("count", None)})
+    assert sorted(results, key=lambda row: row["language"]) == [
+        {"language": "Java", "count": 1},
+        {"language": "Javascript", "count": 2},
+        {"language": "Lisp", "count": 1},
+        {"language": "Python", "count": 2},
+    ]
+
+    filtered_results = await Consumed.aggregate({"liked": True}, metrics={"count": ("count", None)})
+    assert filtered_results == [{"count": 3}]
+
+    with pytest.raises(ValueError):
+        await WorkedWith.aggregate(metrics={"count": ("count", "non_existing")})
+
+
 async def test_find_many(client: Pyneo4jClient, setup_test_data):
     results = await WorkedWith.find_many({"language": "Javascript"})
     assert len(results) == 2
@@ -0,0 +1,68 @@
+# pylint: disable=unused-argument, unused-import, redefined-outer-name, protected-access, missing-module-docstring, missing-class-docstring
+# pyright: reportGeneralTypeIssues=false
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Union
+
+from pydantic import BaseModel
+
+from pyneo4j_ogm.core.serialization import (
+    PropertyEncoding,
+    build_property_encodings,
+    get_property_encoding,
+)
+from pyneo4j_ogm.fields.property_options import WithOptions
+
+
+class NestedModel(BaseModel):
+    name: str = "test"
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+def test_primitive_encodings():
+    for annotation in [str, int, float, bool, datetime, Color, Optional[int], Literal["a", "b"]]:
+        assert get_property_encoding(annotation) == PropertyEncoding.PRIMITIVE
+
+    assert get_property_encoding(WithOptions(str, unique=True)) == PropertyEncoding.PRIMITIVE
+
+
+def test_list_encodings():
+    assert get_property_encoding(List[str]) == PropertyEncoding.PRIMITIVE_LIST
+    assert get_property_encoding(Set[int]) == PropertyEncoding.PRIMITIVE_LIST
+    assert get_property_encoding(Tuple[int, ...]) == PropertyEncoding.PRIMITIVE_LIST
+    assert get_property_encoding(List[NestedModel]) == PropertyEncoding.JSON_LIST
+    assert get_property_encoding(List[Dict[str, Any]]) == PropertyEncoding.JSON_LIST
+
+    # Items which can be `None` are stored as JSON strings, so they can not be treated as primitive
+    assert get_property_encoding(List[Optional[int]]) == PropertyEncoding.DYNAMIC
+
+
+def test_json_encodings():
+    assert get_property_encoding(NestedModel) == PropertyEncoding.JSON
+    assert get_property_encoding(Optional[NestedModel]) == PropertyEncoding.JSON
+    assert get_property_encoding(Dict[str, Any]) == PropertyEncoding.JSON
+    assert get_property_encoding(dict) == PropertyEncoding.JSON
+
+
+def test_dynamic_encodings():
+    for annotation in [Any, list, List[Any], Union[int, str], Union[NestedModel, List[str]]]:
+        assert get_property_encoding(annotation) == PropertyEncoding.DYNAMIC
+
+
+def test_build_property_encodings():
+    class EncodedModel(BaseModel):
+        name: str
+        tags: List[str]
+        nested: NestedModel
+        extra: Any = None
+
+    assert build_property_encodings(EncodedModel) == {
+        "name": PropertyEncoding.PRIMITIVE,
+        "tags": PropertyEncoding.PRIMITIVE_LIST,
+        "nested": PropertyEncoding.JSON,
+        "extra": PropertyEncoding.DYNAMIC,
+    }
@@ -1,6 +1,7 @@
 # pylint: disable=unused-argument, unused-import, redefined-outer-name, protected-access, missing-module-docstring, missing-class-docstring
 # pyright: reportGeneralTypeIssues=false
 
+import asyncio
 from typing import cast
 from unittest.mock import patch
 
@@ -10,6 +11,7 @@ from neo4j.graph import Graph, Node, Relationship
 from typing_extensions import LiteralString
 
 from pyneo4j_ogm.core.client import Pyneo4jClient
+from pyneo4j_ogm.core.loader import ConnectedNodesLoader
 from pyneo4j_ogm.exceptions import (
     CardinalityViolation,
     InstanceDestroyed,
@@ -263,6 +265,15 @@ async def test_relationships_no_match(client: Pyneo4jClient, dev_model_instances
     assert len(multi_relationships) == 0
 
 
+async def test_is_connected(client: Pyneo4jClient, dev_model_instances):
+    john_model, sam_model, _, bob_model = dev_model_instances
+
+    assert await john_model.colleagues.is_connected(sam_model) is True
+    assert await john_model.colleagues.is_connected(sam_model, {"language": "Java"}) is True
+    assert await john_model.colleagues.is_connected(sam_model, {"language": "Go"}) is False
+    assert await john_model.colleagues.is_connected(bob_model) is False
+
+
 async def test_relationships_raw_result(client: Pyneo4jClient, dev_model_instances):
     with patch.object(client, "cypher") as mock_cypher:
         mock_start_node = Node(
@@ -348,6 +359,54 @@ async def test_find_connected_nodes_no_result(client: Pyneo4jClient, session: As
     assert len(coffees) == 0
 
 
+async def test_find_connected_nodes_with_loader(client: Pyneo4jClient, session: AsyncSession, dev_model_instances):
+    with patch.object(client, "cypher", wraps=client.cypher) as mock_cypher:
+        with client.use_loader():
+            results = await asyncio.gather(
+                *[developer.colleagues.find_connected_nodes() for developer in dev_model_instances]
+            )
+
+        assert mock_cypher.call_count == 1
+        assert "UNWIND $_loader_element_ids" in mock_cypher.call_args.kwargs["query"]
+
+    assert client._loader is None
+    assert [len(colleagues) for colleagues in results] == [2, 1, 2, 1]
+    assert all(isinstance(colleague, Developer) for colleagues in results for colleague in colleagues)
+
+
+async def test_find_connected_nodes_with_loader_groups_filters(
+    client: Pyneo4jClient, session: AsyncSession, dev_model_instances
+):
+    john_model, sam_model, *_ = dev_model_instances
+
+    with patch.object(client, "cypher", wraps=client.cypher) as mock_cypher:
+        with client.use_loader():
+            await asyncio.gather(
+                john_model.colleagues.find_connected_nodes(),
+                sam_model.colleagues.find_connected_nodes(),
+                john_model.colleagues.find_connected_nodes({"$node": {"age": {"$gt": 100}}}),
+                john_model.colleagues.find_connected_nodes(projections={"name": "name"}),
+            )
+
+        assert mock_cypher.call_count == 3
+
+
+async def test_loader_keeps_dispatch_tasks():
+    client = Pyneo4jClient()
+    loader = ConnectedNodesLoader(client)
+
+    async def cypher(query, parameters, resolve_models):
+        assert len(loader._tasks) == 1
+        return [[element_id, [element_id]] for element_id in parameters["_loader_element_ids"]], []
+
+    with patch.object(client, "cypher", side_effect=cypher):
+        results = await asyncio.gather(loader.load("query", {}, "first"), loader.load("query", {}, "second"))
+
+    assert results == [["first"], ["second"]]
+    await asyncio.sleep(0)
+    assert len(loader._tasks) == 0
+
+
 async def test_find_connected_nodes_raw_result(client: Pyneo4jClient, session: AsyncSession, dev_model_instances):
     john_model, *_ = dev_model_instances
 
@@ -440,6 +499,21 @@ async def test_find_connected_nodes_auto_fetch_models(
     assert any(len(coffee.developers.nodes) != 0 for coffee in coffees)
 
 
+async def test_find_connected_nodes_auto_fetch_models_with_filters(
+    client: Pyneo4jClient, session: AsyncSession, dev_model_instances
+):
+    alice_model = dev_model_instances[2]
+    coffees = await alice_model.coffee.find_connected_nodes(
+        auto_fetch_nodes=True,
+        auto_fetch_models=[{"model": Developer, "filters": {"$relationship": {"liked": True}, "uid": {"$neq": 3}}}],
+    )
+
+    assert len(coffees) == 3
+    assert all(isinstance(coffee, Coffee) for coffee in coffees)
+    assert sum(len(coffee.developers.nodes) for coffee in coffees) == 1
+    assert all(len(coffee.bestseller_for.nodes) == 0 for coffee in coffees)
+
+
 async def test_ensure_cardinality(client: Pyneo4jClient, coffee_shop_model_instances, coffee_model_instances):
     espresso_model = coffee_model_instances[2]
     rating_five_model, *_ = coffee_shop_model_instances
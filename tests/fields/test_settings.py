@@ -35,6 +35,7 @@ def test_base_model_settings():
 
     assert not settings.pre_hooks
     assert not settings.post_hooks
+    assert settings.version_field is None
 
 
 def test_node_model_settings():
@@ -42,6 +43,8 @@ def test_node_model_settings():
 
     assert settings.labels == set()
     assert settings.auto_fetch_nodes is None
+    assert settings.query_cache_size is None
+    assert settings.query_cache_ttl is None
     assert not settings.pre_hooks
     assert not settings.post_hooks
 
@@ -177,3 +180,18 @@ def test_node_model_label_inheritance():
     assert getattr(NotInherited, "_settings", None) is not None
     assert isinstance(getattr(NotInherited, "_settings", None), NodeModelSettings)
     assert NotInherited._settings.labels == {"A", "B"}
+
+
+def test_node_model_query_cache_settings():
+    class A(NodeModel):
+        class Settings:
+            query_cache_size = 10
+            query_cache_ttl = 30
+
+    class B(NodeModel):
+        pass
+
+    assert A._query_cache is not None
+    assert A._query_cache.max_size == 10
+    assert A._query_cache.ttl == 30
+    assert B._query_cache is None
@@ -31,6 +31,16 @@ def test_build_param_var(operators_builder: Operators):
     assert operators_builder.build_param_var() == "_n_2"
 
 
+def test_build_param_var_with_prefix(operators_builder: Operators):
+    operators_builder.reset_state(parameter_prefix="_friends")
+
+    assert operators_builder.build_param_var() == "_friends_n_0"
+    assert operators_builder.build_param_var() == "_friends_n_1"
+
+    operators_builder.reset_state()
+    assert operators_builder.build_param_var() == "_n_0"
+
+
 def test_normalize_expressions(operators_builder: Operators):
     # Test if key-value pairs without operators are converted to $eq
     expression = {"name": "John"}
@@ -5,6 +5,7 @@ import pytest
 from pydantic import ValidationError
 
 from pyneo4j_ogm.exceptions import InvalidRelationshipDirection, InvalidRelationshipHops
+from pyneo4j_ogm.fields.relationship_property import RelationshipPropertyDirection
 from pyneo4j_ogm.queries.query_builder import QueryBuilder
 from pyneo4j_ogm.queries.types import QueryOptionsOrder, RelationshipMatchDirection
 from tests.fixtures.query_builder import query_builder
@@ -118,6 +119,56 @@ def test_build_projections_with_special_keys(query_builder: QueryBuilder):
     assert_string_equality(query_builder.query["projections"], expected_result)
 
 
+def test_build_projections_with_nested_projections(query_builder: QueryBuilder):
+    def resolve_developer(relationship_property: str):
+        return ("LIKES", RelationshipPropertyDirection.INCOMING, ["Developer"], resolve_developer)
+
+    def resolve_coffee(relationship_property: str):
+        return ("LIKES", RelationshipPropertyDirection.OUTGOING, ["Coffee"], resolve_developer)
+
+    projections = {
+        "name": "name",
+        "coffee": {
+            "$relationship": "coffee",
+            "fields": {"flavor": "flavor", "drinkers": {"$relationship": "drinkers", "fields": {"name": "name"}}},
+            "limit": 5,
+        },
+    }
+    expected_result = (
+        "WITH DISTINCT n RETURN DISTINCT collect({name: n.name, coffee: [(n)-[:LIKES]->(n_coffee:Coffee) | "
+        "{flavor: n_coffee.flavor, drinkers: [(n_coffee)<-[:LIKES]-(n_coffee_drinkers:Developer) | "
+        "{name: n_coffee_drinkers.name}]}][..5]})"
+    )
+
+    query_builder.build_projections(projections=projections, relationship_resolver=resolve_coffee)
+    assert_string_equality(query_builder.query["projections"], expected_result)
+
+
+def test_build_projections_escapes_identifiers(query_builder: QueryBuilder):
+    def resolve_coffee(relationship_property: str):
+        return ("LIKES", RelationshipPropertyDirection.OUTGOING, ["Coffee"], resolve_coffee)
+
+    projections = {
+        "first name": "first`name",
+        "my coffee": {"$relationship": "coffee", "fields": {"id": "$elementId", "flavor": "flavor"}},
+    }
+    expected_result = (
+        "WITH DISTINCT n RETURN DISTINCT collect({`first name`: n.`first``name`, `my coffee`: "
+        "[(n)-[:LIKES]->(`n_my coffee`:Coffee) | {id: elementId(`n_my coffee`), flavor: `n_my coffee`.flavor}]})"
+    )
+
+    query_builder.build_projections(projections=projections, relationship_resolver=resolve_coffee)
+    assert_string_equality(query_builder.query["projections"], expected_result)
+
+
+def test_build_projections_ignores_nested_projections_without_resolver(query_builder: QueryBuilder):
+    projections = {"name": "name", "coffee": {"$relationship": "coffee", "fields": {"flavor": "flavor"}}}
+    expected_result = "WITH DISTINCT n RETURN DISTINCT collect({name: n.name})"
+
+    query_builder.build_projections(projections=projections)
+    assert_string_equality(query_builder.query["projections"], expected_result)
+
+
 def test_query_options_with_empty_options(query_builder: QueryBuilder):
     query_builder.query_options(options={})
     assert query_builder.query["options"] == ""
@@ -279,6 +330,20 @@ def test_relationship_property_all_filters_refs(query_builder: QueryBuilder):
     assert query_builder.parameters == {"_n_0": "Jenny", "_n_1": "Johnny"}
 
 
+def test_relationship_property_filters_parameter_prefix(query_builder: QueryBuilder):
+    query_builder.relationship_property_filters(
+        {"$relationship": {"name": {"$eq": "Jenny"}}, "name": {"$eq": "Johnny"}}, parameter_prefix="_friends"
+    )
+
+    assert query_builder.query["where"] == "r.name = $_friends_n_0 AND end.name = $_friends_n_1"
+    assert query_builder.parameters == {"_friends_n_0": "Jenny", "_friends_n_1": "Johnny"}
+
+    query_builder.relationship_property_filters({"name": {"$eq": "Jenny"}})
+
+    assert query_builder.query["where"] == "end.name = $_n_0"
+    assert query_builder.parameters == {"_n_0": "Jenny"}
+
+
 def test_invalid_multi_hop_filters(query_builder: QueryBuilder):
     with pytest.raises(ValidationError):
         query_builder.multi_hop_filters({})  # type: ignore